@@ -0,0 +1,125 @@
+"""
+Benchmark comment thread parsing on a synthetic Algolia item response.
+
+Compares the recursive build-everything approach CommentService used to
+take with the buffered (``add_thread``) and streamed (ijson events) paths
+of CommentTreeBuilder, reporting time and peak traced memory.
+
+Usage:
+    python benchmarks/bench_comment_parse.py [--threads 300] [--max-depth 2]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dateutil.parser import isoparse  # noqa: E402
+
+from hn_daily.models import Comment  # noqa: E402
+from hn_daily.services.comment_service import CommentTreeBuilder  # noqa: E402
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def make_item(threads: int, seed: int = 1) -> bytes:
+    """Build an Algolia item with bushy top-level threads up to 8 levels deep."""
+    rng = random.Random(seed)
+    next_id = 100
+
+    def node(depth: int) -> dict:
+        nonlocal next_id
+        next_id += 1
+        comment_id = next_id
+        fanout = rng.randint(0, 4 if depth < 3 else 1) if depth < 8 else 0
+        return {
+            "id": comment_id,
+            "author": f"user{comment_id % 300}",
+            "text": "<p>" + "lorem ipsum " * 30,
+            "created_at": "2025-01-01T00:00:00.000Z",
+            "parent_id": 1,
+            "points": None,
+            "options": [],
+            "children": [node(depth + 1) for _ in range(fanout)],
+        }
+
+    return json.dumps({"id": 1, "children": [node(0) for _ in range(threads)]}).encode()
+
+
+def legacy(body: bytes, max_depth: int) -> list[Comment]:
+    """Decode everything and build every comment up to max_depth, then sort."""
+    def parse(data: dict, depth: int) -> Comment:
+        children = [parse(child, depth + 1) for child in data.get("children", [])] if depth < max_depth else []
+        return Comment(
+            comment_id=data.get("id", 0),
+            author=data.get("author", "unknown"),
+            text=data.get("text", ""),
+            created_at=isoparse(data["created_at"]),
+            parent_id=data.get("parent_id", 0),
+            children=children,
+        )
+
+    def descendants(comment: Comment) -> int:
+        return len(comment.children) + sum(descendants(child) for child in comment.children)
+
+    comments = [parse(item, 0) for item in json.loads(body)["children"]]
+    comments.sort(key=descendants, reverse=True)
+    return comments[:2]
+
+
+def buffered(body: bytes, max_depth: int) -> list[Comment]:
+    builder = CommentTreeBuilder(max_depth=max_depth)
+    for item in json.loads(body)["children"]:
+        builder.add_thread(item)
+    return builder.result()
+
+
+def streamed(body: bytes, max_depth: int) -> list[Comment]:
+    import ijson
+
+    builder = CommentTreeBuilder(max_depth=max_depth)
+    events = ijson.sendable_list()
+    parser = ijson.basic_parse_coro(events)
+    for offset in range(0, len(body), CHUNK_SIZE):
+        parser.send(body[offset:offset + CHUNK_SIZE])
+        for event, value in events:
+            builder.feed(event, value)
+        del events[:]
+    parser.close()
+    return builder.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark comment thread parsing")
+    parser.add_argument("--threads", type=int, default=300)
+    parser.add_argument("--max-depth", type=int, default=2)
+    args = parser.parse_args()
+
+    body = make_item(args.threads)
+    print(f"response: {len(body) / 1e6:.1f} MB, {args.threads} top-level threads")
+
+    runs = [("legacy", legacy), ("buffered", buffered)]
+    try:
+        import ijson  # noqa: F401
+        runs.append(("streamed", streamed))
+    except ImportError:
+        print("ijson is not installed; skipping the streamed run")
+
+    for name, func in runs:
+        tracemalloc.start()
+        started = time.perf_counter()
+        comments = func(body, args.max_depth)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:<9} {elapsed * 1000:8.1f}ms  peak {peak / 1e6:6.1f} MB  top {[c.comment_id for c in comments]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark the site-specific extractors against the generic crawl tiers.
+
+For each URL, fetches the page with its extractor, with Jina Reader and
+with a plain direct fetch, reporting wall-clock time and markdown size.
+Needs network access; the browser tier is left out since it would dwarf
+the others.
+
+Usage:
+    python benchmarks/bench_extractors.py [--rounds 3] [URL ...]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hn_daily.services.crawler_service import CrawlerService  # noqa: E402
+
+
+DEFAULT_URLS = [
+    "https://github.com/astral-sh/uv",
+    "https://github.com/python/cpython/issues/100000",
+    "https://github.com/python/cpython/blob/main/README.rst",
+    "https://arxiv.org/abs/1706.03762",
+    "https://arxiv.org/pdf/2005.14165",
+    "https://www.rfc-editor.org/rfc/rfc9110.txt",
+]
+
+
+async def measure(fetch, url: str, rounds: int) -> tuple[float, int, bool]:
+    """Best time of ``rounds`` fetches, with the markdown size and outcome of the last one."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = await fetch(url, "")
+        best = min(best, time.perf_counter() - started)
+    return best, len(result.markdown_content), result.success
+
+
+async def run(urls: list[str], rounds: int):
+    service = CrawlerService()
+    tiers = [
+        ("extractor", service._fetch_with_extractor),
+        ("jina", service._fetch_with_jina_reader),
+        ("direct", service._fallback_fetch),
+    ]
+    try:
+        print(f"{'url':<55} {'tier':<10} {'best':>9} {'markdown':>10}")
+        for url in urls:
+            if service.extractors.find(url) is None:
+                print(f"{url:<55} no extractor matches; skipped")
+                continue
+            for name, fetch in tiers:
+                elapsed, size, success = await measure(fetch, url, rounds)
+                outcome = f"{size:>9}B" if success else "    failed"
+                print(f"{url[:55]:<55} {name:<10} {elapsed * 1000:7.0f}ms {outcome}")
+    finally:
+        await service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark site-specific extractors against the generic tiers")
+    parser.add_argument("urls", nargs="*", default=DEFAULT_URLS)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.urls, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark the Jina front-page markdown parser on synthetic input.
+
+Compares the block tokenizer in HNFrontMarkdownParser with the single
+regex it replaced, on well-formed pages of growing size and on drifted
+pages where every entry lacks its points/comments subtext.
+
+Usage:
+    python benchmarks/bench_front_parser.py [--sizes 1000 10000 50000]
+"""
+
+import argparse
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hn_daily.services.story_service import HNFrontMarkdownParser  # noqa: E402
+from hn_daily.timezone import APP_TIMEZONE  # noqa: E402
+
+
+LEGACY_STORY_RE = re.compile(
+    r"(?P<rank>\d+)\.\[\]"
+    r"\(https://news\.ycombinator\.com/vote\?id=(?P<story_id>\d+)[^)]*\)"
+    r"\[(?P<title>.*?)\]\((?P<url>.*?)\)"
+    r"(?: \(\[[^\]]+\]\([^)]+\)\))? "
+    r"(?P<points>\d+) points by "
+    r"\[(?P<author>[^\]]+)\]\(https://news\.ycombinator\.com/user\?id=[^)]*\)"
+    r"\[[^\]]+\]\(https://news\.ycombinator\.com/item\?id=(?P=story_id)\)"
+    r" \| \[(?P<comments>\d+ comments|discuss)\]"
+    r"\(https://news\.ycombinator\.com/item\?id=(?P=story_id)\)",
+    re.DOTALL,
+)
+
+
+def make_markdown(count: int, drifted: bool = False) -> str:
+    """Build Jina Reader markdown for ``count`` ranked stories."""
+    lines = []
+    for rank in range(1, count + 1):
+        story_id = 40_000_000 + rank
+        line = (
+            f"{rank}.[](https://news.ycombinator.com/vote?id={story_id}&how=up&goto=front)"
+            f"[Story number {rank}](https://example.com/articles/{rank}) "
+            f"([example.com](https://news.ycombinator.com/from?site=example.com))"
+        )
+        if not drifted:
+            line += (
+                f" {rank % 500} points by [user{rank}](https://news.ycombinator.com/user?id=user{rank})"
+                f"[3 hours ago](https://news.ycombinator.com/item?id={story_id}) | "
+                f"[{rank % 90} comments](https://news.ycombinator.com/item?id={story_id})"
+            )
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def time_call(func, *args) -> tuple[float, int]:
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the front-page markdown parser")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=40,
+        help="Skip the legacy regex on drifted inputs above this size (its backtracking grows cubically there)",
+    )
+    args = parser.parse_args()
+
+    tokenizer = HNFrontMarkdownParser(datetime(2026, 1, 1, tzinfo=APP_TIMEZONE))
+
+    print(f"{'input':<10} {'stories':>8} {'tokenizer':>12} {'legacy regex':>14} {'parsed':>8}")
+    for drifted in (False, True):
+        for size in args.sizes:
+            markdown = make_markdown(size, drifted)
+            elapsed, parsed = time_call(tokenizer.parse, markdown)
+            if drifted and size > args.legacy_limit:
+                legacy = "skipped"
+            else:
+                legacy_elapsed, _ = time_call(lambda text: list(LEGACY_STORY_RE.finditer(text)), markdown)
+                legacy = f"{legacy_elapsed * 1000:.1f}ms"
+            label = "drifted" if drifted else "clean"
+            print(f"{label:<10} {size:>8} {elapsed * 1000:>10.1f}ms {legacy:>14} {parsed:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark the memory footprint and cache encoding of the data models.
+
+Builds the same comment forest with plain dataclasses (one ``__dict__`` and
+one children list per comment, an author string per comment, as the models
+used to be) and with the slotted models, reporting traced bytes per
+comment. Also times the keyed-dict encoding the comment cache used to write
+against ``Comment.to_row``/``from_row``.
+
+Usage:
+    python benchmarks/bench_models.py [--comments 50000] [--authors 500]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hn_daily.models import EMPTY_CHILDREN, Comment  # noqa: E402
+
+
+@dataclass
+class LegacyComment:
+    comment_id: int
+    author: str
+    text: str
+    created_at: datetime
+    parent_id: int
+    children: list["LegacyComment"] = field(default_factory=list)
+
+
+CREATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+TEXT = "<p>" + "lorem ipsum " * 20
+
+
+def build_legacy(count: int, authors: int) -> list[LegacyComment]:
+    """Roots with five leaf replies each, authors decoded as fresh strings."""
+    roots = []
+    for root_id in range(0, count, 6):
+        root = LegacyComment(root_id, f"user{root_id % authors}", TEXT, CREATED_AT, 1)
+        for reply_id in range(root_id + 1, min(root_id + 6, count)):
+            root.children.append(LegacyComment(reply_id, f"user{reply_id % authors}", TEXT, CREATED_AT, root_id))
+        roots.append(root)
+    return roots
+
+
+def build_slotted(count: int, authors: int) -> list[Comment]:
+    """The same forest with slotted models, interned authors and shared empty children."""
+    roots = []
+    for root_id in range(0, count, 6):
+        replies = tuple(
+            Comment(reply_id, sys.intern(f"user{reply_id % authors}"), TEXT, CREATED_AT, root_id, EMPTY_CHILDREN)
+            for reply_id in range(root_id + 1, min(root_id + 6, count))
+        )
+        roots.append(Comment(root_id, sys.intern(f"user{root_id % authors}"), TEXT, CREATED_AT, 1, replies))
+    return roots
+
+
+def encode_dict(comment: Comment) -> dict:
+    return {
+        "id": comment.comment_id,
+        "author": comment.author,
+        "text": comment.text,
+        "created_at": comment.created_at.isoformat(),
+        "parent_id": comment.parent_id,
+        "children": [encode_dict(child) for child in comment.children],
+    }
+
+
+def decode_dict(data: dict) -> Comment:
+    return Comment(
+        comment_id=data["id"],
+        author=data["author"],
+        text=data["text"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        parent_id=data["parent_id"],
+        children=tuple(decode_dict(child) for child in data.get("children", [])),
+    )
+
+
+def measure(build, count: int, authors: int) -> float:
+    """Traced bytes per comment, excluding the shared text and timestamp."""
+    tracemalloc.start()
+    forest = build(count, authors)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del forest
+    return size / count
+
+
+def time_codec(comments: list[Comment], encode, decode) -> tuple[float, float, int]:
+    started = time.perf_counter()
+    payload = json.dumps([encode(c) for c in comments], separators=(",", ":")).encode()
+    encoded = time.perf_counter()
+    [decode(row) for row in json.loads(payload)]
+    decoded = time.perf_counter()
+    return encoded - started, decoded - encoded, len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark model memory and cache encoding")
+    parser.add_argument("--comments", type=int, default=50_000)
+    parser.add_argument("--authors", type=int, default=500)
+    args = parser.parse_args()
+
+    legacy = measure(build_legacy, args.comments, args.authors)
+    slotted = measure(build_slotted, args.comments, args.authors)
+    print(f"{args.comments} comments, {args.authors} distinct authors")
+    print(f"plain dataclass  {legacy:7.1f} bytes/comment")
+    print(f"slotted          {slotted:7.1f} bytes/comment  ({1 - slotted / legacy:.0%} less)")
+
+    comments = build_slotted(args.comments, args.authors)
+    for name, encode, decode in (
+        ("dict entries", encode_dict, decode_dict),
+        ("positional rows", Comment.to_row, Comment.from_row),
+    ):
+        encode_s, decode_s, size = time_codec(comments, encode, decode)
+        print(f"{name:<16} encode {encode_s * 1000:7.1f}ms  decode {decode_s * 1000:7.1f}ms  {size / 1e6:5.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,30 +2,50 @@
 
 import argparse
 import asyncio
+import logging
 import sys
-from datetime import datetime
-
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
+import time
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Optional
 
 from .services import (
     StoryService,
     CommentService,
     CrawlerService,
+    ContentRouter,
     StorageService,
-    HistoryService
+    HistoryService,
+    HttpClient,
+    ApiError,
+    ContentCache,
+    CommentCache,
+    DomainStats,
+    STORY_SOURCES,
 )
+from .models import Story
+from .pipeline import StoryPipeline, StoryJob
+from .reporting import EVENT_MODES, Reporter, create_reporter
 from .timezone import APP_TIMEZONE
 
 
-console = Console()
+DEFAULT_CACHE_DIR = ".cache/hn-daily"
+DEFAULT_STORY_BUDGET = 90.0
+DEFAULT_LIMIT = 15
+DEFAULT_PAGES = 3
+DEFAULT_MAX_PAGE_MB = 2.0
+DEFAULT_PDF_PAGES = 30
 
 
 def check_python_version():
     """Ensure Python version is 3.10+."""
     if sys.version_info < (3, 10):
-        console.print(f"[red]Error: Python 3.10+ required. Current version: {sys.version_info.major}.{sys.version_info.minor}[/red]")
+        print(
+            f"Error: Python 3.10+ required. Current version: {sys.version_info.major}.{sys.version_info.minor}",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
 
@@ -34,128 +54,389 @@ def parse_date(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=APP_TIMEZONE)
 
 
+def parse_host_value(value: str) -> tuple[str, float]:
+    """Parse a HOST=NUMBER command-line value."""
+    host, sep, number = value.partition("=")
+    try:
+        if not sep or not host.strip():
+            raise ValueError(value)
+        return host.strip().lower(), float(number)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected HOST=NUMBER, got {value!r}")
+
+
+def expand_date_range(start: str, end: str) -> list[str]:
+    """List every date from start to end inclusive in YYYY-MM-DD format."""
+    first = parse_date(start)
+    last = parse_date(end)
+    if last < first:
+        raise ValueError(f"--to date {end} is before --from date {start}")
+    return [
+        (first + timedelta(days=offset)).strftime("%Y-%m-%d")
+        for offset in range((last - first).days + 1)
+    ]
+
+
+@dataclass
+class DigestOptions:
+    """Tuning options shared by single-day and backfill runs."""
+    concurrency: int = 4
+    browser_pages: int = 4
+    use_cache: bool = True
+    refresh_cache: bool = False
+    cache_dir: str = DEFAULT_CACHE_DIR
+    day_concurrency: int = 2
+    warm_browser: bool = True
+    deadline: Optional[float] = None
+    story_budget: Optional[float] = None
+    target: Optional[int] = None
+    pages: int = DEFAULT_PAGES
+    source: str = "archive"
+    stream: bool = False
+    host_connections: dict[str, int] = field(default_factory=dict)
+    host_rpm: dict[str, float] = field(default_factory=dict)
+    hedge_delay: Optional[float] = None
+    max_page_bytes: int = int(DEFAULT_MAX_PAGE_MB * 1024 * 1024)
+    pdf_pages: int = DEFAULT_PDF_PAGES
+
+
+@dataclass
+class DayRun:
+    """One target day of a run and where its drafts go."""
+    date: Optional[datetime]
+    output_dir: str
+    # Stories fetched up front; when candidates are streamed, only the first
+    # one, with the rest following from more_stories as the pipeline asks
+    stories: list[Story] = field(default_factory=list)
+    more_stories: Optional[AsyncIterator[Story]] = None
+    skipped_count: int = 0
+    jobs: list[StoryJob] = field(default_factory=list)
+    error: Optional[str] = None
+    fetch_elapsed: float = 0.0
+    # What the next day of a backfill deduplicates against: the stories this
+    # day saved, complete once it has finished
+    candidate_keys: set[str] = field(default_factory=set)
+    candidates_known: asyncio.Event = field(default_factory=asyncio.Event)
+    saved_keys: set[str] = field(default_factory=set)
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def label(self) -> str:
+        return self.date.strftime("%Y-%m-%d") if self.date else "yesterday"
+
+
 async def run_daily_digest(
     date: str | None = None,
-    limit: int = 15,
-    output_dir: str = "drafts"
+    limit: int | None = DEFAULT_LIMIT,
+    output_dir: str = "drafts",
+    options: DigestOptions | None = None,
+    reporter: Reporter | None = None,
 ):
     """
     Run the full daily digest workflow.
 
     Args:
         date: Date in YYYY-MM-DD format (defaults to yesterday in UTC+8)
-        limit: Number of stories to fetch
+        limit: Number of candidate stories to consider, or None for all
         output_dir: Output directory for markdown files
+        options: Concurrency and cache tuning
+        reporter: Progress reporter (defaults to rich progress bars)
+    """
+    check_python_version()
+
+    day = DayRun(date=parse_date(date) if date else None, output_dir=output_dir)
+    await _run_days([day], limit, options or DigestOptions(), True, reporter or create_reporter("rich"))
+
+
+async def run_backfill(
+    dates: list[str],
+    limit: int | None = DEFAULT_LIMIT,
+    output_dir: str = "drafts",
+    options: DigestOptions | None = None,
+    reporter: Reporter | None = None,
+):
+    """
+    Run the digest for many days in one process.
+
+    Clients, caches and the browser are shared by all days, front archive
+    pages are fetched concurrently, and each day's drafts are written to
+    ``output_dir/YYYY-MM-DD``. Each day skips the stories the previous day
+    in the range saved, like consecutive daily runs would; ``history.json``
+    is left untouched.
+
+    Args:
+        dates: Dates in YYYY-MM-DD format
+        limit: Number of candidate stories to consider per day, or None for all
+        output_dir: Base output directory for per-day draft directories
+        options: Concurrency and cache tuning
+        reporter: Progress reporter (defaults to rich progress bars)
     """
     check_python_version()
 
-    target_date = parse_date(date) if date else None
+    days = [
+        DayRun(date=parse_date(date), output_dir=str(Path(output_dir) / date))
+        for date in sorted(set(dates))
+    ]
+    await _run_days(days, limit, options or DigestOptions(), False, reporter or create_reporter("rich", show_day=True))
+
 
-    story_service = StoryService()
-    comment_service = CommentService()
-    crawler_service = CrawlerService()
-    storage_service = StorageService(output_dir)
+async def _run_days(
+    days: list[DayRun],
+    limit: int | None,
+    options: DigestOptions,
+    use_history: bool,
+    reporter: Reporter,
+):
+    """
+    Fetch, deduplicate and process stories for each day with shared services.
+
+    Errors are reported through ``reporter.stop`` before being re-raised.
+    """
+    reporter.start()
+    try:
+        await _run_days_with_services(days, limit, options, use_history, reporter)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        reporter.stop("cancelled", "Operation cancelled by user")
+        raise
+    except Exception as e:
+        reporter.stop("failed", f"Error: {e}")
+        raise
+    reporter.stop()
+
+
+async def _run_days_with_services(
+    days: list[DayRun],
+    limit: int | None,
+    options: DigestOptions,
+    use_history: bool,
+    reporter: Reporter,
+):
+    """Body of ``_run_days``: build the services, run every day and close them again."""
+    _configure_logging(reporter)
+
+    http = HttpClient(
+        host_connections=options.host_connections,
+        host_rates={host: rpm / 60 for host, rpm in options.host_rpm.items()},
+    )
+    story_service = StoryService(http=http, max_pages=options.pages, source=options.source)
+    comment_service = CommentService(
+        http=http,
+        cache=CommentCache(f"{options.cache_dir}/comments") if options.use_cache else None,
+        refresh_cache=options.refresh_cache,
+    )
+    crawler_service = CrawlerService(
+        max_browser_pages=options.browser_pages,
+        http=http,
+        cache=ContentCache(f"{options.cache_dir}/content") if options.use_cache else None,
+        refresh_cache=options.refresh_cache,
+        story_budget=options.story_budget,
+        domain_stats=DomainStats(f"{options.cache_dir}/domains.json") if options.use_cache else None,
+        hedge_delay=options.hedge_delay,
+        content_router=ContentRouter(max_text_bytes=options.max_page_bytes, max_pdf_pages=options.pdf_pages),
+    )
     history_service = HistoryService()
+    history_keys = set(history_service.seen_urls) if use_history else set()
+    deadline = (
+        asyncio.get_running_loop().time() + options.deadline
+        if options.deadline is not None
+        else None
+    )
+
+    # Warm up the browser while the story lists are downloading
+    browser_warmup = asyncio.create_task(
+        crawler_service.start() if options.warm_browser else asyncio.sleep(0)
+    )
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-            # Fetch stories
-            task = progress.add_task("Fetching stories from Hacker News...")
-            all_stories = await story_service.get_top_stories_from_yesterday(limit, target_date)
-
-            # Deduplicate stories
-            stories = [
-                story
-                for story in all_stories
-                if not history_service.is_seen(
-                    history_service.build_story_key(story.url, story.story_id)
-                )
-            ]
-            skipped_count = len(all_stories) - len(stories)
-
-            progress.update(task, completed=100, description=f"Found {len(all_stories)} stories ({skipped_count} skipped)")
-
-            if not stories:
-                console.print("[yellow]No new stories found for the specified date.[/yellow]")
-                return
-
-            # Process each story
-            results = []
-            successfully_processed_keys = []
-            for i, story in enumerate(stories, 1):
-                progress.console.print(f"\n[cyan]Processing {i}/{len(stories)}: {story.title[:50]}...[/cyan]")
-
-                # Fetch comments
-                task = progress.add_task(f"Fetching comments for story {i}...")
-                comments = await comment_service.get_comments_for_story(story)
-                progress.update(task, completed=100, description=f"Found {len(comments)} comments")
-
-                # Crawl content
-                task = progress.add_task(f"Crawling content...")
-                crawl_result = await crawler_service.crawl_story(story)
-                progress.update(
-                    task,
-                    completed=100,
-                    description=(
-                        "Crawl complete (fallback)"
-                        if crawl_result.is_fallback
-                        else "Crawl complete"
-                        if crawl_result.success
-                        else "Crawl failed"
-                    )
+        # Fetch stories for every day at once
+        reporter.fetching_stories(len(days))
+
+        async def fetch_day(day: DayRun):
+            started = time.perf_counter()
+
+            # Filter history inside the service so it can read more pages to make up for it
+            def in_history(story: Story) -> bool:
+                if history_service.build_story_key(story.url, story.story_id) in history_keys:
+                    day.skipped_count += 1
+                    return True
+                return False
+
+            try:
+                if limit is None:
+                    # Wait for the first candidate only; the rest stream in as the pipeline takes them
+                    if options.stream:
+                        candidates = story_service.iter_stories_streaming(day.date, in_history)
+                    else:
+                        candidates = story_service.iter_ranked_candidates(day.date, in_history)
+                    first = await anext(candidates, None)
+                    if first is not None:
+                        day.stories = [first]
+                        day.more_stories = candidates
+                else:
+                    day.stories = await story_service.get_top_stories_from_yesterday(limit, day.date, in_history)
+            except ApiError as e:
+                # A single day's failure aborts a daily run but not a backfill
+                if len(days) == 1:
+                    raise
+                day.error = str(e)
+            day.fetch_elapsed = time.perf_counter() - started
+            day.candidate_keys = {history_service.build_story_key(story.url, story.story_id) for story in day.stories}
+            if day.more_stories is None:
+                day.candidates_known.set()
+
+        fetches = asyncio.gather(*(fetch_day(day) for day in days))
+        if deadline is None:
+            await fetches
+        else:
+            try:
+                await asyncio.wait_for(fetches, max(0.0, deadline - asyncio.get_running_loop().time()))
+            except asyncio.TimeoutError:
+                raise ApiError(f"Run deadline of {options.deadline:g}s reached while fetching stories")
+
+        for day in days:
+            if day.error:
+                reporter.day_failed(day.label, day.error)
+            elif day.more_stories is not None:
+                reporter.day_fetched(day.label, None, None, day.fetch_elapsed)
+            else:
+                reporter.day_fetched(
+                    day.label, len(day.stories) + day.skipped_count, len(day.stories), day.fetch_elapsed
                 )
 
-                # Save to file
-                task = progress.add_task(f"Saving to markdown...")
-                try:
-                    filepath = storage_service.save_content(story, crawl_result, comments)
-                    if filepath:
-                        results.append((story, filepath, crawl_result.success or crawl_result.is_fallback))
-                        successfully_processed_keys.append(
-                            history_service.build_story_key(story.url, story.story_id)
+        # Process days through the staged pipeline
+        day_slots = asyncio.Semaphore(max(1, options.day_concurrency))
+
+        async def process_day(day: DayRun, previous: Optional[DayRun]):
+            try:
+                if day.error:
+                    return
+                if not day.stories:
+                    reporter.message(f"No new stories found for {day.label}.", "warning")
+                    return
+                async with day_slots:
+                    candidates = _day_candidates(day, history_service)
+                    async with aclosing(_skip_saved_by(previous, day, candidates, history_service)) as stories:
+                        day.jobs = await _process_day(
+                            day, stories, comment_service, crawler_service, options, reporter, deadline
                         )
-                        progress.update(task, completed=100, description=f"Saved: {filepath.name}")
-                    else:
-                        results.append((story, None, False))
-                        progress.update(task, completed=100, description=f"Skipped (crawl failed)")
-                except Exception as e:
-                    results.append((story, None, False))
-                    progress.update(task, completed=100, description=f"Save failed: {e}")
-
-        # Print summary
-        _print_summary(results)
+                day.saved_keys = {
+                    history_service.build_story_key(job.story.url, job.story.story_id)
+                    for job in day.jobs
+                    if job.filepath
+                }
+            finally:
+                if day.more_stories is not None:
+                    await day.more_stories.aclose()
+                day.finished.set()
+
+        await asyncio.gather(*(
+            process_day(day, days[index - 1] if index else None)
+            for index, day in enumerate(days)
+        ))
 
         # Save history
-        if successfully_processed_keys:
-            history_service.save_history(successfully_processed_keys)
+        if use_history:
+            successfully_processed_keys = [
+                history_service.build_story_key(job.story.url, job.story.story_id)
+                for job in days[-1].jobs
+                if job.filepath
+            ]
+            if successfully_processed_keys:
+                history_service.save_history(successfully_processed_keys)
 
     finally:
         await story_service.close()
         await comment_service.close()
+        await _stop_browser(crawler_service, browser_warmup)
+        await http.close()
+
+
+async def _day_candidates(day: DayRun, history_service: HistoryService) -> AsyncIterator[Story]:
+    """
+    Yield a day's stories fetched up front, then the ones still streaming in.
 
+    Streamed candidates are added to ``candidate_keys`` as they arrive, which
+    is complete only once the stream is exhausted.
+    """
+    for story in day.stories:
+        yield story
+    if day.more_stories is None:
+        return
+    async for story in day.more_stories:
+        day.candidate_keys.add(history_service.build_story_key(story.url, story.story_id))
+        yield story
+    day.candidates_known.set()
+
+
+async def _skip_saved_by(
+    previous: Optional[DayRun],
+    day: DayRun,
+    stories: AsyncIterator[Story],
+    history_service: HistoryService,
+) -> AsyncIterator[Story]:
+    """
+    Yield a day's stories, skipping those the previous day of a backfill saved.
+
+    A story the previous day may still take is held back until that day has
+    finished, so only stories it actually saved are skipped. While the
+    previous day's candidates are still streaming, that is every story.
+    """
+    async with aclosing(stories):
+        async for story in stories:
+            if previous is not None:
+                key = history_service.build_story_key(story.url, story.story_id)
+                if not previous.finished.is_set() and (
+                    key in previous.candidate_keys or not previous.candidates_known.is_set()
+                ):
+                    await previous.finished.wait()
+                if key in previous.saved_keys:
+                    day.skipped_count += 1
+                    continue
+            yield story
+
+
+async def _process_day(
+    day: DayRun,
+    stories: AsyncIterator[Story],
+    comment_service: CommentService,
+    crawler_service: CrawlerService,
+    options: DigestOptions,
+    reporter: Reporter,
+    deadline: Optional[float],
+) -> list[StoryJob]:
+    """Run one day's stories through the pipeline and report progress."""
+    pipeline = StoryPipeline(
+        comment_service,
+        crawler_service,
+        StorageService(day.output_dir),
+        comment_concurrency=options.concurrency,
+        crawl_concurrency=options.concurrency,
+        on_job_started=lambda job: reporter.story_selected(day.label, job),
+        on_job_done=lambda job: reporter.job_done(day.label, job),
+        on_stage_done=lambda job, stage, elapsed: reporter.stage_done(day.label, job, stage, elapsed),
+    )
+    reporter.day_started(day.label, len(day.stories) if day.more_stories is None else None)
+    jobs = await pipeline.run(stories, deadline, options.target)
+    reporter.day_done(day.label, jobs)
+    return jobs
 
-def _print_summary(results: list):
-    """Print a summary table of processed stories."""
-    table = Table(title="Daily Digest Summary")
-    table.add_column("Status", justify="center", style="green" if all(r[2] for r in results) else "yellow")
-    table.add_column("Story", overflow="fold", max_width=50)
-    table.add_column("File")
 
-    success_count = sum(1 for r in results if r[2])
+async def _stop_browser(crawler_service: CrawlerService, warmup: asyncio.Task):
+    """Wait for the browser warm-up to settle, then shut the browser down."""
+    try:
+        await warmup
+    except (asyncio.CancelledError, Exception):
+        # A failed warm-up is retried lazily by the first browser crawl
+        pass
+    await crawler_service.close()
 
-    for story, filepath, success in results:
-        status = "[green]OK[/green]" if success else "[red]FAIL[/red]"
-        filename = filepath.name if filepath else "N/A"
-        table.add_row(status, story.title[:50] + "..." if len(story.title) > 50 else story.title, filename)
 
-    console.print(table)
-    console.print(f"\nProcessed: {len(results)} | Success: {success_count} | Failed: {len(results) - success_count}")
+def _configure_logging(reporter: Reporter):
+    """Route service log lines through the active reporter."""
+    logger = logging.getLogger("hn_daily")
+    logger.handlers = [reporter.log_handler()]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
 
 def main():
@@ -168,27 +449,209 @@ def main():
         type=str,
         help="Date in YYYY-MM-DD format (defaults to yesterday in UTC+8)"
     )
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=str,
+        help="First date of a backfill range in YYYY-MM-DD format"
+    )
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=str,
+        help="Last date of a backfill range in YYYY-MM-DD format (defaults to --from)"
+    )
+    parser.add_argument(
+        "--dates",
+        type=str,
+        help="Comma-separated list of dates to backfill in YYYY-MM-DD format"
+    )
     parser.add_argument(
         "--limit",
         type=int,
-        default=15,
-        help="Number of stories to fetch (default: 15)"
+        help=f"Number of candidate stories to consider (default: {DEFAULT_LIMIT}; with --target, every story on the archive)"
+    )
+    parser.add_argument(
+        "--target",
+        type=int,
+        help="Stop once this many drafts are saved, working down the ranked candidates"
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=DEFAULT_PAGES,
+        help=f"Maximum front archive pages to read per day; extra pages are fetched only when needed "
+             f"to fill --limit after skipping already-processed stories (default: {DEFAULT_PAGES})"
+    )
+    parser.add_argument(
+        "--source",
+        choices=STORY_SOURCES,
+        default="archive",
+        help="Where to list a day's stories: the HN front page archive, or every story submitted "
+             "that day via the Algolia search API; the other source is used if it fails (default: archive)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="With --target, start on the first archive page's stories while it downloads, "
+             "in HN's order rather than by points"
     )
     parser.add_argument(
         "--output",
         type=str,
         default="drafts",
-        help="Output directory for markdown files (default: drafts)"
+        help="Output directory for markdown files; backfills write to OUTPUT/YYYY-MM-DD (default: drafts)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of stories fetched and crawled concurrently (default: 4)"
+    )
+    parser.add_argument(
+        "--browser-pages",
+        type=int,
+        default=4,
+        help="Number of concurrent pages on the shared browser (default: 4)"
+    )
+    parser.add_argument(
+        "--hedge-delay",
+        type=float,
+        metavar="SECONDS",
+        help="Also fetch an article directly this long after starting Jina Reader; the first readable "
+             "result wins and the browser is only used if both fail (default: off, tiers run one after another)"
+    )
+    parser.add_argument(
+        "--host-limit",
+        type=parse_host_value,
+        action="append",
+        default=[],
+        metavar="HOST=N",
+        help="Concurrent requests allowed to HOST (repeatable; default: 6 per host)"
+    )
+    parser.add_argument(
+        "--host-rate",
+        type=parse_host_value,
+        action="append",
+        default=[],
+        metavar="HOST=RPM",
+        help="Requests per minute allowed to HOST, e.g. r.jina.ai=200 with a paid Jina key "
+             "(repeatable; default: Jina's and Algolia's published limits, other hosts unpaced)"
+    )
+    parser.add_argument(
+        "--max-page-mb",
+        type=float,
+        default=DEFAULT_MAX_PAGE_MB,
+        help=f"Read at most this many megabytes of an HTML or text page; the rest is cut off "
+             f"(default: {DEFAULT_MAX_PAGE_MB:g})"
+    )
+    parser.add_argument(
+        "--pdf-pages",
+        type=int,
+        default=DEFAULT_PDF_PAGES,
+        help=f"Extract text from at most this many pages of a linked PDF (default: {DEFAULT_PDF_PAGES})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk crawl and comment caches or per-domain crawl stats"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-crawl every story, refetch its comments and overwrite cached results"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for on-disk caches (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--day-concurrency",
+        type=int,
+        default=2,
+        help="Number of days processed concurrently in a backfill (default: 2)"
+    )
+    parser.add_argument(
+        "--lazy-browser",
+        action="store_true",
+        help="Only launch the browser when a story actually needs it"
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="Wall-clock limit for the whole run in seconds; unfinished stories are cancelled "
+             "and everything saved before then is kept"
+    )
+    parser.add_argument(
+        "--story-budget",
+        type=float,
+        default=DEFAULT_STORY_BUDGET,
+        help=f"Time budget in seconds for crawling one story across all tiers, 0 to disable (default: {DEFAULT_STORY_BUDGET:g})"
+    )
+    parser.add_argument(
+        "--events",
+        choices=EVENT_MODES,
+        default="rich",
+        help="Progress output: rich progress bars, plain text lines, or one JSON event per line (default: rich)"
     )
     args = parser.parse_args()
 
+    backfill_dates = None
+    if args.dates:
+        backfill_dates = [date.strip() for date in args.dates.split(",") if date.strip()]
+    elif args.date_from or args.date_to:
+        if not args.date_from:
+            parser.error("--to requires --from")
+        try:
+            backfill_dates = expand_date_range(args.date_from, args.date_to or args.date_from)
+        except ValueError as e:
+            parser.error(str(e))
+    if backfill_dates is not None and args.date:
+        parser.error("--date cannot be combined with --from/--to or --dates")
+    if args.date:
+        try:
+            parse_date(args.date)
+        except ValueError as e:
+            parser.error(f"--date: {e}")
+    if args.stream and (args.target is None or args.limit is not None):
+        parser.error("--stream requires --target without --limit")
+    if args.stream and args.source != "archive":
+        parser.error("--stream reads the front archive and cannot be combined with --source algolia")
+
+    options = DigestOptions(
+        concurrency=args.concurrency,
+        browser_pages=args.browser_pages,
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh,
+        cache_dir=args.cache_dir,
+        day_concurrency=args.day_concurrency,
+        warm_browser=not args.lazy_browser,
+        deadline=args.deadline,
+        story_budget=args.story_budget if args.story_budget > 0 else None,
+        target=args.target,
+        pages=args.pages,
+        source=args.source,
+        stream=args.stream,
+        host_connections={host: int(limit) for host, limit in args.host_limit},
+        host_rpm=dict(args.host_rate),
+        hedge_delay=args.hedge_delay,
+        max_page_bytes=int(args.max_page_mb * 1024 * 1024),
+        pdf_pages=args.pdf_pages,
+    )
+    limit = args.limit if args.limit is not None or args.target else DEFAULT_LIMIT
+    reporter = create_reporter(args.events, show_day=backfill_dates is not None)
+
     try:
-        asyncio.run(run_daily_digest(args.date, args.limit, args.output))
+        if backfill_dates is not None:
+            asyncio.run(run_backfill(backfill_dates, limit, args.output, options, reporter))
+        else:
+            asyncio.run(run_daily_digest(args.date, limit, args.output, options, reporter))
     except KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user[/yellow]")
+        # Already reported by the run
         sys.exit(130)
-    except Exception as e:
-        console.print(f"\n[red]Error: {e}[/red]")
+    except Exception:
         sys.exit(1)
 
 
@@ -1,11 +1,16 @@
 """Data models for hn-daily."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+# Shared by every comment without replies instead of a list per leaf
+EMPTY_CHILDREN: tuple["Comment", ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
 class Comment:
     """Represents a Hacker News comment."""
     comment_id: int
@@ -13,10 +18,34 @@ class Comment:
     text: str
     created_at: datetime
     parent_id: int
-    children: list["Comment"] = field(default_factory=list)
+    children: tuple["Comment", ...] = EMPTY_CHILDREN
+
+    def to_row(self) -> list:
+        """Encode the comment and its replies as nested positional lists."""
+        return [
+            self.comment_id,
+            self.author,
+            self.text,
+            self.created_at.isoformat(),
+            self.parent_id,
+            [child.to_row() for child in self.children],
+        ]
 
+    @classmethod
+    def from_row(cls, row: list) -> "Comment":
+        """Rebuild a comment tree encoded by ``to_row``."""
+        comment_id, author, text, created_at, parent_id, children = row
+        return cls(
+            comment_id=comment_id,
+            author=sys.intern(author),
+            text=text,
+            created_at=datetime.fromisoformat(created_at),
+            parent_id=parent_id,
+            children=tuple(map(cls.from_row, children)) if children else EMPTY_CHILDREN,
+        )
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Story:
     """Represents a Hacker News story."""
     object_id: str
@@ -29,7 +58,36 @@ class Story:
     num_comments: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class CrawlFailure:
+    """
+    Why one crawl tier failed.
+
+    ``kind`` is ``transient`` (timeouts, resets, 429/5xx: worth retrying),
+    ``permanent`` (404/410, DNS, TLS: will not change on retry) or
+    ``content`` (the page loaded but had no usable article text).
+    """
+    kind: str
+    reason: str
+    tier: Optional[str] = None
+    status_code: Optional[int] = None
+    detail: str = ""
+
+    TRANSIENT = "transient"
+    PERMANENT = "permanent"
+    CONTENT = "content"
+
+    @property
+    def retryable(self) -> bool:
+        return self.kind == self.TRANSIENT
+
+    def describe(self) -> str:
+        """One-line human readable summary."""
+        label = f"{self.tier}: {self.reason}" if self.tier else self.reason
+        return f"{label} ({self.detail})" if self.detail else label
+
+
+@dataclass(frozen=True, slots=True)
 class CrawlResult:
     """Result from crawling a story URL."""
     url: str
@@ -38,3 +96,16 @@ class CrawlResult:
     success: bool
     error_message: Optional[str] = None
     is_fallback: bool = False
+    tier: Optional[str] = None
+    validators: dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+    # One entry per failed tier, in the order they were tried
+    failures: tuple[CrawlFailure, ...] = ()
+
+    @property
+    def failure(self) -> Optional[CrawlFailure]:
+        """The failure that best explains an unsuccessful crawl."""
+        for failure in self.failures:
+            if failure.kind == CrawlFailure.PERMANENT:
+                return failure
+        return self.failures[-1] if self.failures else None
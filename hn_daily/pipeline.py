@@ -0,0 +1,248 @@
+"""Staged story processing pipeline for hn-daily."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Optional, Union
+
+from .models import Story, Comment, CrawlResult
+
+
+_DONE = object()
+
+
+@dataclass
+class StoryJob:
+    """A story moving through the pipeline, plus everything produced for it."""
+    index: int
+    story: Story
+    comments: list[Comment] = field(default_factory=list)
+    crawl_result: Optional[CrawlResult] = None
+    filepath: Optional[Path] = None
+    error: Optional[str] = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        """Whether a draft was written with crawled or fallback content."""
+        if self.filepath is None or self.crawl_result is None:
+            return False
+        return self.crawl_result.success or self.crawl_result.is_fallback
+
+
+class StoryPipeline:
+    """
+    Process stories through comment, crawl and save stages.
+
+    Each stage runs its own pool of workers and hands jobs to the next stage
+    through a bounded queue, so comment fetching for one story overlaps with
+    crawling another. Results are always returned in input order. With a
+    success target, the pipeline stops pulling new stories once enough drafts
+    are saved, which makes it safe to feed a long ranked candidate list.
+    """
+
+    def __init__(
+        self,
+        comment_service,
+        crawler_service,
+        storage_service,
+        comment_concurrency: int = 4,
+        crawl_concurrency: int = 4,
+        queue_size: int = 4,
+        on_job_started: Optional[Callable[[StoryJob], None]] = None,
+        on_job_done: Optional[Callable[[StoryJob], None]] = None,
+        on_stage_done: Optional[Callable[[StoryJob, str, float], None]] = None,
+    ):
+        self.comment_service = comment_service
+        self.crawler_service = crawler_service
+        self.storage_service = storage_service
+        self.comment_concurrency = max(1, comment_concurrency)
+        self.crawl_concurrency = max(1, crawl_concurrency)
+        self.queue_size = max(1, queue_size)
+        self.on_job_started = on_job_started
+        self.on_job_done = on_job_done
+        self.on_stage_done = on_stage_done
+        # Per-run state, reset by run()
+        self._target: Optional[int] = None
+        self._saved_count = 0
+        self._target_reached = asyncio.Event()
+
+    async def run(
+        self,
+        stories: Union[Iterable[Story], AsyncIterable[Story]],
+        deadline: Optional[float] = None,
+        target: Optional[int] = None,
+    ) -> list[StoryJob]:
+        """
+        Run stories through the pipeline.
+
+        Args:
+            stories: Stories to process in ranking order; async iterables are
+                consumed lazily, only as fast as the pipeline can take them
+            deadline: Optional event loop time at which unfinished work is
+                cancelled; stories saved before then are kept
+            target: Optional number of saved drafts after which no new stories
+                are scheduled and in-flight ones are cancelled
+
+        Returns:
+            One StoryJob per story that entered the pipeline, in input order
+        """
+        jobs: list[StoryJob] = []
+        self._reset(target)
+
+        comment_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        crawl_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        save_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        tasks = [
+            asyncio.create_task(self._feed(stories, jobs, comment_queue)),
+            asyncio.create_task(self._run_stage(
+                "comments", self._fetch_comments, comment_queue, crawl_queue,
+                self.comment_concurrency, self.crawl_concurrency,
+            )),
+            asyncio.create_task(self._run_stage(
+                "crawl", self._crawl, crawl_queue, save_queue,
+                self.crawl_concurrency, 1,
+            )),
+            asyncio.create_task(self._run_stage(
+                "save", self._save, save_queue, None, 1, 0,
+            )),
+        ]
+        work = asyncio.gather(*tasks)
+        stop = asyncio.create_task(self._target_reached.wait())
+        try:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - asyncio.get_running_loop().time())
+            await asyncio.wait({work, stop}, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if work.done():
+                work.result()
+            elif self._target_reached.is_set():
+                self._cancel_unfinished(jobs, "Not needed: success target reached")
+            else:
+                self._cancel_unfinished(jobs, "Cancelled at run deadline")
+        finally:
+            stop.cancel()
+            work.cancel()
+            await asyncio.gather(work, stop, return_exceptions=True)
+
+        return jobs
+
+    def _reset(self, target: Optional[int]):
+        """Clear the state left by a previous run."""
+        self._target = target
+        self._saved_count = 0
+        self._target_reached.clear()
+
+    def _cancel_unfinished(self, jobs: list[StoryJob], reason: str):
+        """Mark jobs that had not left the pipeline when it was stopped."""
+        for job in jobs:
+            if "save" in job.timings:
+                continue
+            job.error = reason
+            if self.on_job_done:
+                self.on_job_done(job)
+
+    async def _feed(
+        self,
+        stories: Union[Iterable[Story], AsyncIterable[Story]],
+        jobs: list[StoryJob],
+        queue: asyncio.Queue,
+    ):
+        """Push jobs into the first stage, then one stop marker per worker."""
+        candidates = self._iterate(stories)
+        try:
+            # Check the target before pulling, so no candidate is fetched in vain
+            while not self._target_reached.is_set():
+                story = await anext(candidates, None)
+                if story is None:
+                    break
+                job = StoryJob(index=len(jobs), story=story)
+                jobs.append(job)
+                if self.on_job_started:
+                    self.on_job_started(job)
+                await queue.put(job)
+        finally:
+            await candidates.aclose()
+        for _ in range(self.comment_concurrency):
+            await queue.put(_DONE)
+
+    @staticmethod
+    async def _iterate(stories: Union[Iterable[Story], AsyncIterable[Story]]) -> AsyncIterator[Story]:
+        if isinstance(stories, AsyncIterable):
+            async for story in stories:
+                yield story
+        else:
+            for story in stories:
+                yield story
+
+    async def _run_stage(
+        self,
+        stage: str,
+        handler,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        workers: int,
+        downstream_workers: int,
+    ):
+        """Run a pool of workers for one stage and signal the next stage when drained."""
+        async def worker():
+            while True:
+                job = await inbox.get()
+                if job is _DONE:
+                    return
+                started = time.perf_counter()
+                await handler(job)
+                elapsed = time.perf_counter() - started
+                job.timings[stage] = elapsed
+                if self.on_stage_done:
+                    self.on_stage_done(job, stage, elapsed)
+                if outbox is None:
+                    if self.on_job_done:
+                        self.on_job_done(job)
+                else:
+                    await outbox.put(job)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        if outbox is not None:
+            for _ in range(downstream_workers):
+                await outbox.put(_DONE)
+
+    async def _fetch_comments(self, job: StoryJob):
+        try:
+            job.comments = await self.comment_service.get_comments_for_story(job.story)
+        except Exception as e:
+            job.comments = []
+            job.error = f"Comment fetch failed: {e}"
+
+    async def _crawl(self, job: StoryJob):
+        try:
+            job.crawl_result = await self.crawler_service.crawl_story(job.story)
+        except Exception as e:
+            job.crawl_result = CrawlResult(
+                url=job.story.url or "",
+                title=job.story.title,
+                markdown_content="",
+                success=False,
+                error_message=f"Crawl raised exception: {e}",
+            )
+
+    async def _save(self, job: StoryJob):
+        if self._target_reached.is_set():
+            job.error = "Not needed: success target reached"
+            return
+
+        try:
+            job.filepath = self.storage_service.save_content(
+                job.story, job.crawl_result, job.comments
+            )
+        except Exception as e:
+            job.filepath = None
+            job.error = f"Save failed: {e}"
+
+        if job.success:
+            self._saved_count += 1
+            if self._target is not None and self._saved_count >= self._target:
+                self._target_reached.set()
@@ -0,0 +1,325 @@
+"""Progress reporters for the hn-daily CLI."""
+
+import json
+import logging
+import sys
+import time
+from typing import Optional, TextIO
+
+from .pipeline import StoryJob
+
+
+EVENT_MODES = ("rich", "plain", "ndjson")
+
+
+# Message level used for the error of a run that ended with a given status
+_ERROR_LEVELS = {"failed": "error", "cancelled": "warning"}
+
+
+class Reporter:
+    """
+    Receives run events from the CLI.
+
+    The base class ignores every event; subclasses render them as rich
+    progress bars, plain text lines or NDJSON.
+    """
+
+    def start(self):
+        """Called before any work starts."""
+
+    def stop(self, status: str = "ok", error: Optional[str] = None):
+        """
+        Called once all work has finished or failed.
+
+        Args:
+            status: "ok", "failed" or "cancelled"
+            error: Why the run did not finish, reported before anything else is closed
+        """
+
+    def fetching_stories(self, days: int):
+        """Story lists are being downloaded for the given number of days."""
+
+    def day_fetched(self, day: str, found: Optional[int], selected: Optional[int], elapsed: float):
+        """
+        One day's story list has been downloaded and deduplicated.
+
+        ``found`` and ``selected`` are None when candidates are streamed into
+        the pipeline page by page instead of being counted up front.
+        """
+
+    def day_failed(self, day: str, error: str):
+        """One day's story list could not be downloaded."""
+
+    def day_started(self, day: str, expected: Optional[int]):
+        """A day's stories are about to enter the pipeline; their number may not be known."""
+
+    def story_selected(self, day: str, job: StoryJob):
+        """The pipeline took a story, in rank order."""
+
+    def stage_done(self, day: str, job: StoryJob, stage: str, elapsed: float):
+        """A story finished one pipeline stage."""
+
+    def job_done(self, day: str, job: StoryJob):
+        """A story left the pipeline."""
+
+    def day_done(self, day: str, jobs: list[StoryJob]):
+        """Every story of a day has left the pipeline."""
+
+    def message(self, text: str, level: str = "info"):
+        """A free-form status message."""
+
+    def log_handler(self) -> logging.Handler:
+        """Handler for service log lines such as outgoing API requests."""
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler
+
+
+class RichReporter(Reporter):
+    """Interactive progress bars and summary tables rendered with rich."""
+
+    def __init__(self, show_day: bool = False):
+        from rich.console import Console
+
+        self.console = Console()
+        self.show_day = show_day
+        self._progress = None
+        self._fetch_task = None
+        self._day_tasks = {}
+        self._finished_days: list[tuple[str, list[StoryJob]]] = []
+
+    def start(self):
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=self.console
+        )
+        self._progress.start()
+
+    def stop(self, status: str = "ok", error: Optional[str] = None):
+        if self._progress is not None:
+            self._progress.stop()
+            self._progress = None
+        for day, jobs in self._finished_days:
+            self._print_summary(day, jobs)
+        self._finished_days = []
+        if error:
+            self.message(error, _ERROR_LEVELS.get(status, "error"))
+
+    def fetching_stories(self, days: int):
+        self._selected = 0
+        self._skipped = 0
+        self._fetch_task = self._progress.add_task("Fetching stories from Hacker News...", total=days)
+
+    def day_fetched(self, day: str, found: Optional[int], selected: Optional[int], elapsed: float):
+        if found is not None:
+            self._skipped += found - selected
+        self._progress.advance(self._fetch_task)
+
+    def story_selected(self, day: str, job: StoryJob):
+        self._selected += 1
+        self._progress.update(
+            self._fetch_task,
+            description=f"Found {self._selected} stories ({self._skipped} skipped)",
+        )
+
+    def day_failed(self, day: str, error: str):
+        self._progress.advance(self._fetch_task)
+        self.console.print(f"[red]{day}: {error}[/red]")
+
+    def day_started(self, day: str, expected: Optional[int]):
+        self._day_tasks[day] = self._progress.add_task(f"{self._prefix(day)}Processing stories...", total=expected)
+
+    def job_done(self, day: str, job: StoryJob):
+        if job.filepath:
+            status = f"[green]Saved: {job.filepath.name}[/green]"
+        elif job.error:
+            status = f"[red]{job.error}[/red]"
+        else:
+            status = "[yellow]Skipped (crawl failed)[/yellow]"
+        total = self._progress.tasks[self._day_tasks[day]].total
+        position = f"{job.index + 1}/{total:.0f}" if total is not None else f"#{job.index + 1}"
+        self._progress.console.print(
+            f"[cyan]{self._prefix(day)}{position}[/cyan] {job.story.title[:50]} - {status}"
+        )
+        self._progress.advance(self._day_tasks[day])
+
+    def day_done(self, day: str, jobs: list[StoryJob]):
+        saved = sum(1 for job in jobs if job.filepath)
+        task = self._day_tasks[day]
+        self._progress.update(
+            task,
+            total=len(jobs),
+            completed=len(jobs),
+            description=f"{self._prefix(day)}Processing complete ({saved}/{len(jobs)} saved)",
+        )
+        self._finished_days.append((day, jobs))
+
+    def message(self, text: str, level: str = "info"):
+        style = {"warning": "yellow", "error": "red"}.get(level)
+        self.console.print(f"[{style}]{text}[/{style}]" if style else text)
+
+    def _print_summary(self, day: str, jobs: list[StoryJob]):
+        """Print a summary table of processed stories."""
+        from rich.table import Table
+
+        results = [(job.story, job.filepath, job.success) for job in jobs]
+        table = Table(title=f"Daily Digest Summary ({day})" if self.show_day else "Daily Digest Summary")
+        table.add_column("Status", justify="center", style="green" if all(r[2] for r in results) else "yellow")
+        table.add_column("Story", overflow="fold", max_width=50)
+        table.add_column("File")
+
+        success_count = sum(1 for r in results if r[2])
+
+        for story, filepath, success in results:
+            status = "[green]OK[/green]" if success else "[red]FAIL[/red]"
+            filename = filepath.name if filepath else "N/A"
+            table.add_row(status, story.title[:50] + "..." if len(story.title) > 50 else story.title, filename)
+
+        self.console.print(table)
+        self.console.print(f"\nProcessed: {len(results)} | Success: {success_count} | Failed: {len(results) - success_count}")
+
+    def log_handler(self) -> logging.Handler:
+        reporter = self
+
+        class ConsoleHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord):
+                reporter.console.print(self.format(record), markup=False, highlight=False)
+
+        handler = ConsoleHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler
+
+    def _prefix(self, day: str) -> str:
+        return f"{day} " if self.show_day else ""
+
+
+class PlainReporter(Reporter):
+    """One plain text line per finished story, without rich."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+
+    def day_fetched(self, day: str, found: Optional[int], selected: Optional[int], elapsed: float):
+        if found is None:
+            self._write(f"{day}: first stories ready in {elapsed:.2f}s")
+        else:
+            self._write(f"{day}: found {found} stories ({found - selected} skipped) in {elapsed:.2f}s")
+
+    def day_failed(self, day: str, error: str):
+        self._write(f"{day}: ERROR {error}")
+
+    def job_done(self, day: str, job: StoryJob):
+        status = f"saved {job.filepath}" if job.filepath else f"failed {job.error or 'crawl failed'}"
+        self._write(f"{day}: #{job.index + 1} {job.story.story_id} {status}")
+
+    def day_done(self, day: str, jobs: list[StoryJob]):
+        saved = sum(1 for job in jobs if job.success)
+        self._write(f"{day}: processed {len(jobs)} | success {saved} | failed {len(jobs) - saved}")
+
+    def stop(self, status: str = "ok", error: Optional[str] = None):
+        if error:
+            self.message(error, _ERROR_LEVELS.get(status, "error"))
+
+    def message(self, text: str, level: str = "info"):
+        self._write(text if level == "info" else f"{level.upper()}: {text}")
+
+    def _write(self, line: str):
+        self.stream.write(line + "\n")
+        self.stream.flush()
+
+
+class NdjsonReporter(Reporter):
+    """
+    Machine-readable events, one JSON object per line.
+
+    Every event carries ``event``, ``ts`` (Unix time) and, where relevant,
+    ``day`` and ``story_id``. Lines are flushed as soon as they are written
+    so consumers can act on the first finished draft.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+
+    def start(self):
+        self._emit("run_started")
+
+    def stop(self, status: str = "ok", error: Optional[str] = None):
+        if error:
+            self.message(error, _ERROR_LEVELS.get(status, "error"))
+        self._emit("run_finished", status=status)
+
+    def day_fetched(self, day: str, found: Optional[int], selected: Optional[int], elapsed: float):
+        self._emit("stories_fetched", day=day, found=found, selected=selected, elapsed=round(elapsed, 3))
+
+    def day_failed(self, day: str, error: str):
+        self._emit("day_failed", day=day, error=error)
+
+    def story_selected(self, day: str, job: StoryJob):
+        story = job.story
+        self._emit(
+            "story_selected",
+            day=day,
+            rank=job.index + 1,
+            story_id=story.story_id,
+            title=story.title,
+            url=story.url,
+            points=story.points,
+            num_comments=story.num_comments,
+        )
+
+    def stage_done(self, day: str, job: StoryJob, stage: str, elapsed: float):
+        fields = {"day": day, "story_id": job.story.story_id, "elapsed": round(elapsed, 3)}
+        if stage == "comments":
+            self._emit("comments_fetched", count=len(job.comments), **fields)
+        elif stage == "crawl":
+            result = job.crawl_result
+            self._emit(
+                "crawl_finished",
+                success=result.success,
+                tier=result.tier,
+                from_cache=result.from_cache,
+                error=result.error_message,
+                failure_kind=result.failure.kind if result.failure else None,
+                failure_reason=result.failure.reason if result.failure else None,
+                **fields,
+            )
+        elif stage == "save":
+            if job.filepath:
+                self._emit("file_written", path=str(job.filepath), **fields)
+
+    def job_done(self, day: str, job: StoryJob):
+        self._emit(
+            "story_done",
+            day=day,
+            story_id=job.story.story_id,
+            success=job.success,
+            path=str(job.filepath) if job.filepath else None,
+            error=job.error,
+            timings={stage: round(elapsed, 3) for stage, elapsed in job.timings.items()},
+        )
+
+    def day_done(self, day: str, jobs: list[StoryJob]):
+        saved = sum(1 for job in jobs if job.success)
+        self._emit("day_finished", day=day, processed=len(jobs), success=saved, failed=len(jobs) - saved)
+
+    def message(self, text: str, level: str = "info"):
+        self._emit("message", level=level, text=text)
+
+    def _emit(self, event: str, **fields):
+        record = {"event": event, "ts": round(time.time(), 3), **fields}
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def create_reporter(mode: str, show_day: bool = False) -> Reporter:
+    """Build the reporter for an ``--events`` mode."""
+    if mode == "ndjson":
+        return NdjsonReporter()
+    if mode == "plain":
+        return PlainReporter()
+    return RichReporter(show_day=show_day)
@@ -1,17 +1,36 @@
 """Services package."""
 
-from .story_service import StoryService, ApiError
-from .comment_service import CommentService
-from .crawler_service import CrawlerService, CrawlError
-from .storage_service import StorageService
-from .history_service import HistoryService
+from importlib import import_module
 
-__all__ = [
-    "StoryService",
-    "ApiError",
-    "CommentService",
-    "CrawlerService",
-    "CrawlError",
-    "StorageService",
-    "HistoryService",
-]
+
+_EXPORTS = {
+    "StoryService": ".story_service",
+    "ApiError": ".story_service",
+    "StorySource": ".story_service",
+    "STORY_SOURCES": ".story_service",
+    "CommentService": ".comment_service",
+    "CrawlerService": ".crawler_service",
+    "CrawlError": ".crawler_service",
+    "ExtractorRegistry": ".extractors",
+    "ContentRouter": ".content_router",
+    "StorageService": ".storage_service",
+    "HistoryService": ".history_service",
+    "HttpClient": ".http_client",
+    "RateLimiter": ".rate_limiter",
+    "RateLimited": ".rate_limiter",
+    "ContentCache": ".cache_service",
+    "CommentCache": ".cache_service",
+    "DomainStats": ".domain_stats",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import service modules on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,66 @@
+"""Long-lived headless browser shared by all crawls in a run."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from importlib import import_module
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+if TYPE_CHECKING:
+    from crawl4ai import AsyncWebCrawler
+
+
+class BrowserPool:
+    """
+    Owns a single warm Chromium instance and hands out page slots.
+
+    The browser is launched once, either explicitly via ``start()`` or on the
+    first ``page()`` request, and reused until ``close()``. At most
+    ``max_pages`` crawls share the browser at the same time. crawl4ai and
+    Playwright are only imported when the browser is first launched.
+    """
+
+    def __init__(self, max_pages: int = 4, headless: bool = True):
+        self.max_pages = max(1, max_pages)
+        self.headless = headless
+        self._crawler: Optional["AsyncWebCrawler"] = None
+        self._start_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_pages)
+
+    @property
+    def is_started(self) -> bool:
+        """Whether the browser is currently running."""
+        return self._crawler is not None
+
+    async def start(self) -> "AsyncWebCrawler":
+        """Launch the browser if it is not running yet."""
+        async with self._start_lock:
+            if self._crawler is None:
+                # Importing the browser stack takes about a second; keep it off the event loop
+                await asyncio.to_thread(import_module, "crawl4ai")
+                crawler = self._create_crawler()
+                await crawler.start()
+                self._crawler = crawler
+            return self._crawler
+
+    def _create_crawler(self) -> "AsyncWebCrawler":
+        """Build the crawl4ai crawler, importing the browser stack on first use."""
+        from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+        return AsyncWebCrawler(
+            config=BrowserConfig(headless=self.headless, verbose=False)
+        )
+
+    async def close(self):
+        """Shut the browser down."""
+        async with self._start_lock:
+            if self._crawler is not None:
+                crawler = self._crawler
+                self._crawler = None
+                await crawler.close()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator["AsyncWebCrawler"]:
+        """Reserve a page slot on the shared browser."""
+        async with self._slots:
+            crawler = await self.start()
+            yield crawler
@@ -0,0 +1,247 @@
+"""On-disk caches for crawl results and comments."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..models import Comment, CrawlResult, Story
+
+
+# Only parameters that never select content; ``ref`` and ``source`` often do
+TRACKING_PARAM_PREFIXES = ("utm_", "mc_")
+TRACKING_PARAMS = {"fbclid", "gclid", "ref_src"}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so trivially different links share a cache entry."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ])
+    path = parts.path or "/"
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class DiskCache:
+    """
+    Size-bounded JSON key/value store on disk.
+
+    Every entry is one file named after the SHA-256 of its key. Reads bump
+    the file's modification time, so evicting the oldest files first gives
+    least-recently-used eviction once ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None
+
+    def get(self, key: str) -> Optional[dict]:
+        """Load an entry and mark it as recently used."""
+        path = self._path_for(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def set(self, key: str, value: dict):
+        """Store an entry, evicting least recently used entries if needed."""
+        path = self._path_for(key)
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        total = self._current_size()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous_size = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        self._total_bytes = total - previous_size + len(payload)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def delete(self, key: str):
+        """Remove an entry if it exists."""
+        path = self._path_for(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        if self._total_bytes is not None:
+            self._total_bytes -= size
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries = []
+        if not self.directory.exists():
+            return entries
+        for path in self.directory.glob("*/*.json"):
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                continue
+        return entries
+
+    def _current_size(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = sum(stat.st_size for _, stat in self._entries())
+        return self._total_bytes
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= stat.st_size
+        self._total_bytes = total
+
+
+class ContentCache:
+    """Caches cleaned crawl results keyed by normalized URL."""
+
+    def __init__(
+        self,
+        directory: str = ".cache/hn-daily/content",
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age: float = 7 * 24 * 3600,
+    ):
+        self.store = DiskCache(directory, max_bytes)
+        self.max_age = max_age
+
+    def get(self, url: str) -> Optional[dict]:
+        """
+        Look up a cached crawl for a URL.
+
+        Entries carrying ETag/Last-Modified validators are returned regardless
+        of age so the caller can revalidate them; entries without validators
+        expire after ``max_age`` seconds.
+
+        Returns:
+            The cache entry, or None when missing or expired
+        """
+        key = normalize_url(url)
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        if not entry.get("validators") and time.time() - entry.get("stored_at", 0) > self.max_age:
+            self.store.delete(key)
+            return None
+        return entry
+
+    def put(self, url: str, result: CrawlResult):
+        """Store a successful crawl result."""
+        if not result.success:
+            return
+        self.store.set(normalize_url(url), {
+            "url": url,
+            "title": result.title,
+            "markdown_content": result.markdown_content,
+            "tier": result.tier,
+            "is_fallback": result.is_fallback,
+            "validators": result.validators,
+            "stored_at": time.time(),
+        })
+
+    def delete(self, url: str):
+        """Drop the entry for a URL."""
+        self.store.delete(normalize_url(url))
+
+    @staticmethod
+    def to_result(entry: dict, url: str, title: str) -> CrawlResult:
+        """Rebuild a CrawlResult from a cache entry."""
+        return CrawlResult(
+            url=url,
+            title=title or entry.get("title", ""),
+            markdown_content=entry.get("markdown_content", ""),
+            success=True,
+            is_fallback=entry.get("is_fallback", False),
+            tier=entry.get("tier"),
+            validators=entry.get("validators") or {},
+            from_cache=True,
+        )
+
+
+class CommentCache:
+    """
+    Caches the ranked, pruned comments of a story keyed by ``story_id``.
+
+    Each entry remembers the story's ``num_comments`` at fetch time. An entry
+    is reused until the story has gained more than ``max_growth`` comments
+    or the entry is older than ``max_age`` seconds. Entries written with
+    different selection settings (depth, roots, children) never match.
+    """
+
+    def __init__(
+        self,
+        directory: str = ".cache/hn-daily/comments",
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age: float = 24 * 3600,
+        max_growth: int = 10,
+    ):
+        self.store = DiskCache(directory, max_bytes)
+        self.max_age = max_age
+        self.max_growth = max_growth
+
+    def get(self, story: Story, settings: str = "") -> Optional[list[Comment]]:
+        """
+        Look up the cached comments for a story.
+
+        Args:
+            story: Story whose current ``num_comments`` decides freshness
+            settings: Fingerprint of the selection settings used to build them
+
+        Returns:
+            The cached comments, or None when missing, stale or built differently
+        """
+        entry = self.store.get(self._key(story))
+        if entry is None or entry.get("settings") != settings:
+            return None
+        if time.time() - entry.get("stored_at", 0) > self.max_age:
+            return None
+        if story.num_comments - entry.get("num_comments", 0) > self.max_growth:
+            return None
+        try:
+            return [Comment.from_row(row) for row in entry.get("comments", [])]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, story: Story, comments: list[Comment], settings: str = ""):
+        """Store the comments fetched for a story."""
+        self.store.set(self._key(story), {
+            "story_id": story.story_id,
+            "num_comments": story.num_comments,
+            "settings": settings,
+            "comments": [comment.to_row() for comment in comments],
+            "stored_at": time.time(),
+        })
+
+    @staticmethod
+    def _key(story: Story) -> str:
+        return f"comments:{story.story_id}"
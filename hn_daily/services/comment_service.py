@@ -1,101 +1,362 @@
 """Comment service for fetching comments from Hacker News."""
 
+import asyncio
 import httpx
+import heapq
+import logging
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from importlib.util import find_spec
+from typing import Any, Optional
 from dateutil.parser import isoparse
-import asyncio
 
-from ..models import Story, Comment
+from ..models import EMPTY_CHILDREN, Story, Comment
 from ..timezone import APP_TIMEZONE
+from .cache_service import CommentCache
+from .http_client import HttpClient
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ThreadStats:
+    """Full-depth statistics of one top-level comment thread."""
+    descendants: int
+    max_depth: int
+    authors: int
+
+
+class CommentTreeBuilder:
+    """
+    Select and build the top comment threads of an Algolia item.
+
+    Threads arrive either as JSON parse events (``(event, value)`` pairs as
+    produced by ``ijson.basic_parse``) through ``feed``, or as decoded
+    top-level comment dicts through ``add_thread``. Both make one iterative
+    post-order pass over every reply, computing full-depth ThreadStats
+    (descendants, depth, distinct authors), but only keep comment fields
+    for replies up to ``max_depth``.
+
+    Finished threads are ranked by their stats in a bounded heap of
+    ``max_roots``, and each kept comment keeps (up to ``max_children``) its
+    replies with the largest subtrees first.
+    Comment objects (and their timestamps) are only built for the threads
+    that are returned.
+    """
+
+    FIELDS = {"id", "author", "text", "created_at", "parent_id"}
+
+    # Frame kinds on the event parse stack
+    _ROOT, _COMMENT, _CHILDREN = range(3)
+
+    def __init__(self, max_depth: int = 2, max_roots: int = 2, max_children: Optional[int] = None):
+        self.max_depth = max_depth
+        self.max_roots = max_roots
+        self.max_children = max_children
+        # Comment frames: [kind, depth, current key, fields, kept children heap,
+        #                  descendants, height, children seen]
+        self._stack: list[list] = []
+        # Nesting level inside a value that is being skipped
+        self._skip = 0
+        self._authors: set[str] = set()
+        self._top: list[tuple[tuple, tuple, ThreadStats]] = []
+        self._seen_threads = 0
+        # Stats of the returned threads, keyed by comment_id
+        self.thread_stats: dict[int, ThreadStats] = {}
+
+    def feed(self, event: str, value: Any):
+        """Consume one JSON parse event."""
+        if self._skip:
+            if event == "start_map" or event == "start_array":
+                self._skip += 1
+            elif event == "end_map" or event == "end_array":
+                self._skip -= 1
+            return
+
+        stack = self._stack
+        top = stack[-1] if stack else None
+        if event == "map_key":
+            top[2] = value
+        elif event == "start_map":
+            if top is None:
+                stack.append([self._ROOT, -1, None, None, None, 0, 0, 0])
+            elif top[0] == self._CHILDREN:
+                stack.append(self._open(top[1], {}))
+            else:
+                self._skip = 1
+        elif event == "start_array":
+            if top[0] != self._CHILDREN and top[2] == "children":
+                stack.append([self._CHILDREN, top[1] + 1, None, None, None, 0, 0, 0])
+            else:
+                self._skip = 1
+        elif event == "end_array":
+            stack.pop()
+        elif event == "end_map":
+            frame = stack.pop()
+            if frame[0] == self._COMMENT:
+                # The stack now ends with the children array, then its owner
+                owner = stack[-2]
+                self._close(frame, owner if owner[0] == self._COMMENT else None)
+        elif top[0] == self._COMMENT:
+            key = top[2]
+            if key == "author" and value:
+                self._authors.add(value)
+            if top[3] is not None and key in self.FIELDS:
+                top[3][key] = value
+
+    def add_thread(self, item: dict):
+        """Consume one decoded top-level comment and all of its replies."""
+        stack = [(self._open(0, item), iter(item.get("children") or ()))]
+        while stack:
+            frame, children = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                stack.append((self._open(frame[1] + 1, child), iter(child.get("children") or ())))
+                continue
+            stack.pop()
+            self._close(frame, stack[-1][0] if stack else None)
+
+    def result(self) -> list[Comment]:
+        """Top-level threads ranked by their stats, best first."""
+        ranked = sorted(self._top, key=lambda entry: entry[0], reverse=True)
+        comments = []
+        for _, node, stats in ranked:
+            comment = self._materialize(node)
+            self.thread_stats[comment.comment_id] = stats
+            comments.append(comment)
+        return comments
+
+    def _open(self, depth: int, data: dict) -> list:
+        """Start a comment frame; ``data`` is the decoded comment, or {} to fill from events."""
+        if depth == 0:
+            self._authors = set()
+        if data.get("author"):
+            self._authors.add(data["author"])
+        fields = data if depth <= self.max_depth else None
+        children = [] if depth < self.max_depth else None
+        return [self._COMMENT, depth, None, fields, children, 0, 0, 0]
+
+    def _close(self, frame: list, owner: Optional[list]):
+        """Finish a comment frame and fold its stats into its owner (post-order)."""
+        node = None
+        if frame[3] is not None:
+            kept = sorted(frame[4] or (), key=lambda entry: entry[:2], reverse=True)
+            node = (frame[3], [child for _, _, child in kept])
+
+        if owner is None:
+            self._offer(node, ThreadStats(frame[5], frame[6], len(self._authors)))
+            return
+
+        owner[5] += 1 + frame[5]
+        owner[6] = max(owner[6], frame[6] + 1)
+        if node is not None:
+            # Keep the replies with the largest subtrees; ties keep the earlier reply
+            entry = (frame[5], -owner[7], node)
+            owner[7] += 1
+            if self.max_children is None or len(owner[4]) < self.max_children:
+                heapq.heappush(owner[4], entry)
+            elif entry[:2] > owner[4][0][:2]:
+                heapq.heapreplace(owner[4], entry)
+
+    def _offer(self, node: tuple, stats: ThreadStats):
+        """Keep a finished top-level thread only if it ranks in the top ``max_roots``."""
+        # Ties keep the earlier thread, like a stable sort would
+        key = (stats.descendants, stats.authors, stats.max_depth, -self._seen_threads)
+        self._seen_threads += 1
+        if len(self._top) < self.max_roots:
+            heapq.heappush(self._top, (key, node, stats))
+        elif key > self._top[0][0]:
+            heapq.heapreplace(self._top, (key, node, stats))
+
+    def _materialize(self, node: tuple) -> Comment:
+        """Turn a ``(fields, children)`` node into a Comment tree."""
+        data, children = node
+        return Comment(
+            comment_id=data.get("id", 0),
+            # The same few authors reply all over a thread
+            author=sys.intern(data.get("author") or "unknown"),
+            text=data.get("text", ""),
+            created_at=isoparse(data["created_at"]) if data.get("created_at") else datetime.now(APP_TIMEZONE),
+            parent_id=data.get("parent_id", 0),
+            children=tuple(map(self._materialize, children)) if children else EMPTY_CHILDREN,
+        )
 
 
 class CommentService:
-    """Fetches comments associated with stories."""
+    """
+    Fetches comments associated with stories.
+
+    Algolia item responses for large threads run to several megabytes. When
+    the optional ``ijson`` package is installed, the response is parsed
+    incrementally while it streams in and only the comments that can still
+    be returned are built; otherwise the body is decoded in one go and
+    walked the same way.
+
+    Stories with more than ``partial_threshold`` comments skip the full
+    tree: the Firebase item lists their top-level comment ids in HN's own
+    ranking order, and only the first ``partial_candidates`` threads are
+    fetched from Algolia, concurrently, and ranked.
+    """
 
-    def __init__(self, timeout: float = 30.0, max_depth: int = 2):
+    ALGOLIA_ITEM_URL = "https://hn.algolia.com/api/v1/items/{}"
+    FIREBASE_ITEM_URL = "https://hacker-news.firebaseio.com/v0/item/{}.json"
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_depth: int = 2,
+        http: Optional[HttpClient] = None,
+        stream_json: Optional[bool] = None,
+        max_roots: int = 2,
+        max_children: Optional[int] = None,
+        cache: Optional[CommentCache] = None,
+        refresh_cache: bool = False,
+        partial_threshold: Optional[int] = 1000,
+        partial_candidates: int = 8,
+    ):
+        """
+        Initialize the comment service.
+
+        Args:
+            timeout: Request timeout in seconds
+            max_depth: Deepest reply level kept below a top-level comment
+            http: Shared HTTP client; a private one is created if omitted
+            stream_json: Parse responses incrementally with ijson; defaults to
+                whether ijson is installed
+            max_roots: Number of top-level comments returned per story
+            max_children: Replies kept under each returned comment, largest
+                subtrees first; all of them if None
+            cache: On-disk cache of fetched comments, or None to always fetch
+            refresh_cache: Ignore cached entries but still write fresh ones
+            partial_threshold: Fetch only leading threads for stories with more
+                comments than this; None always fetches the full tree
+            partial_candidates: Top-level threads fetched in a partial fetch
+        """
         self.timeout = timeout
         self.max_depth = max_depth
-        self._client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+        self.max_roots = max_roots
+        self.max_children = max_children
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.partial_threshold = partial_threshold
+        self.partial_candidates = max(partial_candidates, max_roots)
+        self.stream_json = find_spec("ijson") is not None if stream_json is None else stream_json
+        self._owns_http = http is None
+        self.http = http or HttpClient(timeout=timeout)
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Close the HTTP client if this service owns it."""
+        if self._owns_http:
+            await self.http.close()
 
     async def get_comments_for_story(self, story: Story) -> list[Comment]:
         """
-        Fetch all top-level comments for a story.
+        Fetch the top-level comments with the most replies for a story.
 
         Args:
             story: The Story object to fetch comments for
 
         Returns:
-            List of Comment objects
+            Up to ``max_roots`` Comment objects, ordered by full-depth
+            descendant count desc
         """
         if story.num_comments == 0:
             return []
 
-        url = f"https://hn.algolia.com/api/v1/items/{story.story_id}"
-        client = await self._get_client()
-        print(f"[API] GET {url}")
+        settings = f"{self.max_depth}/{self.max_roots}/{self.max_children}"
+        if self.cache is not None and not self.refresh_cache:
+            cached = self.cache.get(story, settings)
+            if cached is not None:
+                logger.info("[CACHE] Comments for story %s", story.story_id)
+                return cached
 
+        builder = CommentTreeBuilder(
+            max_depth=self.max_depth,
+            max_roots=self.max_roots,
+            max_children=self.max_children,
+        )
         try:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
+            partial = self.partial_threshold is not None and story.num_comments > self.partial_threshold
+            if not (partial and await self._fetch_partial(story, builder)):
+                await self._fetch_full(story, builder)
         except httpx.HTTPStatusError:
             return []
         except httpx.RequestError:
             return []
 
-        children_map = {}
-        comments = []
+        comments = builder.result()
+        if self.cache is not None:
+            self.cache.put(story, comments, settings)
+        return comments
 
-        for item in data.get("children", []):
-            comment = self._parse_comment(item, depth=0)
-            children_map[comment.comment_id] = comment
+    async def _fetch_full(self, story: Story, builder: CommentTreeBuilder):
+        """Feed the story's whole comment tree to the builder."""
+        url = self.ALGOLIA_ITEM_URL.format(story.story_id)
+        logger.info("[API] GET %s", url)
+        if self.stream_json:
+            await self._stream_events(url, builder)
+            return
+        response = await self.http.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        for item in response.json().get("children", []):
+            builder.add_thread(item)
 
-            if comment.parent_id == 0 or comment.parent_id == story.story_id:
-                comments.append(comment)
-            else:
-                parent = children_map.get(comment.parent_id)
-                if parent and len(parent.children) < 10:  # Limit children per comment
-                    parent.children.append(comment)
+    async def _fetch_partial(self, story: Story, builder: CommentTreeBuilder) -> bool:
+        """
+        Feed only the story's leading top-level threads to the builder.
 
-        # Sort by total descendants (descending)
-        comments.sort(key=self._get_descendant_count, reverse=True)
+        Args:
+            story: Story whose comments are fetched
+            builder: Builder receiving the fetched threads
 
-        # Limit to top 2
-        return comments[:2]
+        Returns:
+            False if nothing could be fetched and the full tree is needed
+        """
+        url = self.FIREBASE_ITEM_URL.format(story.story_id)
+        logger.info("[API] GET %s", url)
+        try:
+            response = await self.http.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            kids = (response.json() or {}).get("kids") or []
+        except (httpx.HTTPError, ValueError):
+            return False
 
-    def _parse_comment(self, data: dict, depth: int = 0) -> Comment:
-        """Parse a comment from API data."""
-        children = []
-        if depth < self.max_depth:
-            for child_data in data.get("children", []):
-                child = self._parse_comment(child_data, depth + 1)
-                children.append(child)
+        candidates = kids[:self.partial_candidates]
+        threads = await asyncio.gather(*(self._fetch_thread(kid) for kid in candidates))
+        # Add in listing order so ties keep HN's ranking
+        fetched = [thread for thread in threads if thread is not None]
+        for thread in fetched:
+            builder.add_thread(thread)
+        return bool(fetched)
 
-        return Comment(
-            comment_id=data.get("id", 0),
-            author=data.get("author", "unknown"),
-            text=data.get("text", ""),
-            created_at=isoparse(data["created_at"]) if data.get("created_at") else datetime.now(APP_TIMEZONE),
-            parent_id=data.get("parent_id", 0),
-            children=children
-        )
+    async def _fetch_thread(self, comment_id: int) -> Optional[dict]:
+        """Fetch one top-level comment with all of its replies."""
+        url = self.ALGOLIA_ITEM_URL.format(comment_id)
+        logger.info("[API] GET %s", url)
+        try:
+            response = await self.http.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            thread = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Failed to fetch comment thread %s: %s", comment_id, e)
+            return None
+        return thread if isinstance(thread, dict) else None
+
+    async def _stream_events(self, url: str, builder: CommentTreeBuilder):
+        """Feed JSON parse events to the builder while the response streams in."""
+        import ijson
 
-    def _get_descendant_count(self, comment: Comment) -> int:
-        """Recursive count of all descendants."""
-        count = len(comment.children)
-        for child in comment.children:
-            count += self._get_descendant_count(child)
-        return count
+        async with self.http.stream("GET", url, timeout=self.timeout) as response:
+            response.raise_for_status()
+            events = ijson.sendable_list()
+            parser = ijson.basic_parse_coro(events)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for event, value in events:
+                    builder.feed(event, value)
+                del events[:]
+            parser.close()
+            for event, value in events:
+                builder.feed(event, value)
@@ -0,0 +1,191 @@
+"""Route fetched bodies by content type, reading no more than each kind needs."""
+
+import io
+import re
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Optional
+
+import httpx
+
+
+# Bytes read before deciding what a body is
+SNIFF_BYTES = 2048
+
+# Leading bytes of formats that never hold a readable article
+BINARY_SIGNATURES = (
+    b"\x89PNG", b"\xff\xd8\xff", b"GIF8", b"RIFF",              # images, WAV/AVI
+    b"PK\x03\x04", b"\x1f\x8b", b"7z\xbc\xaf", b"Rar!", b"BZh",  # archives
+    b"\x1aE\xdf\xa3", b"OggS", b"ID3", b"fLaC",                # video and audio
+    b"\x7fELF", b"\xca\xfe\xba\xbe", b"\xcf\xfa\xed\xfe",       # executables
+)
+# Media types rejected from the headers alone
+MEDIA_TYPE_PREFIXES = ("image/", "audio/", "video/", "font/")
+BINARY_TYPE_PREFIXES = MEDIA_TYPE_PREFIXES + ("application/octet-stream", "application/zip")
+TEXT_TYPES = ("application/json", "application/xml", "application/markdown", "application/x-markdown")
+HTML_RE = re.compile(rb"<(?:!doctype\s+html|html|head|body|article|div|p)[\s>]", re.IGNORECASE)
+
+
+class UnsupportedContent(ValueError):
+    """Raised for a body that cannot be turned into an article, before it is read in full."""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+def sniff(content_type: str, head: bytes) -> str:
+    """
+    Decide what a body is from its Content-Type and first bytes.
+
+    Args:
+        content_type: Content-Type header, possibly empty or wrong
+        head: The first bytes of the body
+
+    Returns:
+        "pdf", "html", "text" or "binary"
+    """
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if head.startswith(b"%PDF-") or media_type == "application/pdf":
+        return "pdf"
+    if head.startswith(BINARY_SIGNATURES) or head[4:8] == b"ftyp" or media_type.startswith(BINARY_TYPE_PREFIXES):
+        # Servers mislabel HTML as octet-stream more often than the reverse
+        return "html" if HTML_RE.search(head) else "binary"
+    if b"\x00" in head:
+        return "binary"
+    if "html" in media_type or HTML_RE.search(head):
+        return "html"
+    if not media_type or media_type.startswith("text/") or media_type in TEXT_TYPES or media_type.endswith("+xml"):
+        return "text"
+    return "binary"
+
+
+@dataclass(frozen=True, slots=True)
+class RoutedBody:
+    """A body read as far as its kind allows."""
+    kind: str
+    content: bytes
+    content_type: str
+    truncated: bool = False
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        """Decode the body; a multi-byte character cut by the cap is replaced."""
+        return self.content.decode(encoding or "utf-8", errors="replace")
+
+
+class ContentRouter:
+    """
+    Reads response bodies with limits that depend on what they turn out to be.
+
+    HTML and text bodies are streamed up to ``max_text_bytes`` and cut off
+    there. PDFs may be up to ``max_pdf_bytes`` and only their first
+    ``max_pdf_pages`` pages are turned into text, which needs the optional
+    ``pypdf`` package. Anything else (images, video, archives, downloads)
+    is rejected after the first bytes, or from its headers alone when they
+    name a media type or a PDF over the size limit.
+    """
+
+    def __init__(
+        self,
+        max_text_bytes: int = 2 * 1024 * 1024,
+        max_pdf_bytes: int = 20 * 1024 * 1024,
+        max_pdf_pages: int = 30,
+    ):
+        self.max_text_bytes = max_text_bytes
+        self.max_pdf_bytes = max_pdf_bytes
+        self.max_pdf_pages = max_pdf_pages
+
+    @staticmethod
+    def can_read_pdf() -> bool:
+        """Whether the optional pypdf package is installed."""
+        return find_spec("pypdf") is not None
+
+    async def read(self, response: httpx.Response) -> RoutedBody:
+        """
+        Read a streamed response according to its kind.
+
+        Args:
+            response: Response opened with ``HttpClient.stream``
+
+        Returns:
+            The body, truncated at the text limit if needed
+
+        Raises:
+            UnsupportedContent: For binary bodies and PDFs over the size limit
+        """
+        content_type = response.headers.get("content-type", "")
+        declared = self._content_length(response)
+        if content_type.lower().startswith(MEDIA_TYPE_PREFIXES):
+            raise UnsupportedContent("binary_content", f"{content_type.split(';')[0]} body")
+        if declared is not None and declared > self.max_pdf_bytes and sniff(content_type, b"") == "pdf":
+            raise UnsupportedContent("too_large", f"PDF of {declared} bytes is over {self.max_pdf_bytes}")
+
+        buffer = bytearray()
+        kind = None
+        limit = self.max_text_bytes
+        async for chunk in response.aiter_bytes():
+            buffer += chunk
+            if kind is None and (len(buffer) >= SNIFF_BYTES or len(buffer) > limit):
+                kind, limit = self._route(content_type, bytes(buffer[:SNIFF_BYTES]), declared)
+            if len(buffer) > limit:
+                if kind == "pdf":
+                    raise UnsupportedContent("too_large", f"PDF over {self.max_pdf_bytes} bytes")
+                return RoutedBody(kind, bytes(buffer[:limit]), content_type, truncated=True)
+
+        if kind is None:
+            kind, _ = self._route(content_type, bytes(buffer), declared)
+        return RoutedBody(kind, bytes(buffer), content_type)
+
+    def _route(self, content_type: str, head: bytes, declared: Optional[int]) -> tuple[str, int]:
+        """Kind of a body and the most bytes worth reading of it."""
+        kind = sniff(content_type, head)
+        if kind == "binary":
+            raise UnsupportedContent("binary_content", f"binary body ({content_type or 'no content type'})")
+        if kind != "pdf":
+            return kind, self.max_text_bytes
+        if declared is not None and declared > self.max_pdf_bytes:
+            raise UnsupportedContent("too_large", f"PDF of {declared} bytes is over {self.max_pdf_bytes}")
+        return kind, self.max_pdf_bytes
+
+    @staticmethod
+    def _content_length(response: httpx.Response) -> Optional[int]:
+        try:
+            return int(response.headers["content-length"])
+        except (KeyError, ValueError):
+            return None
+
+    def pdf_to_markdown(self, data: bytes) -> tuple[str, str]:
+        """
+        Extract the text of a PDF's first pages.
+
+        CPU-bound; run it in a worker thread.
+
+        Args:
+            data: The whole PDF
+
+        Returns:
+            (title, markdown); the title comes from the PDF metadata and may be empty
+
+        Raises:
+            UnsupportedContent: If pypdf is not installed or the PDF cannot be parsed
+        """
+        if not self.can_read_pdf():
+            raise UnsupportedContent("unsupported_pdf", "install pypdf to extract text from PDFs")
+        from pypdf import PdfReader
+        from pypdf.errors import PyPdfError
+
+        try:
+            reader = PdfReader(io.BytesIO(data))
+            title = str((reader.metadata or {}).get("/Title") or "").strip()
+            page_count = len(reader.pages)
+            pages = [
+                (reader.pages[index].extract_text() or "").strip()
+                for index in range(min(page_count, self.max_pdf_pages))
+            ]
+        except (PyPdfError, KeyError, TypeError, ValueError) as e:
+            raise UnsupportedContent("unreadable_pdf", f"unreadable PDF: {e}")
+
+        markdown = "\n\n".join(page for page in pages if page)
+        if page_count > self.max_pdf_pages:
+            markdown += f"\n\n*[Text of the first {self.max_pdf_pages} of {page_count} pages]*"
+        return title, markdown
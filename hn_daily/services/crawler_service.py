@@ -1,15 +1,30 @@
 """Crawler service using Jina Reader and crawl4ai for content extraction."""
 
 import asyncio
+import logging
 import os
+import random
 import re
+import ssl
+import time
+from dataclasses import replace
+from functools import partial
 from html import unescape
 
 import httpx
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+from ..models import CrawlFailure, CrawlResult, Story
+from .browser_pool import BrowserPool
+from .cache_service import ContentCache
+from .content_router import ContentRouter, RoutedBody, UnsupportedContent
+from .domain_stats import DomainStats, domain_of
+from .extractors import ExtractorRegistry, PdfExtractor
+from .hedging import race_hedged
+from .http_client import HttpClient
+from .rate_limiter import RateLimited
 
-from ..models import Story, CrawlResult
+
+logger = logging.getLogger(__name__)
 
 
 def clean_markdown_content(markdown: str) -> str:
@@ -57,6 +72,137 @@ def html_to_markdown(html: str) -> str:
     return text.strip()
 
 
+MARKDOWN_LINK_RE = re.compile(r"!?\[[^\]]*\]\([^)]*\)")
+# Interstitials and walls that come back as a "successful" page
+BOILERPLATE_MARKERS = (
+    "enable javascript",
+    "javascript is disabled",
+    "access denied",
+    "are you a robot",
+    "verify you are human",
+    "just a moment",
+    "captcha",
+    "subscribe to continue",
+)
+
+
+def score_content(markdown: str) -> float:
+    """
+    Rate how much a page looks like a readable article, from 0 to 1.
+
+    Rewards prose length and substantial paragraphs, penalizes link-heavy
+    pages (navigation, link farms) and short bot-check or paywall pages.
+    """
+    text = markdown.strip()
+    if not text:
+        return 0.0
+    link_chars = sum(len(match.group(0)) for match in MARKDOWN_LINK_RE.finditer(text))
+    prose = len(text) - link_chars
+    paragraphs = sum(1 for block in text.split("\n\n") if len(block.strip()) >= 80)
+    score = (
+        0.5 * min(1.0, prose / 1500)
+        + 0.3 * min(1.0, paragraphs / 3)
+        + 0.2 * (1 - link_chars / len(text))
+    )
+    if len(text) < 2000 and any(marker in text.lower() for marker in BOILERPLATE_MARKERS):
+        score *= 0.3
+    return score
+
+
+# Error text that means the site cannot be reached at all, from httpx and Chromium
+DNS_ERROR_MARKERS = (
+    "name or service not known",
+    "nodename nor servname",
+    "getaddrinfo failed",
+    "no address associated",
+    "err_name_not_resolved",
+)
+TLS_ERROR_MARKERS = ("certificate verify failed", "err_cert_", "err_ssl_", "sslerror", "ssl:")
+TIMEOUT_ERROR_MARKERS = ("timeout", "timed out", "err_timed_out")
+CONNECT_ERROR_MARKERS = ("connection refused", "connection reset", "err_connection_", "err_address_unreachable")
+
+# Origin failures that every tier would hit too, when reported by a tier that
+# fetches the origin itself (Jina and site extractors fetch something else)
+LADDER_STOPPING_REASONS = {"dns", "not_found", "gone"}
+ORIGIN_TIERS = {"browser", "fallback"}
+# Origin bodies no tier can turn into an article, seen by any tier but Jina
+CONTENT_STOPPING_REASONS = {"binary_content", "too_large"}
+# PDFs the text extractor could not read; the browser cannot render them either
+PDF_FAILURE_REASONS = {"unsupported_pdf", "unreadable_pdf"}
+# Failures caused by the site itself, the only ones counted in domain stats;
+# our own rate limits, the story budget and lost or low-quality races are not
+ORIGIN_FAILURE_REASONS = {
+    "not_found", "gone", "forbidden", "client_error", "server_error", "timeout", "dns", "tls", "network",
+}
+
+
+def classify_status(status_code: int) -> tuple[str, str]:
+    """Failure kind and reason for an HTTP error status."""
+    if status_code == 404:
+        return CrawlFailure.PERMANENT, "not_found"
+    if status_code == 410:
+        return CrawlFailure.PERMANENT, "gone"
+    if status_code in (401, 402, 403, 451):
+        return CrawlFailure.PERMANENT, "forbidden"
+    if status_code == 429:
+        return CrawlFailure.TRANSIENT, "rate_limited"
+    if status_code in (408, 425) or status_code >= 500:
+        return CrawlFailure.TRANSIENT, "server_error" if status_code >= 500 else "timeout"
+    return CrawlFailure.PERMANENT, "client_error"
+
+
+def classify_message(message: str) -> tuple[str, str] | None:
+    """Failure kind and reason recognized in an error message, if any."""
+    text = message.lower()
+    if any(marker in text for marker in DNS_ERROR_MARKERS):
+        return CrawlFailure.PERMANENT, "dns"
+    if any(marker in text for marker in TLS_ERROR_MARKERS):
+        return CrawlFailure.PERMANENT, "tls"
+    if any(marker in text for marker in TIMEOUT_ERROR_MARKERS):
+        return CrawlFailure.TRANSIENT, "timeout"
+    if any(marker in text for marker in CONNECT_ERROR_MARKERS):
+        return CrawlFailure.TRANSIENT, "network"
+    return None
+
+
+def is_origin_failure(failure: CrawlFailure) -> bool:
+    """Whether a failure was caused by the site and should count toward its circuit."""
+    if failure.tier not in ORIGIN_TIERS:
+        # Jina and site extractors report their own status codes and timeouts
+        # (quota, auth, X-Timeout), not the article's site
+        return False
+    if failure.reason == "rate_limited":
+        # Only a 429 from the site itself; RateLimited from our own limiter has no status
+        return failure.status_code is not None
+    return failure.reason in ORIGIN_FAILURE_REASONS
+
+
+def classify_exception(exc: BaseException) -> tuple[str, str]:
+    """Failure kind and reason for an exception raised by a crawl tier."""
+    if isinstance(exc, RateLimited):
+        return CrawlFailure.TRANSIENT, "rate_limited"
+    if isinstance(exc, UnsupportedContent):
+        return CrawlFailure.PERMANENT, exc.reason
+    if isinstance(exc, httpx.HTTPStatusError):
+        return classify_status(exc.response.status_code)
+    if isinstance(exc, (httpx.TimeoutException, asyncio.TimeoutError)):
+        return CrawlFailure.TRANSIENT, "timeout"
+
+    chain = []
+    current: BaseException | None = exc
+    while current is not None and len(chain) < 5:
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    if any(isinstance(error, ssl.SSLError) for error in chain):
+        return CrawlFailure.PERMANENT, "tls"
+    recognized = classify_message(" ".join(str(error) for error in chain))
+    if recognized is not None:
+        return recognized
+    if isinstance(exc, httpx.TransportError):
+        return CrawlFailure.TRANSIENT, "network"
+    return CrawlFailure.TRANSIENT, "error"
+
+
 class CrawlError(Exception):
     """Raised when crawling fails after all retries."""
     pass
@@ -66,6 +212,14 @@ class CrawlerService:
     """Crawls story content using crawl4ai."""
 
     JINA_READER_BASE_URL = "https://r.jina.ai/"
+    JINA_READER_HOST = "r.jina.ai"
+    # Jina Reader's published per-minute limits without and with an API key
+    JINA_RPM = 20
+    JINA_RPM_WITH_KEY = 500
+    # Accept header of direct fetches from the origin
+    DIRECT_ACCEPT = "text/html,application/xhtml+xml,application/pdf;q=0.9,*/*;q=0.8"
+    # Tiers raced against each other in hedged mode
+    HEDGED_TIERS = ("jina", "fallback")
 
     def __init__(
         self,
@@ -74,16 +228,54 @@ class CrawlerService:
         use_jina_reader: bool = True,
         jina_timeout: float = 20.0,
         jina_api_key: str | None = None,
+        max_browser_pages: int = 4,
+        fallback_timeout: float = 20.0,
+        http: HttpClient | None = None,
+        cache: ContentCache | None = None,
+        refresh_cache: bool = False,
+        story_budget: float | None = None,
+        domain_stats: DomainStats | None = None,
+        hedge_delay: float | None = None,
+        min_quality: float = 0.5,
+        extractors: ExtractorRegistry | None = None,
+        content_router: ContentRouter | None = None,
     ):
         self.max_retries = max_retries
         self.initial_delay = initial_delay
         self.use_jina_reader = use_jina_reader
         self.jina_timeout = jina_timeout
+        self.fallback_timeout = fallback_timeout
         self.jina_api_key = (
             jina_api_key
             or os.getenv("JINA_READER_API_KEY")
             or os.getenv("JINA_API_KEY")
         )
+        self.browser_pool = BrowserPool(max_pages=max_browser_pages)
+        self._owns_http = http is None
+        self.http = http or HttpClient()
+        # Explicit per-host rates (e.g. from the CLI) take precedence
+        rpm = self.JINA_RPM_WITH_KEY if self.jina_api_key else self.JINA_RPM
+        self.http.set_host_rate(self.JINA_READER_HOST, rpm / 60, burst=max(1, rpm // 4), replace=False)
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.story_budget = story_budget
+        self.domain_stats = domain_stats
+        self.hedge_delay = hedge_delay
+        self.min_quality = min_quality
+        self.content_router = content_router or ContentRouter()
+        self.extractors = ExtractorRegistry.default(self.content_router) if extractors is None else extractors
+
+    async def start(self):
+        """Launch the shared browser ahead of the first crawl."""
+        await self.browser_pool.start()
+
+    async def close(self):
+        """Shut down the shared browser and the HTTP client if owned."""
+        await self.browser_pool.close()
+        if self.domain_stats is not None:
+            self.domain_stats.save()
+        if self._owns_http:
+            await self.http.close()
 
     def _is_hn_url(self, url: str) -> bool:
         """Check if URL is from Hacker News."""
@@ -105,64 +297,337 @@ class CrawlerService:
             CrawlResult with content or error
         """
         url = story.url or f"https://news.ycombinator.com/item?id={story.story_id}"
-        return await self._crawl_with_retry(url, story.title)
+
+        if self.cache is not None and not self.refresh_cache:
+            cached = await self._load_cached(url, story.title)
+            if cached is not None:
+                return cached
+
+        result = await self._crawl_with_retry(url, story.title)
+        if self.cache is not None and result.success:
+            self.cache.put(url, result)
+        return result
 
     async def crawl_url(self, url: str, title: str = "") -> CrawlResult:
         """Crawl a specific URL."""
         return await self._crawl_with_retry(url, title)
 
-    async def _crawl_with_retry(self, url: str, title: str) -> CrawlResult:
-        """Crawl with exponential backoff retry logic."""
-        last_error = None
-        delay = self.initial_delay
+    async def _load_cached(self, url: str, title: str) -> CrawlResult | None:
+        """Return a cached crawl, revalidating it against the origin when possible."""
+        entry = self.cache.get(url)
+        if entry is None:
+            return None
+
+        validators = entry.get("validators") or {}
+        fresh = await self._revalidate(url, title, validators) if validators else None
+        if fresh is None:
+            return ContentCache.to_result(entry, url, title)
+
+        # The page changed: the conditional GET already fetched the new copy
+        if fresh.success:
+            self.cache.put(url, fresh)
+            return fresh
+        self.cache.delete(url)
+        return None
+
+    async def _revalidate(self, url: str, title: str, validators: dict[str, str]) -> CrawlResult | None:
+        """
+        Send a conditional GET for a cached page.
 
-        if self._should_use_jina_reader(url):
-            reader_result = await self._fetch_with_jina_reader(url, title)
-            if reader_result.success:
-                return reader_result
-            last_error = Exception(reader_result.error_message or "Jina Reader fetch failed")
+        Only pages cached from the direct fetch carry validators, so a changed
+        page is turned into a result the same way the direct fetch would.
+
+        Returns:
+            None if the cached copy is still current or the origin is
+            unreachable, otherwise the result built from the new copy
+        """
+        headers = {"Accept": self.DIRECT_ACCEPT}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last-modified"):
+            headers["If-Modified-Since"] = validators["last-modified"]
+
+        try:
+            async with self.http.stream(
+                "GET",
+                url,
+                headers=headers,
+                follow_redirects=True,
+                timeout=self.fallback_timeout,
+            ) as response:
+                if response.status_code == 304:
+                    return None
+                response.raise_for_status()
+                page = await self._read_page(response)
+            return await self._page_result(url, title, *page)
+        except httpx.HTTPStatusError as e:
+            kind, reason = classify_exception(e)
+            return self._failed(url, title, CrawlFailure(kind, reason, "fallback", self._status_of(e), str(e)))
+        except UnsupportedContent as e:
+            return self._failed(url, title, CrawlFailure(CrawlFailure.PERMANENT, e.reason, "fallback", detail=str(e)))
+        except Exception:
+            # Keep serving the cached copy when the origin is unreachable
+            return None
+
+    @staticmethod
+    def _extract_validators(headers) -> dict[str, str]:
+        """Pick cache validators out of response headers."""
+        return {
+            name: headers[name]
+            for name in ("etag", "last-modified")
+            if headers.get(name)
+        }
 
+    async def _crawl_with_retry(self, url: str, title: str) -> CrawlResult:
+        """
+        Walk the crawl tiers until one succeeds, within the per-story time budget.
+
+        The tiers are a site-specific extractor (URLs it matches, e.g. GitHub
+        or arXiv), Jina Reader (external URLs only), the browser with
+        jittered exponential backoff retries of transient failures, and a
+        plain httpx fetch. With domain stats, tiers whose circuit is open for
+        the URL's domain are skipped and the rest are tried likeliest first.
+        An origin that does not resolve, answers 404/410 or serves a binary
+        or oversized body ends the ladder, and PDFs never reach the browser.
+
+        In hedged mode Jina Reader and the httpx fetch race each other,
+        staggered by ``hedge_delay``, and the first result that passes the
+        content quality check wins; the browser only runs if neither does.
+        """
+        deadline = self._budget_deadline()
+        domain = domain_of(url)
+        tiers = self._tiers_for(url)
+        if self.domain_stats is not None:
+            tiers = self.domain_stats.tier_order(domain, tiers)
+            if not tiers:
+                return self._failed(url, title, CrawlFailure(
+                    CrawlFailure.TRANSIENT,
+                    "circuit_open",
+                    detail=f"every tier keeps failing on {domain}",
+                ))
+
+        failures: list[CrawlFailure] = []
+        weak: CrawlResult | None = None
+        for step in self._plan_steps(tiers):
+            if self._budget_exhausted(deadline):
+                break
+            if step == ("browser",) and any(f.reason in PDF_FAILURE_REASONS for f in failures):
+                continue
+            if len(step) == 1:
+                attempts = [await self._attempt(step[0], url, title, deadline)]
+            else:
+                attempts = await self._race(step, url, title, deadline)
+            for result, failure in attempts:
+                if failure is None:
+                    return result
+                failures.append(failure)
+                # Keep the best page that failed only the quality check as a last resort
+                if result.success and (
+                    weak is None or score_content(result.markdown_content) > score_content(weak.markdown_content)
+                ):
+                    weak = result
+            if any(
+                (f.tier in ORIGIN_TIERS and f.reason in LADDER_STOPPING_REASONS)
+                or (f.tier != "jina" and f.reason in CONTENT_STOPPING_REASONS)
+                for f in failures
+            ):
+                break
+
+        if weak is not None:
+            return weak
+        if self._budget_exhausted(deadline) and not any(f.reason == "budget_exhausted" for f in failures):
+            failures.append(CrawlFailure(
+                CrawlFailure.TRANSIENT,
+                "budget_exhausted",
+                detail=f"story time budget of {self.story_budget:g}s",
+            ))
+        result = CrawlResult(url=url, title=title, markdown_content="", success=False, failures=tuple(failures))
+        return replace(result, error_message=result.failure.describe() if result.failure else "No crawl tier available")
+
+    def _plan_steps(self, tiers: list[str]) -> list[tuple[str, ...]]:
+        """Group tiers into steps; in hedged mode Jina and httpx share one step ahead of the browser."""
+        raced = tuple(tier for tier in tiers if tier in self.HEDGED_TIERS)
+        if self.hedge_delay is None or len(raced) < 2:
+            return [(tier,) for tier in tiers]
+        return [raced] + [(tier,) for tier in tiers if tier not in raced]
+
+    async def _attempt(
+        self,
+        tier: str,
+        url: str,
+        title: str,
+        deadline: float | None,
+        min_quality: float | None = None,
+    ) -> tuple[CrawlResult, CrawlFailure | None]:
+        """Run one tier, judge its result and record successes and origin failures in the domain stats."""
+        started = time.monotonic()
+        result = await self._run_named_tier(tier, url, title, deadline)
+        failure = None
+        if not result.success:
+            failure = self._tier_failure(result, tier)
+        elif min_quality is not None:
+            quality = score_content(result.markdown_content)
+            if quality < min_quality:
+                failure = CrawlFailure(CrawlFailure.CONTENT, "low_quality", tier, detail=f"quality {quality:.2f}")
+
+        if self.domain_stats is not None and (failure is None or is_origin_failure(failure)):
+            self.domain_stats.record(
+                domain_of(url),
+                tier,
+                failure is None,
+                time.monotonic() - started,
+                failure.reason if failure else None,
+            )
+        return result, failure
+
+    async def _race(
+        self, tiers: tuple[str, ...], url: str, title: str, deadline: float | None
+    ) -> list[tuple[CrawlResult, CrawlFailure | None]]:
+        """Race tiers staggered by ``hedge_delay``; returns the attempts that finished, winner last."""
+        finished = []
+
+        async def run(tier: str):
+            attempt = await self._attempt(tier, url, title, deadline, self.min_quality)
+            finished.append(attempt)
+            return attempt
+
+        outcome = await race_hedged(
+            [(tier, partial(run, tier)) for tier in tiers],
+            self.hedge_delay,
+            accept=lambda attempt: attempt[1] is None,
+        )
+        latencies = ", ".join(f"{tier} {elapsed:.2f}s" for tier, elapsed in outcome.latencies.items())
+        logger.info(
+            "[CRAWL] %s: %s (%s)",
+            url,
+            f"{outcome.source} won" if outcome.accepted else "no acceptable result",
+            latencies or "no response",
+        )
+        for tier, error in outcome.errors.items():
+            failure = CrawlFailure(CrawlFailure.TRANSIENT, "error", tier, detail=error)
+            finished.append((self._failed(url, title, failure), failure))
+        return finished
+
+    def _tiers_for(self, url: str) -> list[str]:
+        """Default tier order for a URL."""
+        tiers = ["extractor"] if self.extractors.find(url) else []
+        if self._should_use_jina_reader(url):
+            tiers.append("jina")
+        if PdfExtractor.pattern.match(url):
+            # Chromium downloads PDFs instead of rendering them
+            return tiers + ["fallback"]
+        return tiers + ["browser", "fallback"]
+
+    async def _run_named_tier(self, tier: str, url: str, title: str, deadline: float | None) -> CrawlResult:
+        if tier == "extractor":
+            return await self._run_tier(self._fetch_with_extractor(url, title), url, title, deadline)
+        if tier == "jina":
+            return await self._run_tier(self._fetch_with_jina_reader(url, title), url, title, deadline)
+        if tier == "browser":
+            return await self._crawl_with_browser(url, title, deadline)
+        return await self._run_tier(self._fallback_fetch(url, title), url, title, deadline)
+
+    async def _crawl_with_browser(self, url: str, title: str, deadline: float | None) -> CrawlResult:
+        """Crawl on the browser, retrying transient failures with jittered exponential backoff."""
+        delay = self.initial_delay
+        result = None
         for attempt in range(self.max_retries):
+            if self._budget_exhausted(deadline):
+                break
             try:
-                result = await self._do_crawl(url, title)
+                result = await self._run_tier(self._do_crawl(url, title), url, title, deadline)
             except Exception as exc:
-                result = CrawlResult(
-                    url=url,
-                    title=title,
-                    markdown_content="",
-                    success=False,
-                    error_message=f"Crawl raised exception: {exc}",
-                )
+                kind, reason = classify_exception(exc)
+                result = self._failed(url, title, CrawlFailure(kind, reason, "browser", detail=str(exc)))
 
             if result.success:
                 return result
+            failure = self._tier_failure(result, "browser")
+            if not failure.retryable or attempt == self.max_retries - 1:
+                break
+            # Equal jitter: keep half the backoff, randomize the rest
+            await asyncio.sleep(self._clamp_to_budget(delay / 2 + random.uniform(0, delay / 2), deadline))
+            delay *= 2
+
+        if result is None:
+            return self._failed(url, title, CrawlFailure(CrawlFailure.TRANSIENT, "budget_exhausted", "browser"))
+        return result
+
+    @staticmethod
+    def _tier_failure(result: CrawlResult, tier: str) -> CrawlFailure:
+        """The failure a tier reported, attributed to that tier."""
+        failure = result.failure or CrawlFailure(
+            CrawlFailure.TRANSIENT, "error", detail=result.error_message or ""
+        )
+        return failure if failure.tier == tier else replace(failure, tier=tier)
 
-            last_error = Exception(result.error_message or "Unknown crawl error")
-            if attempt < self.max_retries - 1:
-                await asyncio.sleep(delay)
-                delay *= 2  # Exponential backoff
-
-        fallback_result = await self._fallback_fetch(url, title)
-        if fallback_result.success:
-            return fallback_result
-
-        fallback_error = fallback_result.error_message or "Fallback fetch failed"
-
+    @staticmethod
+    def _failed(url: str, title: str, failure: CrawlFailure) -> CrawlResult:
+        """An unsuccessful CrawlResult carrying one structured failure."""
         return CrawlResult(
             url=url,
             title=title,
             markdown_content="",
             success=False,
-            error_message=(
-                f"Crawling failed after {self.max_retries} attempts: {str(last_error)}; "
-                f"{fallback_error}"
-            )
+            error_message=failure.describe(),
+            failures=(failure,),
+        )
+
+    def _budget_deadline(self) -> float | None:
+        """Event loop time at which the current story's budget runs out."""
+        if self.story_budget is None:
+            return None
+        return asyncio.get_running_loop().time() + self.story_budget
+
+    @staticmethod
+    def _budget_exhausted(deadline: float | None) -> bool:
+        return deadline is not None and asyncio.get_running_loop().time() >= deadline
+
+    @staticmethod
+    def _clamp_to_budget(delay: float, deadline: float | None) -> float:
+        """Shorten a backoff sleep so it never outlasts the story budget."""
+        if deadline is None:
+            return delay
+        return max(0.0, min(delay, deadline - asyncio.get_running_loop().time()))
+
+    async def _run_tier(self, attempt, url: str, title: str, deadline: float | None) -> CrawlResult:
+        """Await one crawl tier, cutting it off when the story budget runs out."""
+        if deadline is None:
+            return await attempt
+        try:
+            return await asyncio.wait_for(attempt, max(0.0, deadline - asyncio.get_running_loop().time()))
+        except asyncio.TimeoutError:
+            return self._failed(url, title, CrawlFailure(
+                CrawlFailure.TRANSIENT,
+                "budget_exhausted",
+                detail=f"story time budget of {self.story_budget:g}s",
+            ))
+
+    async def _fetch_with_extractor(self, url: str, title: str) -> CrawlResult:
+        """Fetch a page's canonical representation with its site-specific extractor."""
+        extractor, match = self.extractors.find(url)
+        try:
+            extracted_title, markdown = await extractor.fetch(match, self.http, self.fallback_timeout)
+        except Exception as exc:
+            kind, reason = classify_exception(exc)
+            return self._failed(url, title, CrawlFailure(kind, reason, extractor.name, self._status_of(exc), str(exc)))
+
+        markdown = clean_markdown_content(markdown)
+        if len(markdown) < 100:
+            return self._failed(url, title, CrawlFailure(
+                CrawlFailure.CONTENT, "insufficient_content", extractor.name, detail=f"{len(markdown)} characters"
+            ))
+        return CrawlResult(
+            url=url,
+            title=title or extracted_title,
+            markdown_content=markdown,
+            success=True,
+            tier=extractor.name,
         )
 
     async def _fetch_with_jina_reader(self, url: str, title: str) -> CrawlResult:
         """Fetch article markdown via Jina Reader."""
         headers = {
-            "User-Agent": "hn-daily/1.0",
             "Accept": "text/plain",
             "X-Timeout": str(int(self.jina_timeout)),
         }
@@ -173,45 +638,39 @@ class CrawlerService:
         reader_url = f"{self.JINA_READER_BASE_URL}{url}"
 
         try:
-            async with httpx.AsyncClient(
+            async with self.http.stream(
+                "GET",
+                reader_url,
                 headers=headers,
                 follow_redirects=True,
                 timeout=self.jina_timeout,
-            ) as client:
-                response = await client.get(reader_url)
+            ) as response:
                 response.raise_for_status()
-                markdown = clean_markdown_content(response.text)
+                body = await self.content_router.read(response)
+                encoding = response.charset_encoding
+            if body.kind == "pdf":
+                raise ValueError("Jina Reader returned a PDF")
+            markdown = clean_markdown_content(body.text(encoding))
 
             if len(markdown) < 100:
-                return CrawlResult(
-                    url=url,
-                    title=title,
-                    markdown_content="",
-                    success=False,
-                    error_message="Jina Reader returned insufficient content",
-                )
+                return self._failed(url, title, CrawlFailure(
+                    CrawlFailure.CONTENT, "insufficient_content", "jina", detail=f"{len(markdown)} characters"
+                ))
 
             return CrawlResult(
                 url=url,
                 title=title,
                 markdown_content=markdown,
                 success=True,
+                tier="jina",
             )
         except Exception as exc:
-            return CrawlResult(
-                url=url,
-                title=title,
-                markdown_content="",
-                success=False,
-                error_message=f"Jina Reader fetch failed: {exc}",
-            )
+            kind, reason = classify_exception(exc)
+            return self._failed(url, title, CrawlFailure(kind, reason, "jina", self._status_of(exc), str(exc)))
 
     async def _do_crawl(self, url: str, title: str) -> CrawlResult:
-        """Perform the actual crawl."""
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False
-        )
+        """Perform the actual crawl on a page of the shared browser."""
+        from crawl4ai import CrawlerRunConfig, CacheMode
 
         # Apply CSS selector for HN URLs to extract only toptext content
         css_selector = "div.toptext" if self._is_hn_url(url) else None
@@ -223,7 +682,7 @@ class CrawlerService:
             css_selector=css_selector
         )
 
-        async with AsyncWebCrawler(config=browser_config) as crawler:
+        async with self.browser_pool.page() as crawler:
             result = await crawler.arun(
                 url=url,
                 config=crawler_config
@@ -235,60 +694,74 @@ class CrawlerService:
                 extracted_title = first_line[:100] if len(first_line) > 3 else title
                 cleaned_content = clean_markdown_content(result.markdown) if result.markdown else ""
                 if len(cleaned_content) < 100:
-                    return CrawlResult(
-                        url=url,
-                        title=title,
-                        markdown_content="",
-                        success=False,
-                        error_message="Crawl returned insufficient content"
-                    )
+                    return self._failed(url, title, CrawlFailure(
+                        CrawlFailure.CONTENT, "insufficient_content", "browser", detail=f"{len(cleaned_content)} characters"
+                    ))
                 return CrawlResult(
                     url=url,
                     title=title or extracted_title,
                     markdown_content=cleaned_content,
-                    success=True
+                    success=True,
+                    tier="browser",
                 )
             else:
-                return CrawlResult(
-                    url=url,
-                    title=title,
-                    markdown_content="",
-                    success=False,
-                    error_message=result.error_message or "Unknown crawl error"
-                )
+                message = result.error_message or "Unknown crawl error"
+                status_code = getattr(result, "status_code", None)
+                if isinstance(status_code, int) and status_code >= 400:
+                    kind, reason = classify_status(status_code)
+                else:
+                    status_code = None
+                    kind, reason = classify_message(message) or (CrawlFailure.TRANSIENT, "browser_error")
+                return self._failed(url, title, CrawlFailure(kind, reason, "browser", status_code, message))
 
     async def _fallback_fetch(self, url: str, title: str) -> CrawlResult:
-        """Fetch content with httpx when crawl4ai fails."""
+        """Fetch content with httpx when crawl4ai fails, routing the body by its content type."""
         try:
-            headers = {
-                "User-Agent": "hn-daily/1.0",
-                "Accept": "text/html,application/xhtml+xml"
-            }
-            async with httpx.AsyncClient(headers=headers, follow_redirects=True, timeout=20.0) as client:
-                response = await client.get(url)
+            async with self.http.stream(
+                "GET",
+                url,
+                headers={"Accept": self.DIRECT_ACCEPT},
+                follow_redirects=True,
+                timeout=self.fallback_timeout,
+            ) as response:
                 response.raise_for_status()
-                markdown = html_to_markdown(response.text)
-                cleaned_content = clean_markdown_content(markdown) if markdown else ""
-                if not cleaned_content:
-                    return CrawlResult(
-                        url=url,
-                        title=title,
-                        markdown_content="",
-                        success=False,
-                        error_message="Fallback fetch returned empty content"
-                    )
-                return CrawlResult(
-                    url=url,
-                    title=title,
-                    markdown_content=cleaned_content,
-                    success=True,
-                    is_fallback=True
-                )
+                page = await self._read_page(response)
+            return await self._page_result(url, title, *page)
         except Exception as e:
-            return CrawlResult(
-                url=url,
-                title=title,
-                markdown_content="",
-                success=False,
-                error_message=f"Fallback fetch failed: {e}"
-            )
+            kind, reason = classify_exception(e)
+            return self._failed(url, title, CrawlFailure(kind, reason, "fallback", self._status_of(e), str(e)))
+
+    async def _read_page(self, response: httpx.Response) -> tuple[RoutedBody, str | None, dict[str, str]]:
+        """Read a streamed origin response: its routed body, charset and cache validators."""
+        body = await self.content_router.read(response)
+        return body, response.charset_encoding, self._extract_validators(response.headers)
+
+    async def _page_result(
+        self, url: str, title: str, body: RoutedBody, encoding: str | None, validators: dict[str, str]
+    ) -> CrawlResult:
+        """Turn a body fetched straight from the origin into a direct-fetch result."""
+        if body.kind == "pdf":
+            pdf_title, markdown = await asyncio.to_thread(self.content_router.pdf_to_markdown, body.content)
+            title = title or pdf_title
+        elif body.kind == "html":
+            markdown = html_to_markdown(body.text(encoding))
+        else:
+            markdown = body.text(encoding)
+        cleaned_content = clean_markdown_content(markdown) if markdown else ""
+        if not cleaned_content:
+            return self._failed(url, title, CrawlFailure(CrawlFailure.CONTENT, "empty_content", "fallback"))
+        if body.truncated:
+            logger.info("[CRAWL] %s: body cut off at %d bytes", url, len(body.content))
+        return CrawlResult(
+            url=url,
+            title=title,
+            markdown_content=cleaned_content,
+            success=True,
+            is_fallback=True,
+            tier="fallback",
+            validators=validators,
+        )
+
+    @staticmethod
+    def _status_of(exc: BaseException) -> int | None:
+        return exc.response.status_code if isinstance(exc, httpx.HTTPStatusError) else None
@@ -0,0 +1,146 @@
+"""Per-domain crawl outcomes driving tier order and circuit breaking."""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+def domain_of(url: str) -> str:
+    """Domain a URL's stats are kept under, e.g. ``nytimes.com``."""
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+@dataclass
+class TierStats:
+    """Outcomes of one crawl tier on one domain."""
+    attempts: int = 0
+    successes: int = 0
+    consecutive_failures: int = 0
+    # Exponentially weighted, so recent behavior dominates
+    success_rate: float = 0.5
+    mean_latency: float = 0.0
+    last_failure_at: float = 0.0
+    reasons: dict[str, int] = field(default_factory=dict)
+
+
+class DomainStats:
+    """
+    Success rates, latencies and failure reasons per domain and crawl tier.
+
+    A tier whose last ``failure_threshold`` attempts on a domain all failed
+    is skipped (its circuit is open) until ``cooldown`` seconds have passed
+    since the last failure; the next attempt then decides whether it closes
+    again. The remaining tiers are tried in order of recent success rate,
+    keeping the default order between tiers with equal records. Stats are
+    kept in a JSON file, trimmed to the ``max_domains`` most recently seen
+    domains.
+    """
+
+    SMOOTHING = 0.5
+    MAX_REASONS = 8
+
+    def __init__(
+        self,
+        path: str = ".cache/hn-daily/domains.json",
+        failure_threshold: int = 3,
+        cooldown: float = 6 * 3600,
+        max_domains: int = 5000,
+    ):
+        self.path = Path(path)
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_domains = max_domains
+        self._domains: dict[str, dict[str, TierStats]] = {}
+        self._seen_at: dict[str, float] = {}
+        self._load()
+
+    def get(self, domain: str, tier: str) -> Optional[TierStats]:
+        """Stats of a tier on a domain, if it has been tried."""
+        return self._domains.get(domain, {}).get(tier)
+
+    def is_open(self, domain: str, tier: str) -> bool:
+        """Whether a tier keeps failing on a domain and should be skipped for now."""
+        stats = self.get(domain, tier)
+        return (
+            stats is not None
+            and stats.consecutive_failures >= self.failure_threshold
+            and time.time() - stats.last_failure_at < self.cooldown
+        )
+
+    def tier_order(self, domain: str, tiers: list[str]) -> list[str]:
+        """
+        Order tiers for a domain, dropping those whose circuit is open.
+
+        Args:
+            domain: Domain being crawled
+            tiers: Tiers in their default order
+
+        Returns:
+            The tiers to try, likeliest to succeed first
+        """
+        prior = TierStats().success_rate
+        allowed = [tier for tier in tiers if not self.is_open(domain, tier)]
+        return sorted(
+            allowed,
+            key=lambda tier: -(self.get(domain, tier) or TierStats(success_rate=prior)).success_rate,
+        )
+
+    def record(self, domain: str, tier: str, success: bool, latency: float, reason: Optional[str] = None):
+        """Record the outcome of one tier on a domain."""
+        stats = self._domains.setdefault(domain, {}).setdefault(tier, TierStats())
+        self._seen_at[domain] = time.time()
+        stats.attempts += 1
+        stats.success_rate += self.SMOOTHING * (float(success) - stats.success_rate)
+        stats.mean_latency = latency if stats.attempts == 1 else (
+            stats.mean_latency + self.SMOOTHING * (latency - stats.mean_latency)
+        )
+        if success:
+            stats.successes += 1
+            stats.consecutive_failures = 0
+            return
+
+        stats.consecutive_failures += 1
+        stats.last_failure_at = time.time()
+        if reason:
+            stats.reasons[reason] = stats.reasons.get(reason, 0) + 1
+            if len(stats.reasons) > self.MAX_REASONS:
+                del stats.reasons[min(stats.reasons, key=stats.reasons.get)]
+
+    def save(self):
+        """Write the stats file, keeping the most recently seen domains."""
+        recent = sorted(self._domains, key=lambda domain: self._seen_at.get(domain, 0), reverse=True)
+        data = {
+            domain: {
+                "seen_at": self._seen_at.get(domain, 0),
+                "tiers": {tier: asdict(stats) for tier, stats in self._domains[domain].items()},
+            }
+            for domain in recent[:self.max_domains]
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict):
+            return
+        for domain, entry in data.items():
+            try:
+                self._domains[domain] = {
+                    tier: TierStats(**stats) for tier, stats in entry["tiers"].items()
+                }
+                self._seen_at[domain] = float(entry.get("seen_at", 0))
+            except (KeyError, TypeError, AttributeError, ValueError):
+                continue
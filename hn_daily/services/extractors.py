@@ -0,0 +1,268 @@
+"""Site-specific extractors that fetch a page's cheap canonical representation."""
+
+import asyncio
+import os
+import re
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+from .content_router import ContentRouter
+from .http_client import HttpClient
+
+
+class Extractor:
+    """
+    Base class for site-specific extractors.
+
+    Subclasses set ``name`` (reported as the crawl tier) and ``pattern``,
+    matched against the story URL, and implement ``fetch``.
+    """
+
+    name = "extractor"
+    pattern: re.Pattern
+
+    def match(self, url: str) -> Optional[re.Match]:
+        return self.pattern.match(url)
+
+    async def fetch(self, match: re.Match, http: HttpClient, timeout: float) -> tuple[str, str]:
+        """
+        Fetch the page behind a matched URL.
+
+        Args:
+            match: Result of matching ``pattern`` against the URL
+            http: Shared HTTP client
+            timeout: Request timeout in seconds
+
+        Returns:
+            (title, markdown); the title may be empty
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            ValueError: If the response cannot be parsed
+        """
+        raise NotImplementedError
+
+
+class GitHubExtractor(Extractor):
+    """Base for GitHub extractors, sending a token from GITHUB_TOKEN when set."""
+
+    API_URL = "https://api.github.com"
+
+    def __init__(self, token: Optional[str] = None):
+        self.token = token or os.getenv("GITHUB_TOKEN")
+
+    def _headers(self, accept: str) -> dict[str, str]:
+        headers = {"Accept": accept, "X-GitHub-Api-Version": "2022-11-28"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+
+class GitHubRepoExtractor(GitHubExtractor):
+    """Repository front pages: the raw README instead of the rendered page."""
+
+    name = "github"
+    pattern = re.compile(
+        r"https?://(?:www\.)?github\.com/(?P<owner>[\w.-]+)/(?P<repo>[\w.-]+?)(?:\.git)?/?(?:[?#].*)?$"
+    )
+    # First path segments that are GitHub pages, not users
+    RESERVED_OWNERS = {"orgs", "settings", "topics", "trending", "collections", "sponsors", "features", "marketplace"}
+
+    def match(self, url: str) -> Optional[re.Match]:
+        match = super().match(url)
+        return match if match and match["owner"].lower() not in self.RESERVED_OWNERS else None
+
+    async def fetch(self, match: re.Match, http: HttpClient, timeout: float) -> tuple[str, str]:
+        owner, repo = match["owner"], match["repo"]
+        response = await http.get(
+            f"{self.API_URL}/repos/{owner}/{repo}/readme",
+            headers=self._headers("application/vnd.github.raw+json"),
+            follow_redirects=True,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return f"{owner}/{repo}", response.text
+
+
+class GitHubFileExtractor(Extractor):
+    """Files viewed on GitHub (``/blob/``): the raw file."""
+
+    name = "github"
+    pattern = re.compile(
+        r"https?://(?:www\.)?github\.com/(?P<owner>[\w.-]+)/(?P<repo>[\w.-]+)/blob/(?P<path>[^?#]+)"
+        r"\.(?P<ext>md|markdown|rst|txt)(?:[?#].*)?$",
+        re.IGNORECASE,
+    )
+    RAW_URL = "https://raw.githubusercontent.com"
+
+    async def fetch(self, match: re.Match, http: HttpClient, timeout: float) -> tuple[str, str]:
+        path = f"{match['path']}.{match['ext']}"
+        response = await http.get(
+            f"{self.RAW_URL}/{match['owner']}/{match['repo']}/{path}",
+            follow_redirects=True,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return path.rsplit("/", 1)[-1], response.text
+
+
+class GitHubIssueExtractor(GitHubExtractor):
+    """Issues and pull requests: the issue JSON from the REST API."""
+
+    name = "github"
+    pattern = re.compile(
+        r"https?://(?:www\.)?github\.com/(?P<owner>[\w.-]+)/(?P<repo>[\w.-]+)/(?:issues|pull)/(?P<number>\d+)"
+        r"/?(?:[?#].*)?$"
+    )
+
+    async def fetch(self, match: re.Match, http: HttpClient, timeout: float) -> tuple[str, str]:
+        response = await http.get(
+            f"{self.API_URL}/repos/{match['owner']}/{match['repo']}/issues/{match['number']}",
+            headers=self._headers("application/vnd.github+json"),
+            follow_redirects=True,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        issue = response.json()
+        title = issue.get("title") or ""
+        kind = "Pull request" if issue.get("pull_request") else "Issue"
+        author = (issue.get("user") or {}).get("login", "unknown")
+        lines = [
+            f"# {title}",
+            "",
+            f"{kind} #{match['number']} in {match['owner']}/{match['repo']} by {author} ({issue.get('state', 'open')})",
+            "",
+            (issue.get("body") or "").strip(),
+        ]
+        return title, "\n".join(lines).strip()
+
+
+class ArxivExtractor(Extractor):
+    """arXiv papers (abstract, PDF or HTML links): the abstract from the export API."""
+
+    name = "arxiv"
+    pattern = re.compile(
+        r"https?://(?:www\.|export\.)?arxiv\.org/(?:abs|pdf|html)/"
+        r"(?P<id>\d{4}\.\d{4,5}|[a-z-]+(?:\.[A-Z]{2})?/\d{7})(?P<version>v\d+)?(?:\.pdf)?/?(?:[?#].*)?$"
+    )
+    API_URL = "https://export.arxiv.org/api/query"
+    ATOM = "{http://www.w3.org/2005/Atom}"
+
+    async def fetch(self, match: re.Match, http: HttpClient, timeout: float) -> tuple[str, str]:
+        paper_id = match["id"] + (match["version"] or "")
+        response = await http.get(self.API_URL, params={"id_list": paper_id}, timeout=timeout)
+        response.raise_for_status()
+        return self.parse_feed(response.text, paper_id)
+
+    def parse_feed(self, xml: str, paper_id: str) -> tuple[str, str]:
+        """Turn an arXiv Atom feed with one entry into (title, markdown)."""
+        try:
+            entry = ET.fromstring(xml).find(f"{self.ATOM}entry")
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid arXiv feed: {e}")
+        if entry is None or entry.find(f"{self.ATOM}summary") is None:
+            raise ValueError(f"arXiv has no entry for {paper_id}")
+
+        def text(tag: str) -> str:
+            return " ".join((entry.findtext(f"{self.ATOM}{tag}") or "").split())
+
+        title = text("title")
+        authors = ", ".join(
+            " ".join((author.findtext(f"{self.ATOM}name") or "").split())
+            for author in entry.findall(f"{self.ATOM}author")
+        )
+        lines = [
+            f"# {title}",
+            "",
+            f"*{authors}*" if authors else "",
+            "",
+            f"arXiv:{paper_id}, submitted {text('published')[:10]}",
+            "",
+            "## Abstract",
+            "",
+            text("summary"),
+            "",
+            f"[PDF](https://arxiv.org/pdf/{paper_id})",
+        ]
+        return title, "\n".join(lines).strip()
+
+
+class PlainTextExtractor(Extractor):
+    """Plain-text and markdown files: the body as is, up to the router's text limit."""
+
+    name = "text"
+    pattern = re.compile(r"https?://[^?#]+\.(?:txt|md|markdown|rst)(?:[?#].*)?$", re.IGNORECASE)
+
+    def __init__(self, router: Optional[ContentRouter] = None):
+        self.router = router or ContentRouter()
+
+    async def fetch(self, match: re.Match, http: HttpClient, timeout: float) -> tuple[str, str]:
+        async with http.stream("GET", match.string, follow_redirects=True, timeout=timeout) as response:
+            response.raise_for_status()
+            body = await self.router.read(response)
+            encoding = response.charset_encoding
+        if body.kind != "text":
+            raise ValueError(f"Expected a text file, got {body.content_type or body.kind}")
+        return "", body.text(encoding)
+
+
+class PdfExtractor(Extractor):
+    """PDF links: the text of the first pages, instead of rendering the PDF in a browser."""
+
+    name = "pdf"
+    pattern = re.compile(r"https?://[^?#]+\.pdf(?:[?#].*)?$", re.IGNORECASE)
+
+    def __init__(self, router: Optional[ContentRouter] = None):
+        self.router = router or ContentRouter()
+
+    def match(self, url: str) -> Optional[re.Match]:
+        # Without pypdf, PDF links are left to Jina Reader
+        return super().match(url) if self.router.can_read_pdf() else None
+
+    async def fetch(self, match: re.Match, http: HttpClient, timeout: float) -> tuple[str, str]:
+        async with http.stream("GET", match.string, follow_redirects=True, timeout=timeout) as response:
+            response.raise_for_status()
+            body = await self.router.read(response)
+        if body.kind != "pdf":
+            raise ValueError(f"Expected a PDF, got {body.content_type or body.kind}")
+        return await asyncio.to_thread(self.router.pdf_to_markdown, body.content)
+
+
+class ExtractorRegistry:
+    """
+    Site-specific extractors, tried in order against a story URL.
+
+    The first extractor whose pattern matches handles the URL. Extractors
+    added with ``register(..., first=True)`` take precedence over the
+    built-ins.
+    """
+
+    def __init__(self, extractors: Optional[list[Extractor]] = None):
+        self.extractors = list(extractors or [])
+
+    @classmethod
+    def default(cls, router: Optional[ContentRouter] = None) -> "ExtractorRegistry":
+        """Registry with the built-in GitHub, arXiv, plain-text and PDF extractors."""
+        return cls([
+            GitHubIssueExtractor(),
+            GitHubFileExtractor(),
+            GitHubRepoExtractor(),
+            ArxivExtractor(),
+            PlainTextExtractor(router),
+            PdfExtractor(router),
+        ])
+
+    def register(self, extractor: Extractor, first: bool = False):
+        """Add an extractor, ahead of the others if ``first``."""
+        if first:
+            self.extractors.insert(0, extractor)
+        else:
+            self.extractors.append(extractor)
+
+    def find(self, url: str) -> Optional[tuple[Extractor, re.Match]]:
+        """The extractor handling a URL and its match, if any."""
+        for extractor in self.extractors:
+            match = extractor.match(url)
+            if match is not None:
+                return extractor, match
+        return None
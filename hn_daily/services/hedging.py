@@ -0,0 +1,91 @@
+"""Hedged requests: race staggered attempts and keep the first good result."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+
+@dataclass
+class HedgeOutcome:
+    """Result of a hedged race."""
+    source: Optional[str]
+    value: Any
+    accepted: bool
+    latencies: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+async def race_hedged(
+    attempts: list[tuple[str, Callable[[], Awaitable[Any]]]],
+    hedge_delay: Optional[float],
+    accept: Callable[[Any], bool],
+) -> HedgeOutcome:
+    """
+    Run attempts staggered by ``hedge_delay`` and return the first accepted result.
+
+    The first attempt starts immediately. Each following attempt starts once
+    ``hedge_delay`` seconds pass without an accepted result, or as soon as every
+    running attempt has finished without one. When an attempt is accepted the
+    others are cancelled. With ``hedge_delay=None`` attempts run strictly one
+    after another.
+
+    Args:
+        attempts: (source name, zero-argument coroutine factory) pairs in
+            preference order
+        hedge_delay: Seconds to wait before starting the next attempt
+        accept: Predicate deciding whether a result is good enough to win
+
+    Returns:
+        HedgeOutcome with the winning source, or, if nothing was accepted, the
+        first result that completed without raising (``accepted=False``)
+    """
+    loop = asyncio.get_running_loop()
+    pending_attempts = list(attempts)
+    running: dict[asyncio.Task, tuple[str, float]] = {}
+    outcome = HedgeOutcome(source=None, value=None, accepted=False)
+    fallback: Optional[tuple[str, Any]] = None
+
+    def launch():
+        source, factory = pending_attempts.pop(0)
+        running[asyncio.ensure_future(factory())] = (source, time.perf_counter())
+
+    launch()
+    next_launch_at = loop.time() + hedge_delay if hedge_delay is not None else None
+
+    try:
+        while running:
+            timeout = None
+            if pending_attempts and next_launch_at is not None:
+                timeout = max(0.0, next_launch_at - loop.time())
+
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                source, started = running.pop(task)
+                outcome.latencies[source] = time.perf_counter() - started
+                try:
+                    value = task.result()
+                except Exception as exc:
+                    outcome.errors[source] = str(exc) or type(exc).__name__
+                    continue
+                if accept(value):
+                    outcome.source = source
+                    outcome.value = value
+                    outcome.accepted = True
+                    return outcome
+                if fallback is None:
+                    fallback = (source, value)
+
+            if pending_attempts and (not running or (next_launch_at is not None and loop.time() >= next_launch_at)):
+                launch()
+                next_launch_at = loop.time() + hedge_delay if hedge_delay is not None else None
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    if fallback is not None:
+        outcome.source, outcome.value = fallback
+    return outcome
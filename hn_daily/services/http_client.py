@@ -0,0 +1,158 @@
+"""Shared HTTP transport for all hn-daily services."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
+from typing import AsyncIterator, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .rate_limiter import RateLimited, RateLimiter, parse_retry_after
+
+
+DEFAULT_HEADERS = {"User-Agent": "hn-daily/1.0"}
+
+
+class HttpClient:
+    """
+    One pooled ``httpx.AsyncClient`` shared by every service in a run.
+
+    Connections are kept alive and reused across services, HTTP/2 is
+    negotiated when the ``h2`` package is installed, gzip/deflate (plus br
+    and zstd when their decoders are installed) are advertised by httpx, and
+    each host gets its own cap on concurrent requests so one busy host
+    cannot starve the rest.
+
+    Requests are also paced per host by a RateLimiter. A 429 or 503 with a
+    Retry-After holds the whole host back for that long; the request is
+    retried when the wait is at most ``max_retry_after`` seconds, and later
+    requests fail fast with RateLimited while a longer wait is pending.
+    """
+
+    RATE_LIMIT_STATUSES = {429, 503}
+    # Host back-off after a 429 that names no Retry-After
+    DEFAULT_RATE_LIMIT_BACKOFF = 1.0
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        http2: bool = True,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        keepalive_expiry: float = 30.0,
+        max_connections_per_host: int = 6,
+        host_connections: Optional[dict[str, int]] = None,
+        host_rates: Optional[dict[str, float]] = None,
+        max_retry_after: float = 30.0,
+        rate_limit_retries: int = 2,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            timeout: Default request timeout in seconds
+            http2: Negotiate HTTP/2 when the ``h2`` package is installed
+            max_connections: Total connection pool size
+            max_keepalive_connections: Idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept
+            max_connections_per_host: Concurrent requests per host
+            host_connections: Per-host overrides of ``max_connections_per_host``
+            host_rates: Requests per second by host
+            max_retry_after: Longest Retry-After that is waited out and retried
+            rate_limit_retries: Retries of one request after Retry-After waits
+        """
+        self.timeout = timeout
+        self.http2 = http2 and find_spec("h2") is not None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.host_connections = {host.lower(): max(1, limit) for host, limit in (host_connections or {}).items()}
+        self.rate_limiter = RateLimiter(host_rates)
+        self.max_retry_after = max_retry_after
+        self.rate_limit_retries = rate_limit_retries
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled async client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=self.http2,
+                limits=self.limits,
+                headers=DEFAULT_HEADERS,
+            )
+        return self._client
+
+    async def close(self):
+        """Close the pooled client and all of its connections."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request, waiting for a free slot and a token on the target host."""
+        client = await self.get_client()
+        host = self._host(url)
+        for attempt in range(self.rate_limit_retries + 1):
+            async with self._host_slot(host):
+                await self._acquire(host, url)
+                response = await client.get(url, **kwargs)
+            if not self._should_retry(host, response, attempt):
+                return response
+        return response
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Stream a response body, holding a host slot until the body is consumed."""
+        client = await self.get_client()
+        host = self._host(url)
+        for attempt in range(self.rate_limit_retries + 1):
+            async with self._host_slot(host):
+                await self._acquire(host, url)
+                async with client.stream(method, url, **kwargs) as response:
+                    if not self._should_retry(host, response, attempt):
+                        yield response
+                        return
+
+    def set_host_rate(self, host: str, rate: Optional[float], burst: Optional[float] = None, replace: bool = True):
+        """Pace requests to a host; see RateLimiter.set_rate."""
+        self.rate_limiter.set_rate(host, rate, burst, replace)
+
+    async def _acquire(self, host: str, url: str):
+        """Wait for the host's rate limit, or fail fast while it is blocked for too long."""
+        bucket = self.rate_limiter.bucket(host)
+        if bucket.blocked_for() > self.max_retry_after:
+            raise RateLimited(
+                f"{host} asked to wait {bucket.blocked_for():.0f}s",
+                request=httpx.Request("GET", url),
+            )
+        await bucket.acquire()
+
+    def _should_retry(self, host: str, response: httpx.Response, attempt: int) -> bool:
+        """Record a rate-limit response on the host and decide whether to retry."""
+        if response.status_code not in self.RATE_LIMIT_STATUSES:
+            return False
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            if response.status_code == 429:
+                self.rate_limiter.bucket(host).block(self.DEFAULT_RATE_LIMIT_BACKOFF)
+            return False
+        self.rate_limiter.bucket(host).block(delay)
+        return attempt < self.rate_limit_retries and delay <= self.max_retry_after
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def _host_slot(self, host: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a host."""
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.host_connections.get(host, self.max_connections_per_host))
+            self._host_slots[host] = slot
+        return slot
@@ -0,0 +1,137 @@
+"""Per-host request pacing with token buckets and Retry-After support."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+
+# Hosts whose published limits apply no matter who calls them
+DEFAULT_HOST_RATES = {
+    # Algolia's HN Search API allows 10,000 requests per hour per IP
+    "hn.algolia.com": (10_000 / 3600, 20),
+}
+
+
+class RateLimited(httpx.TransportError):
+    """Raised instead of sending a request to a host that asked us to wait too long."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Paces requests to ``rate`` per second with bursts of up to ``burst``.
+
+    A bucket without a rate never delays on its own but still honors
+    ``block``, which holds every caller back until a Retry-After elapses.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: float = 1.0):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def blocked_for(self) -> float:
+        """Seconds until a Retry-After block lifts."""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    def block(self, seconds: float):
+        """Hold every request back for ``seconds``."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        # Refill only from when the block lifts, not through it
+        self._tokens = 0.0
+        self._updated = self._blocked_until
+
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                if self.rate is None:
+                    return
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+class RateLimiter:
+    """Token buckets keyed by host name."""
+
+    def __init__(self, rates: Optional[dict[str, float]] = None, burst: float = 5.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            rates: Requests per second by host; hosts not listed are not paced
+            burst: Default burst size for configured hosts
+        """
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        for host, (rate, host_burst) in DEFAULT_HOST_RATES.items():
+            self.set_rate(host, rate, host_burst)
+        for host, rate in (rates or {}).items():
+            self.set_rate(host, rate)
+
+    def set_rate(self, host: str, rate: Optional[float], burst: Optional[float] = None, replace: bool = True):
+        """
+        Pace requests to a host.
+
+        Args:
+            host: Host name, e.g. ``r.jina.ai``
+            rate: Requests per second, or None to stop pacing
+            burst: Requests allowed back to back; defaults to the limiter's burst
+            replace: Overwrite a rate configured earlier (e.g. from the CLI)
+        """
+        host = host.lower()
+        bucket = self._buckets.get(host)
+        if bucket is not None and bucket.rate is not None and not replace:
+            return
+        new_bucket = TokenBucket(rate, self.burst if burst is None else burst)
+        if bucket is not None:
+            new_bucket._blocked_until = bucket._blocked_until
+        self._buckets[host] = new_bucket
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Get the bucket for a host, creating an unpaced one if needed."""
+        host = host.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket()
+            self._buckets[host] = bucket
+        return bucket
@@ -1,15 +1,28 @@
-"""Story service for fetching stories from the Hacker News front archive."""
+"""Story service for fetching a day's top stories from Hacker News."""
 
+import asyncio
 from datetime import datetime, timedelta, timezone
+import heapq
 from html.parser import HTMLParser
+import json
+import logging
+import math
 import re
-from typing import Optional
-from urllib.parse import urljoin
+import sys
+from typing import AsyncIterator, Callable, Optional, Union
+from urllib.parse import urlencode, urljoin
 
 import httpx
 
 from ..models import Story
 from ..timezone import APP_TIMEZONE
+from .hedging import HedgeOutcome, race_hedged
+from .http_client import HttpClient
+
+
+logger = logging.getLogger(__name__)
+
+STORY_SOURCES = ("archive", "algolia")
 
 
 class ApiError(Exception):
@@ -26,6 +39,7 @@ class HNFrontPageParser(HTMLParser):
         super().__init__(convert_charrefs=True)
         self.default_created_at = default_created_at
         self.stories: list[Story] = []
+        self._taken = 0
 
         self._current_story: Optional[dict] = None
         self._pending_story: Optional[dict] = None
@@ -44,13 +58,12 @@ class HNFrontPageParser(HTMLParser):
         self._subtext_link_text: list[str] = []
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]):
-        attrs_dict = dict(attrs)
-        class_tokens = self._class_tokens(attrs_dict.get("class"))
-
+        # Hot path: most tags on the page are none of these, and attributes
+        # are looked up only for the tags that need them
         if tag == "tr":
-            self._row_is_story = "athing" in class_tokens
+            self._row_is_story = self._has_class(attrs, "athing")
             if self._row_is_story:
-                story_id_text = attrs_dict.get("id", "")
+                story_id_text = self._attr(attrs, "id") or ""
                 story_id = self._parse_int(story_id_text)
                 self._current_story = {
                     "object_id": story_id_text,
@@ -58,40 +71,29 @@ class HNFrontPageParser(HTMLParser):
                     "title": "Untitled",
                     "url": None,
                 }
-            return
-
-        if self._row_is_story and tag == "span" and "titleline" in class_tokens:
-            self._in_titleline = True
-            return
-
-        if self._row_is_story and self._in_titleline and tag == "a" and not self._capturing_title:
-            self._capturing_title = True
-            self._title_href = attrs_dict.get("href")
-            self._title_text = []
-            return
-
-        if tag == "td" and "subtext" in class_tokens:
-            self._in_subtext = True
-            return
-
-        if not self._in_subtext:
-            return
-
-        if tag == "span" and "score" in class_tokens:
-            self._capturing_score = True
-            self._score_text = []
-            return
-
-        if tag == "span" and "age" in class_tokens:
-            self._set_created_at(attrs_dict.get("title"))
-            return
-
-        if tag == "a":
-            self._subtext_link_href = attrs_dict.get("href")
-            self._subtext_link_text = []
-            if "hnuser" in class_tokens:
-                self._capturing_author = True
-                self._author_text = []
+        elif tag == "span":
+            if self._row_is_story and self._has_class(attrs, "titleline"):
+                self._in_titleline = True
+            elif self._in_subtext:
+                if self._has_class(attrs, "score"):
+                    self._capturing_score = True
+                    self._score_text = []
+                elif self._has_class(attrs, "age"):
+                    self._set_created_at(self._attr(attrs, "title"))
+        elif tag == "a":
+            if self._row_is_story and self._in_titleline and not self._capturing_title:
+                self._capturing_title = True
+                self._title_href = self._attr(attrs, "href")
+                self._title_text = []
+            elif self._in_subtext:
+                self._subtext_link_href = self._attr(attrs, "href")
+                self._subtext_link_text = []
+                if self._has_class(attrs, "hnuser"):
+                    self._capturing_author = True
+                    self._author_text = []
+        elif tag == "td":
+            if self._has_class(attrs, "subtext"):
+                self._in_subtext = True
 
     def handle_data(self, data: str):
         if self._capturing_title:
@@ -161,6 +163,7 @@ class HNFrontPageParser(HTMLParser):
             "num_comments": 0,
             **self._pending_story,
         }
+        story_data["author"] = sys.intern(story_data["author"])
         self.stories.append(Story(**story_data))
         self._pending_story = None
 
@@ -190,9 +193,25 @@ class HNFrontPageParser(HTMLParser):
             return
         self._pending_story["num_comments"] = self._parse_int(text)
 
+    def take_stories(self) -> list[Story]:
+        """Return the stories completed since the previous call, for incremental feeding."""
+        stories = self.stories[self._taken:]
+        self._taken = len(self.stories)
+        return stories
+
+    @staticmethod
+    def _attr(attrs: list[tuple[str, Optional[str]]], name: str) -> Optional[str]:
+        for key, value in attrs:
+            if key == name:
+                return value
+        return None
+
     @staticmethod
-    def _class_tokens(class_attr: Optional[str]) -> set[str]:
-        return set(class_attr.split()) if class_attr else set()
+    def _has_class(attrs: list[tuple[str, Optional[str]]], name: str) -> bool:
+        for key, value in attrs:
+            if key == "class":
+                return value is not None and (value == name or name in value.split())
+        return False
 
     @staticmethod
     def _parse_int(text: str) -> int:
@@ -201,81 +220,404 @@ class HNFrontPageParser(HTMLParser):
 
 
 class HNFrontMarkdownParser:
-    """Parse story entries from Jina Reader markdown for a Hacker News archive page."""
+    """
+    Parse story entries from Jina Reader markdown for a Hacker News archive page.
+
+    The page is cut into one block per ranked entry (``12.[...``) and each
+    block is tokenized on its own in a single forward scan, so malformed or
+    drifted output costs time linear in its size and only affects the block
+    it appears in. Entries without a vote link (flagged or own stories),
+    points, author or comment link still parse, using Story defaults.
+    """
 
     SITE_URL = "https://news.ycombinator.com/"
-    STORY_RE = re.compile(
-        r"(?P<rank>\d+)\.\[\]"
-        r"\(https://news\.ycombinator\.com/vote\?id=(?P<story_id>\d+)[^)]*\)"
-        r"\[(?P<title>.*?)\]\((?P<url>.*?)\)"
-        r"(?: \(\[[^\]]+\]\([^)]+\)\))? "
-        r"(?P<points>\d+) points by "
-        r"\[(?P<author>[^\]]+)\]\(https://news\.ycombinator\.com/user\?id=[^)]*\)"
-        r"\[[^\]]+\]\(https://news\.ycombinator\.com/item\?id=(?P=story_id)\)"
-        r" \| \[(?P<comments>\d+ comments|discuss)\]"
-        r"\(https://news\.ycombinator\.com/item\?id=(?P=story_id)\)",
-        re.DOTALL,
-    )
+    BLOCK_START_RE = re.compile(r"(?:^[ \t]*|(?<=\)))\d+\.(?=\[)", re.MULTILINE)
+    ITEM_ID_RE = re.compile(r"news\.ycombinator\.com/(?:vote|item)\?id=(\d+)")
+    POINTS_RE = re.compile(r"(?<!\d)(\d+) points?\b")
+    LABEL_TOKEN_RE = re.compile(r"[\[\]]")
+    TARGET_TOKEN_RE = re.compile(r"[()\s]")
+    COMMENTS_RE = re.compile(r"(?<!\d)(\d+)(?:\s|&nbsp;)+comments?$")
 
     def __init__(self, default_created_at: datetime):
         self.default_created_at = default_created_at
 
     def parse(self, markdown: str) -> list[Story]:
         """Parse Jina Reader markdown into Story objects."""
+        markers = list(self.BLOCK_START_RE.finditer(markdown))
+        starts = [match.end() for match in markers]
+        ends = [match.start() for match in markers[1:]] + [len(markdown)]
+
         stories = []
-        for match in self.STORY_RE.finditer(markdown):
-            story_id = int(match.group("story_id"))
-            stories.append(
-                Story(
-                    object_id=str(story_id),
-                    title=self._clean_text(match.group("title")),
-                    url=urljoin(self.SITE_URL, match.group("url")),
-                    author=self._clean_text(match.group("author")) or "unknown",
-                    points=int(match.group("points")),
-                    created_at=self.default_created_at,
-                    story_id=story_id,
-                    num_comments=self._parse_int(match.group("comments")),
-                )
-            )
+        seen = set()
+        for start, end in zip(starts, ends):
+            story = self._parse_block(markdown, start, end)
+            if story is not None and story.story_id not in seen:
+                seen.add(story.story_id)
+                stories.append(story)
         return stories
 
+    def _parse_block(self, text: str, start: int, end: int) -> Optional[Story]:
+        """Tokenize one ranked entry: optional vote link, title link, then subtext."""
+        story_id = None
+        title, url, pos = self._read_link(text, start, end)
+        if title == "":
+            match = self.ITEM_ID_RE.search(url)
+            story_id = int(match.group(1)) if match else None
+            title, url, pos = self._read_link(text, pos, end)
+        if title is None or not title.strip():
+            return None
+
+        points = 0
+        author = "unknown"
+        num_comments = 0
+        while pos < end:
+            bracket = text.find("[", pos, end)
+            if bracket == -1:
+                bracket = end
+            if not points:
+                match = self.POINTS_RE.search(text, pos, bracket)
+                points = int(match.group(1)) if match else 0
+            if bracket == end:
+                break
+
+            label, target, pos = self._read_link(text, bracket, end)
+            if label is None:
+                continue
+            if "news.ycombinator.com/user?id=" in target:
+                author = self._clean_text(label) or author
+                continue
+            match = self.ITEM_ID_RE.search(target)
+            if match is None:
+                continue
+            if story_id is None:
+                story_id = int(match.group(1))
+            label = self._clean_text(label)
+            comments = self.COMMENTS_RE.search(label)
+            if comments:
+                num_comments = int(comments.group(1))
+
+        if story_id is None:
+            return None
+        return Story(
+            object_id=str(story_id),
+            title=self._clean_text(title),
+            url=url if url.startswith(("https://", "http://")) else urljoin(self.SITE_URL, url),
+            author=sys.intern(author),
+            points=points,
+            created_at=self.default_created_at,
+            story_id=story_id,
+            num_comments=num_comments,
+        )
+
+    @staticmethod
+    def _read_link(text: str, pos: int, end: int) -> tuple[Optional[str], str, int]:
+        """
+        Read a ``[label](target)`` link starting at the ``[`` at ``pos``.
+
+        Nested brackets in the label and parentheses in the target are
+        balanced, so titles like ``Foo [pdf]`` and Wikipedia URLs survive.
+
+        Returns:
+            (label, target, position after the link); label is None if no
+            complete link starts here, and the position is then where scanning
+            stopped, so callers never rescan the same characters
+        """
+        if pos >= end or text[pos] != "[":
+            return None, "", pos
+
+        label_end = text.find("]", pos + 1, end)
+        if label_end == -1:
+            return None, "", end
+        if text.find("[", pos + 1, label_end) != -1:
+            # Nested brackets in the label: balance them
+            depth = 0
+            token = HNFrontMarkdownParser.LABEL_TOKEN_RE.search(text, pos, end)
+            while token is not None:
+                depth += 1 if token.group() == "[" else -1
+                if depth == 0:
+                    break
+                token = HNFrontMarkdownParser.LABEL_TOKEN_RE.search(text, token.end(), end)
+            if token is None:
+                return None, "", end
+            label_end = token.start()
+        if label_end + 1 >= end or text[label_end + 1] != "(":
+            return None, "", label_end + 1
+
+        depth = 0
+        token = HNFrontMarkdownParser.TARGET_TOKEN_RE.search(text, label_end + 1, end)
+        while token is not None and not token.group().isspace():
+            depth += 1 if token.group() == "(" else -1
+            if depth == 0:
+                return text[pos + 1:label_end], text[label_end + 2:token.start()], token.end()
+            token = HNFrontMarkdownParser.TARGET_TOKEN_RE.search(text, token.end(), end)
+        return None, "", token.start() if token is not None else end
+
     @staticmethod
     def _clean_text(text: str) -> str:
-        return re.sub(r"\s+", " ", text).strip()
+        return " ".join(text.split())
+
+
+class StorySource:
+    """
+    A way of listing one day's candidate stories, page by page.
+
+    Subclasses set ``name`` and ``page_size`` and implement ``fetch_page``.
+    Pages are numbered from 1; an empty page means there are no more.
+    """
+
+    name = "source"
+    page_size = 30
+
+    def __init__(self, http: HttpClient, timeout: float = 30.0):
+        self.http = http
+        self.timeout = timeout
+
+    async def fetch_page(self, target_date: datetime, page: int = 1) -> list[Story]:
+        """
+        Fetch one page of candidate stories for a day.
+
+        Args:
+            target_date: Day to fetch, in UTC+8
+            page: Page number, starting at 1
+
+        Returns:
+            Stories on that page, in the source's order
+
+        Raises:
+            ApiError: If the page could not be fetched
+        """
+        raise NotImplementedError
+
+    async def _make_request(self, url: str) -> str:
+        """Make an HTTP GET request and return the body text."""
+        logger.info("[API] GET %s", url)
+        try:
+            response = await self.http.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+        except httpx.HTTPStatusError as e:
+            raise ApiError(f"API returned error {e.response.status_code}: {e.response.text}")
+        except httpx.RequestError as e:
+            raise ApiError(f"Request failed: {str(e)}")
 
     @staticmethod
-    def _parse_int(text: str) -> int:
-        digits = "".join(char for char in text if char.isdigit())
-        return int(digits) if digits else 0
+    def _format_day(date: datetime) -> str:
+        return date.astimezone(APP_TIMEZONE).strftime("%Y-%m-%d")
 
+    @staticmethod
+    def _default_created_at(target_date: datetime) -> datetime:
+        return target_date.astimezone(APP_TIMEZONE).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
 
-class StoryService:
-    """Fetches top stories from the Hacker News front archive."""
 
+class FrontArchiveSource(StorySource):
+    """
+    Stories shown on the Hacker News front page archive (``front?day=``).
+
+    Each page is requested through Jina Reader first. If Jina has not
+    returned a parseable page within ``hedge_delay`` seconds (or fails sooner),
+    the same page is also requested directly from Hacker News, and whichever
+    request yields stories first wins.
+    """
+
+    name = "archive"
+    page_size = 30
     HN_BASE_URL = "https://news.ycombinator.com/front"
     READER_BASE_URL = "https://r.jina.ai/"
-    BASE_URL = f"{READER_BASE_URL}{HN_BASE_URL}"
 
-    def __init__(self, timeout: float = 30.0):
-        self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+    def __init__(self, http: HttpClient, timeout: float = 30.0, hedge_delay: Optional[float] = 3.0):
+        super().__init__(http, timeout)
+        self.hedge_delay = hedge_delay
+        # Outcome of the last fetch per archive page, keyed by YYYY-MM-DD[&p=N]
+        self.fetch_stats: dict[str, HedgeOutcome] = {}
+
+    def build_url(self, date: datetime, page: int = 1) -> str:
+        """Build the Jina Reader URL for a Hacker News front archive page."""
+        return f"{self.READER_BASE_URL}{self.build_direct_url(date, page)}"
+
+    def build_direct_url(self, date: datetime, page: int = 1) -> str:
+        """Build the Hacker News URL for a front archive page."""
+        return f"{self.HN_BASE_URL}?{self._page_query(date, page)}"
+
+    def _page_query(self, date: datetime, page: int) -> str:
+        query = f"day={self._format_day(date)}"
+        return query if page == 1 else f"{query}&p={page}"
+
+    async def fetch_page(self, target_date: datetime, page: int = 1) -> list[Story]:
+        """
+        Fetch and parse one archive page, hedging Jina Reader with a direct request.
+
+        Returns:
+            Parsed stories from the first request that produced any; an empty
+            list if a request answered with a page that had no stories
+
+        Raises:
+            ApiError: If both requests failed
+        """
+        async def via_jina() -> list[Story]:
+            return self.parse_response(await self._make_request(self.build_url(target_date, page)), target_date)
+
+        async def direct() -> list[Story]:
+            return self.parse_html(await self._make_request(self.build_direct_url(target_date, page)), target_date)
+
+        outcome = await race_hedged(
+            [("jina", via_jina), ("direct", direct)],
+            self.hedge_delay,
+            accept=bool,
+        )
+        key = self._page_query(target_date, page).removeprefix("day=")
+        self.fetch_stats[key] = outcome
+        latencies = ", ".join(f"{source} {elapsed:.2f}s" for source, elapsed in outcome.latencies.items())
+        logger.info("[API] Front page %s from %s (%s)", key, outcome.source or "no source", latencies or "no response")
+
+        if outcome.source is None:
+            errors = "; ".join(f"{source}: {error}" for source, error in outcome.errors.items())
+            raise ApiError(f"All front page sources failed: {errors}")
+        return outcome.value
+
+    def parse_response(self, html: str, target_date: datetime) -> list[Story]:
+        """Parse Hacker News archive HTML or Jina Reader markdown into Story objects."""
+        markdown_parser = HNFrontMarkdownParser(self._default_created_at(target_date))
+        stories = markdown_parser.parse(html)
+        if stories:
+            return stories
+        return self.parse_html(html, target_date)
+
+    def parse_html(self, html: str, target_date: datetime) -> list[Story]:
+        """Parse Hacker News archive HTML into Story objects."""
+        parser = HNFrontPageParser(self._default_created_at(target_date))
+        parser.feed(html)
+        return parser.stories
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+
+class AlgoliaStorySource(StorySource):
+    """
+    Stories submitted during the UTC+8 day, from the HN Algolia search API.
+
+    Unlike the front archive, this covers every story created that day, not
+    only those that reached the front page, and returns exact creation times
+    and comment counts as JSON. Results come ranked by points.
+    """
+
+    name = "algolia"
+    SEARCH_URL = "https://hn.algolia.com/api/v1/search"
+    ITEM_URL = "https://news.ycombinator.com/item?id="
+
+    def __init__(self, http: HttpClient, timeout: float = 30.0, hits_per_page: int = 50):
+        super().__init__(http, timeout)
+        self.page_size = hits_per_page
+
+    def build_url(self, date: datetime, page: int = 1) -> str:
+        """Build the search URL for stories created during one UTC+8 day."""
+        start = int(self._default_created_at(date).timestamp())
+        end = start + 24 * 60 * 60
+        query = urlencode({
+            "tags": "story",
+            "numericFilters": f"created_at_i>={start},created_at_i<{end}",
+            "hitsPerPage": self.page_size,
+            "page": page - 1,
+        })
+        return f"{self.SEARCH_URL}?{query}"
+
+    async def fetch_page(self, target_date: datetime, page: int = 1) -> list[Story]:
+        text = await self._make_request(self.build_url(target_date, page))
+        try:
+            hits = json.loads(text).get("hits", [])
+        except (ValueError, AttributeError) as e:
+            raise ApiError(f"Invalid search response: {e}")
+        return [story for story in map(self._parse_hit, hits) if story is not None]
+
+    def _parse_hit(self, hit: dict) -> Optional[Story]:
+        try:
+            story_id = int(hit.get("story_id") or hit["objectID"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        created_at_i = hit.get("created_at_i")
+        return Story(
+            object_id=str(story_id),
+            title=hit.get("title") or "Untitled",
+            url=hit.get("url") or f"{self.ITEM_URL}{story_id}",
+            author=sys.intern(hit.get("author") or "unknown"),
+            points=hit.get("points") or 0,
+            created_at=datetime.fromtimestamp(created_at_i, timezone.utc) if created_at_i else datetime.now(timezone.utc),
+            story_id=story_id,
+            num_comments=hit.get("num_comments") or 0,
+        )
+
+
+class StoryService:
+    """
+    Fetches top stories for a day from a pluggable story source.
+
+    The front archive (``"archive"``) is the default source; the Algolia
+    search API (``"algolia"``) is the alternative. With fallback enabled, a
+    source whose first page fails or comes back empty is replaced by the
+    next one.
+
+    With ``max_pages`` above 1, further pages are fetched concurrently, only
+    as many as needed to fill the requested number of candidates that
+    survive the caller's exclusion filter. ``iter_ranked_candidates`` reads
+    them one page ahead of its consumer instead.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        http: Optional[HttpClient] = None,
+        hedge_delay: Optional[float] = 3.0,
+        max_pages: int = 1,
+        source: Union[str, StorySource] = "archive",
+        fallback: bool = True,
+    ):
+        """
+        Initialize the story service.
+
+        Args:
+            timeout: Request timeout in seconds
+            http: Shared HTTP client; a private one is created if omitted
+            hedge_delay: Seconds to wait for Jina before also fetching an archive
+                page directly from Hacker News; None only falls back after Jina fails
+            max_pages: Maximum number of pages to read per day
+            source: Preferred source name, or a custom StorySource
+            fallback: Whether to try the other sources when the preferred one fails
+        """
+        self.timeout = timeout
+        self.max_pages = max(1, max_pages)
+        self._owns_http = http is None
+        self.http = http or HttpClient(timeout=timeout)
+
+        self.archive = FrontArchiveSource(self.http, timeout, hedge_delay)
+        self.sources: dict[str, StorySource] = {
+            self.archive.name: self.archive,
+            AlgoliaStorySource.name: AlgoliaStorySource(self.http, timeout),
+        }
+        if isinstance(source, StorySource):
+            self.sources[source.name] = source
+            source = source.name
+        if source not in self.sources:
+            raise ValueError(f"Unknown story source: {source}")
+        self.source_order = [source]
+        if fallback:
+            self.source_order += [name for name in self.sources if name != source]
+        # Source that supplied each day's stories, keyed by YYYY-MM-DD
+        self.sources_used: dict[str, str] = {}
+
+    @property
+    def fetch_stats(self) -> dict[str, HedgeOutcome]:
+        """Hedged fetch outcome per front archive page."""
+        return self.archive.fetch_stats
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Close the HTTP client if this service owns it."""
+        if self._owns_http:
+            await self.http.close()
 
     async def get_top_stories_from_yesterday(
         self,
         limit: int = 15,
-        date: Optional[datetime] = None
+        date: Optional[datetime] = None,
+        exclude: Optional[Callable[[Story], bool]] = None,
     ) -> list[Story]:
         """
         Fetch top stories for a target day, ordered by points desc.
@@ -283,6 +625,8 @@ class StoryService:
         Args:
             limit: Maximum number of stories to return
             date: Optional date to fetch stories from (defaults to yesterday in UTC+8)
+            exclude: Optional predicate for stories to drop, such as ones
+                already in history; more pages are read to make up for them
 
         Returns:
             List of Story objects
@@ -291,14 +635,274 @@ class StoryService:
             return []
 
         target_date = self._resolve_target_date(date)
-        url = self._build_url(target_date)
-        html = await self._make_request(url)
-        stories = self._parse_response(html, target_date)
-        stories.sort(
-            key=lambda story: (story.points, story.num_comments, story.created_at),
-            reverse=True,
-        )
-        return stories[:limit]
+        candidates = await self._collect_candidates(target_date, limit, exclude)
+        return heapq.nlargest(limit, candidates, key=self._rank_key)
+
+    async def iter_ranked_candidates(
+        self,
+        date: Optional[datetime] = None,
+        exclude: Optional[Callable[[Story], bool]] = None,
+    ) -> AsyncIterator[Story]:
+        """
+        Yield every candidate story for a target day, one page at a time.
+
+        Each page's new stories are ranked by points, then comment count, then
+        creation time, and yielded before the next page is needed; the next
+        page is downloaded while the current one is consumed. Consumers can
+        stop iterating as soon as they have enough candidates, and no page
+        past the one after their last story is fetched.
+
+        Args:
+            date: Optional date to fetch stories from (defaults to yesterday in UTC+8)
+            exclude: Optional predicate for stories to drop
+
+        Raises:
+            ApiError: If every source failed on its first page
+        """
+        target_date = self._resolve_target_date(date)
+        day = StorySource._format_day(target_date)
+        errors = []
+        for name in self.source_order:
+            source = self.sources[name]
+            try:
+                stories = await source.fetch_page(target_date, 1)
+            except Exception as e:
+                errors.append(f"{name}: {e}")
+                logger.warning("[API] Story source %s failed for %s: %s", name, day, e)
+                continue
+            if not stories:
+                logger.warning("[API] Story source %s returned no stories for %s", name, day)
+                continue
+            self.sources_used[day] = name
+            async for story in self._iter_pages(source, target_date, stories, exclude):
+                yield story
+            return
+
+        if len(errors) == len(self.source_order):
+            raise ApiError(f"All story sources failed: {'; '.join(errors)}")
+
+    async def _iter_pages(
+        self,
+        source: StorySource,
+        target_date: datetime,
+        stories: list[Story],
+        exclude: Optional[Callable[[Story], bool]],
+        seen_ids: Optional[set[int]] = None,
+    ) -> AsyncIterator[Story]:
+        """
+        Yield the ranked new stories of each page from one source, starting with page 1.
+
+        Later pages are best-effort; the first empty page ends the day.
+        """
+        seen_ids = set() if seen_ids is None else seen_ids
+        page = 1
+        while True:
+            upcoming = None
+            if page < self.max_pages:
+                upcoming = asyncio.ensure_future(source.fetch_page(target_date, page + 1))
+                # Retrieve the error of a prefetch the consumer never waited for
+                upcoming.add_done_callback(lambda task: task.cancelled() or task.exception())
+            try:
+                fresh = self._new_stories(stories, seen_ids, exclude)
+                fresh.sort(key=self._rank_key, reverse=True)
+                for story in fresh:
+                    yield story
+
+                if upcoming is None:
+                    return
+                page += 1
+                try:
+                    stories = await upcoming
+                except Exception as e:
+                    logger.warning("[API] Skipping %s page %d: %s", source.name, page, e)
+                    stories = []
+                    continue
+                if not stories:
+                    return
+            finally:
+                if upcoming is not None and not upcoming.done():
+                    upcoming.cancel()
+
+    async def _collect_candidates(
+        self,
+        target_date: datetime,
+        wanted: Optional[int],
+        exclude: Optional[Callable[[Story], bool]],
+    ) -> list[Story]:
+        """
+        Collect candidates from the first source whose first page yields stories.
+
+        Raises:
+            ApiError: If every source failed
+        """
+        day = StorySource._format_day(target_date)
+        errors = []
+        for name in self.source_order:
+            source = self.sources[name]
+            try:
+                stories = await self._collect_from(source, target_date, wanted, exclude)
+            except Exception as e:
+                errors.append(f"{name}: {e}")
+                logger.warning("[API] Story source %s failed for %s: %s", name, day, e)
+                continue
+            if stories is None:
+                logger.warning("[API] Story source %s returned no stories for %s", name, day)
+                continue
+            self.sources_used[day] = name
+            return stories
+
+        if len(errors) == len(self.source_order):
+            raise ApiError(f"All story sources failed: {'; '.join(errors)}")
+        return []
+
+    async def _collect_from(
+        self,
+        source: StorySource,
+        target_date: datetime,
+        wanted: Optional[int],
+        exclude: Optional[Callable[[Story], bool]],
+    ) -> Optional[list[Story]]:
+        """
+        Read pages from one source until enough candidates survive ``exclude``.
+
+        Pages are fetched in concurrent batches sized from the survival rate
+        seen so far. Page 1 must succeed; later pages are best-effort.
+
+        Args:
+            source: Source to read
+            target_date: Day to fetch
+            wanted: Number of surviving candidates to aim for, or None to read
+                every page up to ``max_pages``
+            exclude: Optional predicate for stories to drop
+
+        Returns:
+            Unique surviving stories in page order, or None if page 1 was empty
+        """
+        merged: dict[int, Story] = {}
+        seen_ids: set[int] = set()
+        next_page = 1
+
+        while next_page <= self.max_pages:
+            remaining_pages = self.max_pages - next_page + 1
+            if wanted is None:
+                batch = remaining_pages
+            else:
+                missing = wanted - len(merged)
+                if missing <= 0:
+                    break
+                # Surviving candidates per page so far, or a full page before any fetch
+                per_page = len(merged) / (next_page - 1) if next_page > 1 else source.page_size
+                batch = min(remaining_pages, math.ceil(missing / max(per_page, 1)))
+
+            pages = range(next_page, next_page + batch)
+            results = await asyncio.gather(
+                *(source.fetch_page(target_date, page) for page in pages),
+                return_exceptions=True,
+            )
+            next_page += batch
+
+            last_page_reached = False
+            for page, result in zip(pages, results):
+                if isinstance(result, BaseException):
+                    if page == 1:
+                        raise result
+                    logger.warning("[API] Skipping %s page %d: %s", source.name, page, result)
+                    continue
+                if not result:
+                    if page == 1:
+                        return None
+                    last_page_reached = True
+                for story in result:
+                    if story.story_id in seen_ids:
+                        continue
+                    seen_ids.add(story.story_id)
+                    if exclude is None or not exclude(story):
+                        merged[story.story_id] = story
+            if last_page_reached:
+                break
+
+        return list(merged.values())
+
+    async def iter_stories_streaming(
+        self,
+        date: Optional[datetime] = None,
+        exclude: Optional[Callable[[Story], bool]] = None,
+    ) -> AsyncIterator[Story]:
+        """
+        Yield stories in archive page order while the first page is still downloading.
+
+        The Hacker News archive HTML is streamed and decoded chunks are fed
+        to the parser as they arrive, so each row is yielded as soon as its
+        subtext has been received. Stories of the first page are not re-ranked
+        by points, since that needs the whole page; HN's own ranking order is
+        kept instead. Later pages, up to ``max_pages``, follow as in
+        ``iter_ranked_candidates``. If the direct request fails before any
+        story was yielded, the ranked fetch through the configured sources is
+        used instead; if it fails later, the day ends with the stories yielded
+        so far.
+
+        Args:
+            date: Optional date to fetch stories from (defaults to yesterday in UTC+8)
+            exclude: Optional predicate for stories to drop
+
+        Raises:
+            ApiError: If the stream fails before any story was yielded and
+                every source failed
+        """
+        target_date = self._resolve_target_date(date)
+        url = self.archive.build_direct_url(target_date)
+        parser = HNFrontPageParser(StorySource._default_created_at(target_date))
+        seen_ids: set[int] = set()
+        yielded = 0
+
+        logger.info("[API] GET %s (streaming)", url)
+        try:
+            async with self.http.stream("GET", url, timeout=self.timeout) as response:
+                if response.status_code >= 400:
+                    raise ApiError(f"API returned error {response.status_code}")
+                async for chunk in response.aiter_text():
+                    parser.feed(chunk)
+                    for story in self._new_stories(parser.take_stories(), seen_ids, exclude):
+                        yielded += 1
+                        yield story
+            parser.close()
+        except (ApiError, httpx.RequestError) as e:
+            if yielded:
+                # Stories already handed out may be in the pipeline; keep them
+                logger.warning("[API] Front page stream %s failed after %d stories: %s", url, yielded, e)
+                return
+            logger.info("[API] Streaming %s failed (%s), falling back to buffered fetch", url, e)
+            async for story in self.iter_ranked_candidates(date, exclude):
+                yield story
+            return
+
+        for story in self._new_stories(parser.take_stories(), seen_ids, exclude):
+            yield story
+        if not seen_ids:
+            return
+        self.sources_used[StorySource._format_day(target_date)] = self.archive.name
+        async for story in self._iter_pages(self.archive, target_date, [], exclude, seen_ids):
+            yield story
+
+    @staticmethod
+    def _new_stories(
+        stories: list[Story],
+        seen_ids: set[int],
+        exclude: Optional[Callable[[Story], bool]],
+    ) -> list[Story]:
+        """Stories not seen before that survive ``exclude``; all of them are marked as seen."""
+        fresh = []
+        for story in stories:
+            if story.story_id in seen_ids:
+                continue
+            seen_ids.add(story.story_id)
+            if exclude is None or not exclude(story):
+                fresh.append(story)
+        return fresh
+
+    @staticmethod
+    def _rank_key(story: Story) -> tuple:
+        return (story.points, story.num_comments, story.created_at)
 
     def _resolve_target_date(self, date: Optional[datetime]) -> datetime:
         """Resolve the date to fetch, defaulting to yesterday in UTC+8."""
@@ -307,36 +911,3 @@ class StoryService:
         if date.tzinfo is None:
             return date.replace(tzinfo=APP_TIMEZONE)
         return date.astimezone(APP_TIMEZONE)
-
-    def _build_url(self, date: datetime) -> str:
-        """Build the Jina Reader URL for a Hacker News front archive day."""
-        target_day = date.astimezone(APP_TIMEZONE).strftime("%Y-%m-%d")
-        return f"{self.BASE_URL}?day={target_day}"
-
-    async def _make_request(self, url: str) -> str:
-        """Make HTTP request to the Hacker News archive."""
-        client = await self._get_client()
-        print(f"[API] GET {url}")
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
-        except httpx.HTTPStatusError as e:
-            raise ApiError(f"API returned error {e.response.status_code}: {e.response.text}")
-        except httpx.RequestError as e:
-            raise ApiError(f"Request failed: {str(e)}")
-
-    def _parse_response(self, html: str, target_date: datetime) -> list[Story]:
-        """Parse Hacker News archive HTML or Jina Reader markdown into Story objects."""
-        default_created_at = target_date.astimezone(APP_TIMEZONE).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-
-        markdown_parser = HNFrontMarkdownParser(default_created_at)
-        stories = markdown_parser.parse(html)
-        if stories:
-            return stories
-
-        parser = HNFrontPageParser(default_created_at)
-        parser.feed(html)
-        return parser.stories
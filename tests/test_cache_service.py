@@ -0,0 +1,115 @@
+"""Tests for the on-disk caches."""
+
+import os
+import time
+from datetime import datetime, timezone
+
+from hn_daily.models import Comment, CrawlResult, Story
+from hn_daily.services.cache_service import CommentCache, ContentCache, DiskCache, normalize_url
+
+
+def _make_result(markdown: str = "Content", validators: dict | None = None) -> CrawlResult:
+    """Create a successful crawl result."""
+    return CrawlResult(
+        url="https://example.com/article",
+        title="Example",
+        markdown_content=markdown,
+        success=True,
+        tier="fallback",
+        is_fallback=True,
+        validators=validators or {},
+    )
+
+
+def test_normalize_url_drops_fragment_tracking_params_and_default_port():
+    """Equivalent links should map to the same cache key."""
+    assert normalize_url("HTTPS://Example.com:443/a?utm_source=hn&id=1#top") == "https://example.com/a?id=1"
+    assert normalize_url("https://example.com") == "https://example.com/"
+    assert normalize_url("https://example.com/a?fbclid=x&gclid=y&ref_src=twsrc") == "https://example.com/a"
+
+
+def test_normalize_url_keeps_params_that_may_select_content():
+    """``ref`` and ``source`` pick pages on docs and forums, so they stay in the key."""
+    assert normalize_url("https://example.com/docs?source=api") != normalize_url("https://example.com/docs?source=cli")
+    assert normalize_url("https://example.com/t?ref=main") == "https://example.com/t?ref=main"
+
+
+def test_disk_cache_evicts_least_recently_used_entries(tmp_path):
+    """Entries not read recently should be evicted first once over the size cap."""
+    cache = DiskCache(str(tmp_path), max_bytes=250)
+    cache.set("a", {"value": "x" * 80})
+    cache.set("b", {"value": "x" * 80})
+
+    # Make "a" the most recently used entry
+    old = time.time() - 100
+    os.utime(cache._path_for("b"), (old, old))
+    os.utime(cache._path_for("a"), (old, old))
+    assert cache.get("a") is not None
+
+    cache.set("c", {"value": "x" * 80})
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_content_cache_round_trip(tmp_path):
+    """Stored crawls should come back as cached CrawlResults with their tier."""
+    cache = ContentCache(str(tmp_path))
+    cache.put("https://example.com/article?utm_medium=x", _make_result(validators={"etag": '"v1"'}))
+
+    entry = cache.get("https://example.com/article")
+    result = ContentCache.to_result(entry, "https://example.com/article", "Example")
+
+    assert result.markdown_content == "Content"
+    assert result.tier == "fallback"
+    assert result.is_fallback is True
+    assert result.from_cache is True
+    assert result.validators == {"etag": '"v1"'}
+
+
+def test_content_cache_expires_entries_without_validators(tmp_path):
+    """Entries that cannot be revalidated should expire after max_age."""
+    cache = ContentCache(str(tmp_path), max_age=0)
+    cache.put("https://example.com/a", _make_result())
+    cache.put("https://example.com/b", _make_result(validators={"etag": '"v1"'}))
+    time.sleep(0.01)
+
+    assert cache.get("https://example.com/a") is None
+    assert cache.get("https://example.com/b") is not None
+
+
+def _make_story(num_comments: int) -> Story:
+    """Create a story with the given comment count."""
+    return Story(
+        object_id="7",
+        title="Story",
+        url="https://example.com",
+        author="tester",
+        points=10,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        story_id=7,
+        num_comments=num_comments,
+    )
+
+
+def test_comment_cache_round_trip_and_growth_threshold(tmp_path):
+    """Cached comments should be reused until the story gains too many comments."""
+    cache = CommentCache(str(tmp_path), max_growth=5)
+    created_at = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    reply = Comment(comment_id=2, author="b", text="reply", created_at=created_at, parent_id=1)
+    comments = [Comment(comment_id=1, author="a", text="root", created_at=created_at, parent_id=7, children=(reply,))]
+    cache.put(_make_story(100), comments, settings="2/2/None")
+
+    assert cache.get(_make_story(105), settings="2/2/None") == comments
+    assert cache.get(_make_story(106), settings="2/2/None") is None
+    assert cache.get(_make_story(100), settings="3/2/None") is None
+
+
+def test_comment_cache_expires_old_entries(tmp_path):
+    """Entries older than max_age should be refetched even without new comments."""
+    cache = CommentCache(str(tmp_path), max_age=0)
+    cache.put(_make_story(3), [])
+    time.sleep(0.01)
+
+    assert cache.get(_make_story(3)) is None
@@ -0,0 +1,106 @@
+"""Tests for CLI helpers."""
+
+import asyncio
+import io
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import argparse
+
+from hn_daily.cli import DayRun, DigestOptions, _skip_saved_by, expand_date_range, parse_host_value, run_daily_digest
+from hn_daily.models import Story
+from hn_daily.reporting import NdjsonReporter
+from hn_daily.services import ApiError, HistoryService, StoryService
+
+
+def test_expand_date_range_is_inclusive():
+    """Backfill ranges should include both endpoints."""
+    assert expand_date_range("2025-01-30", "2025-02-02") == [
+        "2025-01-30",
+        "2025-01-31",
+        "2025-02-01",
+        "2025-02-02",
+    ]
+
+
+def test_expand_date_range_rejects_reversed_range():
+    """A range ending before it starts should be rejected."""
+    with pytest.raises(ValueError):
+        expand_date_range("2025-02-02", "2025-01-30")
+
+
+def test_parse_host_value():
+    """Per-host options should parse HOST=NUMBER and reject anything else."""
+    assert parse_host_value("R.Jina.ai=200") == ("r.jina.ai", 200.0)
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_host_value("r.jina.ai")
+
+
+def _make_story(story_id: int) -> Story:
+    return Story(
+        object_id=str(story_id),
+        title=f"Story {story_id}",
+        url=f"https://example.com/{story_id}",
+        author="testuser",
+        points=100,
+        created_at=datetime(2025, 1, 19, tzinfo=timezone.utc),
+        story_id=story_id,
+        num_comments=5,
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_day_skips_only_stories_the_previous_day_saved(tmp_path):
+    """Candidates the previous day never saved should stay available to the next day."""
+    history = HistoryService(str(tmp_path / "history.json"))
+    previous = DayRun(date=None, output_dir="a")
+    previous.candidate_keys = {history.build_story_key(f"https://example.com/{i}", i) for i in (1, 2)}
+    previous.candidates_known.set()
+    day = DayRun(date=None, output_dir="b")
+    taken = []
+
+    async def candidates():
+        for story_id in (3, 1, 2):
+            yield _make_story(story_id)
+
+    async def consume():
+        async for story in _skip_saved_by(previous, day, candidates(), history):
+            taken.append(story.story_id)
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    # A story the previous day never had goes ahead; a shared one waits for it to finish
+    assert taken == [3]
+
+    previous.saved_keys = {history.build_story_key("https://example.com/1", 1)}
+    previous.finished.set()
+    await consumer
+
+    assert taken == [3, 2]
+    assert day.skipped_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_run_reports_error_before_run_finished(tmp_path):
+    """The error should be the last message, followed by a failed run_finished event."""
+    stream = io.StringIO()
+    options = DigestOptions(use_cache=False, warm_browser=False)
+
+    with patch.object(
+        StoryService, "get_top_stories_from_yesterday", AsyncMock(side_effect=ApiError("network is down"))
+    ):
+        with pytest.raises(ApiError):
+            await run_daily_digest(
+                "2025-01-19", output_dir=str(tmp_path), options=options, reporter=NdjsonReporter(stream)
+            )
+
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert events[0]["event"] == "run_started"
+    assert events[-2]["event"] == "message"
+    assert events[-2]["level"] == "error"
+    assert events[-2]["text"] == "Error: network is down"
+    assert events[-1]["event"] == "run_finished"
+    assert events[-1]["status"] == "failed"
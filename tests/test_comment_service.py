@@ -1,8 +1,12 @@
+import json
+from dataclasses import replace
+
 import pytest
 import respx
 from httpx import Response
 from datetime import datetime
-from hn_daily.services.comment_service import CommentService
+from hn_daily.services.cache_service import CommentCache
+from hn_daily.services.comment_service import CommentService, CommentTreeBuilder, ThreadStats
 from hn_daily.models import Story
 
 @pytest.fixture
@@ -71,3 +75,120 @@ async def test_get_comments_sorting_and_limit(comment_service, story):
     assert comments[0].comment_id == 12
     assert comments[1].comment_id == 11
     assert len(comments[0].children) == 12
+
+
+def _thread(comment_id: int, depth: int, fanout: int) -> dict:
+    """Build a comment with ``fanout`` replies per level, ``depth`` levels deep."""
+    children = [_thread(comment_id * 10 + i, depth - 1, fanout) for i in range(fanout)] if depth else []
+    return {
+        "id": comment_id,
+        "author": f"user{comment_id}",
+        "text": "text",
+        "created_at": "2025-01-01T00:00:00Z",
+        "parent_id": 1,
+        "children": children,
+    }
+
+
+@pytest.mark.parametrize("stream_json", [True, False])
+@respx.mock
+@pytest.mark.asyncio
+async def test_get_comments_ranks_by_full_depth_and_keeps_first_of_ties(story, stream_json):
+    """Ranking should count replies past max_depth, which are still dropped; ties keep page order."""
+    if stream_json:
+        pytest.importorskip("ijson")
+    service = CommentService(timeout=1.0, max_depth=1, stream_json=stream_json, max_roots=3)
+    response_data = {
+        "id": story.story_id,
+        "children": [_thread(2, 1, 2), _thread(3, 5, 2), _thread(4, 1, 3), _thread(5, 1, 3)],
+    }
+    respx.get(f"https://hn.algolia.com/api/v1/items/{story.story_id}").mock(
+        return_value=Response(200, json=response_data)
+    )
+
+    comments = await service.get_comments_for_story(story)
+
+    # Thread 3 has 62 replies over 5 levels, even though only its first level is kept
+    assert [comment.comment_id for comment in comments] == [3, 4, 5]
+    assert [child.comment_id for child in comments[0].children] == [30, 31]
+    assert all(child.children == () for child in comments[0].children)
+    assert [child.comment_id for child in comments[1].children] == [40, 41, 42]
+    assert comments[1].author == "user4"
+    assert comments[1].created_at.year == 2025
+
+
+@pytest.mark.parametrize("stream_json", [True, False])
+def test_tree_builder_stats_and_children_limit(stream_json):
+    """Thread stats cover the full tree; kept replies are the largest subtrees."""
+    thread = _thread(1, 0, 0)
+    thread["children"] = [_thread(10, 0, 0), _thread(11, 2, 2), _thread(12, 0, 0), _thread(13, 1, 1)]
+    thread["children"][0]["author"] = "user1"
+    builder = CommentTreeBuilder(max_depth=1, max_roots=1, max_children=2)
+    if stream_json:
+        ijson = pytest.importorskip("ijson")
+        for event, value in ijson.basic_parse(json.dumps({"children": [thread]}).encode()):
+            builder.feed(event, value)
+    else:
+        builder.add_thread(thread)
+
+    [comment] = builder.result()
+
+    assert [child.comment_id for child in comment.children] == [11, 13]
+    assert builder.thread_stats[1] == ThreadStats(descendants=11, max_depth=3, authors=11)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_get_comments_uses_cache_until_story_grows(story, tmp_path):
+    """A cached story should only be refetched once it gains enough comments."""
+    service = CommentService(timeout=1.0, cache=CommentCache(str(tmp_path), max_growth=10))
+    route = respx.get(f"https://hn.algolia.com/api/v1/items/{story.story_id}").mock(
+        return_value=Response(200, json={"id": story.story_id, "children": [_thread(2, 1, 2)]})
+    )
+
+    first = await service.get_comments_for_story(story)
+    second = await service.get_comments_for_story(replace(story, num_comments=110))
+    third = await service.get_comments_for_story(replace(story, num_comments=111))
+
+    assert route.call_count == 2
+    assert first == second == third
+    assert [child.comment_id for child in second[0].children] == [20, 21]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_huge_story_fetches_only_leading_threads(story):
+    """Above the threshold only the first listed top-level threads should be fetched."""
+    story = replace(story, num_comments=5000)
+    service = CommentService(timeout=1.0, stream_json=False, partial_threshold=1000, partial_candidates=3)
+    respx.get(f"https://hacker-news.firebaseio.com/v0/item/{story.story_id}.json").mock(
+        return_value=Response(200, json={"id": story.story_id, "kids": [2, 3, 4, 5, 6]})
+    )
+    for comment_id, depth in ((2, 1), (3, 3), (4, 2)):
+        respx.get(f"https://hn.algolia.com/api/v1/items/{comment_id}").mock(
+            return_value=Response(200, json=_thread(comment_id, depth, 2))
+        )
+    full_tree = respx.get(f"https://hn.algolia.com/api/v1/items/{story.story_id}")
+
+    comments = await service.get_comments_for_story(story)
+
+    assert [comment.comment_id for comment in comments] == [3, 4]
+    assert not full_tree.called
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_huge_story_falls_back_to_full_tree_without_listing(story):
+    """If the top-level listing is unavailable the full tree should be fetched."""
+    story = replace(story, num_comments=5000)
+    service = CommentService(timeout=1.0, stream_json=False, partial_threshold=1000)
+    respx.get(f"https://hacker-news.firebaseio.com/v0/item/{story.story_id}.json").mock(
+        return_value=Response(503)
+    )
+    respx.get(f"https://hn.algolia.com/api/v1/items/{story.story_id}").mock(
+        return_value=Response(200, json={"id": story.story_id, "children": [_thread(2, 1, 2)]})
+    )
+
+    comments = await service.get_comments_for_story(story)
+
+    assert [comment.comment_id for comment in comments] == [2]
@@ -0,0 +1,186 @@
+"""Tests for content-type routing of fetched bodies."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import respx
+from httpx import Response
+
+from hn_daily.models import Story
+from hn_daily.services.content_router import ContentRouter, sniff
+from hn_daily.services.crawler_service import CrawlerService
+
+
+def _make_story(url: str) -> Story:
+    """Create a story linking to ``url``."""
+    return Story(
+        object_id="1",
+        title="",
+        url=url,
+        author="tester",
+        points=10,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        story_id=1,
+        num_comments=0,
+    )
+
+
+def _make_pdf(pages: list[str], title: str = "Test PDF") -> bytes:
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        f"<< /Title ({title}) >>".encode(),
+    ]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append((
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        ).encode())
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R /Info 4 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+@pytest.mark.parametrize("content_type, head, expected", [
+    ("text/html; charset=utf-8", b"<!DOCTYPE html><html>", "html"),
+    ("text/plain", b"<html><body><p>mislabeled</p>", "html"),
+    ("text/markdown", b"# Title\n\nSome text", "text"),
+    ("", b"Just some words", "text"),
+    ("application/pdf", b"", "pdf"),
+    ("application/octet-stream", b"%PDF-1.7\n", "pdf"),
+    ("application/octet-stream", b"PK\x03\x04\x14\x00", "binary"),
+    ("text/html", b"\x89PNG\r\n\x1a\n", "binary"),
+    ("", b"\x00\x00\x00\x20ftypisom", "binary"),
+    ("video/mp4", b"", "binary"),
+])
+def test_sniff_trusts_first_bytes_over_headers(content_type, head, expected):
+    """Signatures in the first bytes should win over a missing or wrong Content-Type."""
+    assert sniff(content_type, head) == expected
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fallback_cuts_off_html_at_the_text_limit():
+    """Long HTML bodies should be streamed only up to the byte cap."""
+    url = "https://example.com/huge"
+    respx.get(url).mock(return_value=Response(
+        200, content=b"<html><body>" + b"<p>" + b"word " * 200_000 + b"</p>",
+        headers={"content-type": "text/html"},
+    ))
+    service = CrawlerService(content_router=ContentRouter(max_text_bytes=10_000))
+
+    result = await service._fallback_fetch(url, "Huge")
+
+    assert result.success is True
+    assert 9_000 < len(result.markdown_content) <= 10_000
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_binary_download_ends_the_ladder_without_the_browser():
+    """An archive behind an article link should be rejected after its first bytes."""
+    url = "https://example.com/download"
+    respx.get(url).mock(return_value=Response(
+        200, content=b"PK\x03\x04" + b"\x00" * 50_000, headers={"content-type": "application/octet-stream"},
+    ))
+    service = CrawlerService(use_jina_reader=False)
+
+    with patch.object(service, "_crawl_with_browser", AsyncMock()) as browser_mock:
+        # Direct fetch first, as domain stats order it on sites where it works
+        with patch.object(service, "_tiers_for", return_value=["fallback", "browser"]):
+            result = await service.crawl_story(_make_story(url))
+
+    assert result.success is False
+    assert result.failure.reason == "binary_content"
+    browser_mock.assert_not_awaited()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_video_is_rejected_from_its_headers():
+    """Media types should be rejected before the body is read."""
+    url = "https://example.com/talk.mp4"
+    respx.get(url).mock(return_value=Response(200, content=b"\x00" * 1000, headers={"content-type": "video/mp4"}))
+    service = CrawlerService()
+
+    result = await service._fallback_fetch(url, "Talk")
+
+    assert result.failure.reason == "binary_content"
+    assert result.failure.kind == "permanent"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_pdf_over_declared_size_limit_is_not_downloaded():
+    """A PDF whose Content-Length is over the limit should be refused up front."""
+    url = "https://example.com/report"
+    respx.get(url).mock(return_value=Response(
+        200, content=b"%PDF-1.4\n" + b"0" * 2000,
+        headers={"content-type": "application/pdf", "content-length": str(500_000_000)},
+    ))
+    service = CrawlerService(content_router=ContentRouter(max_pdf_bytes=1_000_000))
+
+    result = await service._fallback_fetch(url, "Report")
+
+    assert result.failure.reason == "too_large"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_pdf_link_uses_text_extractor_instead_of_the_browser():
+    """PDF links should be read with the page-limited extractor and never reach the browser."""
+    pytest.importorskip("pypdf")
+    url = "https://example.com/papers/paper.pdf"
+    respx.get(url).mock(return_value=Response(
+        200,
+        content=_make_pdf([f"Page {number} discusses sparse attention in some detail" for number in range(1, 6)]),
+        headers={"content-type": "application/pdf"},
+    ))
+    service = CrawlerService(content_router=ContentRouter(max_pdf_pages=3))
+
+    with patch.object(service, "_crawl_with_browser", AsyncMock()) as browser_mock:
+        result = await service.crawl_story(_make_story(url))
+
+    assert result.success is True
+    assert result.tier == "pdf"
+    assert result.title == "Test PDF"
+    assert "Page 3 discusses" in result.markdown_content
+    assert "Page 4" not in result.markdown_content
+    assert "first 3 of 5 pages" in result.markdown_content
+    browser_mock.assert_not_awaited()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fallback_reads_pdf_served_without_pdf_extension():
+    """A PDF behind an extensionless URL should be detected from its first bytes."""
+    pytest.importorskip("pypdf")
+    url = "https://example.com/download?id=7"
+    respx.get(url).mock(return_value=Response(
+        200,
+        content=_make_pdf(["Quarterly results were strong across all of the regions we track"]),
+        headers={"content-type": "application/octet-stream"},
+    ))
+    service = CrawlerService()
+
+    result = await service._fallback_fetch(url, "")
+
+    assert result.success is True
+    assert result.title == "Test PDF"
+    assert "Quarterly results" in result.markdown_content
@@ -1,14 +1,22 @@
 """Tests for CrawlerService."""
 
+import asyncio
+import time
+from dataclasses import replace
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from hn_daily.models import CrawlResult, Story
-from hn_daily.services.crawler_service import CrawlerService
+from hn_daily.models import CrawlFailure, CrawlResult, Story
+from hn_daily.services.browser_pool import BrowserPool
+from hn_daily.services.cache_service import ContentCache
+from hn_daily.services.crawler_service import CrawlerService, classify_exception, score_content
+from hn_daily.services.domain_stats import DomainStats
 
 
 def _make_story(url: str | None = "https://example.com/article") -> Story:
@@ -132,3 +140,318 @@ async def test_fetch_with_jina_reader_returns_markdown_content():
 
     assert result.success is True
     assert result.markdown_content.startswith("# Article")
+
+
+class FakeWebCrawler:
+    """Stand-in for crawl4ai's AsyncWebCrawler that counts launches."""
+
+    instances = 0
+
+    def __init__(self, config=None):
+        FakeWebCrawler.instances += 1
+        self.started = False
+        self.closed = False
+
+    async def start(self):
+        self.started = True
+
+    async def close(self):
+        self.closed = True
+
+    async def arun(self, url, config=None):
+        return SimpleNamespace(
+            success=True,
+            markdown="# Article\n\n" + ("Detailed content.\n" * 20),
+            error_message=None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_do_crawl_reuses_one_browser_across_crawls():
+    """Browser crawls should share a single launched browser until close."""
+    FakeWebCrawler.instances = 0
+    service = CrawlerService(use_jina_reader=False)
+
+    with patch.object(BrowserPool, "_create_crawler", lambda pool: FakeWebCrawler()):
+        await service.start()
+        first = await service._do_crawl("https://example.com/a", "A")
+        second = await service._do_crawl("https://example.com/b", "B")
+        crawler = service.browser_pool._crawler
+        await service.close()
+
+    assert first.success is True
+    assert second.success is True
+    assert FakeWebCrawler.instances == 1
+    assert crawler.closed is True
+    assert service.browser_pool.is_started is False
+
+
+@pytest.mark.asyncio
+async def test_crawl_story_serves_cached_result_without_crawling(tmp_path):
+    """A cached crawl without validators should be returned without any fetch."""
+    cache = ContentCache(str(tmp_path))
+    service = CrawlerService(cache=cache)
+    story = _make_story()
+    cache.put(story.url, _make_result(url=story.url))
+
+    with patch.object(service, "_crawl_with_retry", AsyncMock()) as crawl_mock:
+        result = await service.crawl_story(story)
+
+    assert result.success is True
+    assert result.from_cache is True
+    crawl_mock.assert_not_awaited()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_crawl_story_uses_changed_page_from_revalidation(tmp_path):
+    """A changed page should be taken from the conditional GET instead of being fetched again."""
+    cache = ContentCache(str(tmp_path))
+    service = CrawlerService(cache=cache)
+    story = _make_story()
+    cache.put(story.url, CrawlResult(
+        url=story.url,
+        title=story.title,
+        markdown_content="Old content",
+        success=True,
+        validators={"etag": '"v1"'},
+    ))
+    route = respx.get(story.url).mock(return_value=Response(
+        200, html="<html><body><p>New content</p></body></html>", headers={"etag": '"v2"'},
+    ))
+
+    with patch.object(service, "_crawl_with_retry", AsyncMock()) as crawl_mock:
+        result = await service.crawl_story(story)
+
+    assert route.call_count == 1
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+    assert result.from_cache is False
+    assert result.markdown_content == "New content"
+    crawl_mock.assert_not_awaited()
+    assert cache.get(story.url)["validators"] == {"etag": '"v2"'}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_crawl_story_recrawls_when_changed_page_is_unusable(tmp_path):
+    """A changed page the direct fetch cannot use should go through the crawl tiers."""
+    cache = ContentCache(str(tmp_path))
+    service = CrawlerService(cache=cache)
+    story = _make_story()
+    cache.put(story.url, replace(_make_result(url=story.url, markdown_content="Old content"), validators={"etag": '"v1"'}))
+    respx.get(story.url).mock(return_value=Response(404))
+
+    with patch.object(service, "_crawl_with_retry", AsyncMock(return_value=_make_result(url=story.url))) as crawl_mock:
+        result = await service.crawl_story(story)
+
+    crawl_mock.assert_awaited_once()
+    assert result.from_cache is False
+    assert cache.get(story.url)["markdown_content"] == result.markdown_content
+
+
+@pytest.mark.asyncio
+async def test_crawl_story_refresh_bypasses_cache(tmp_path):
+    """Refresh mode should crawl even when a cached copy exists."""
+    cache = ContentCache(str(tmp_path))
+    service = CrawlerService(cache=cache, refresh_cache=True)
+    story = _make_story()
+    cache.put(story.url, _make_result(url=story.url, markdown_content="Old content"))
+
+    with patch.object(service, "_crawl_with_retry", AsyncMock(return_value=_make_result(url=story.url))) as crawl_mock:
+        result = await service.crawl_story(story)
+
+    crawl_mock.assert_awaited_once()
+    assert result.from_cache is False
+
+
+@pytest.mark.asyncio
+async def test_crawl_story_stops_ladder_when_story_budget_runs_out():
+    """A slow tier should be cut off and no further tiers tried once the budget is spent."""
+    service = CrawlerService(story_budget=0.1, initial_delay=0)
+    story = _make_story()
+
+    async def slow_reader(url, title):
+        await asyncio.sleep(5)
+
+    with patch.object(service, "_fetch_with_jina_reader", side_effect=slow_reader), \
+         patch.object(service, "_do_crawl", AsyncMock()) as crawl_mock, \
+         patch.object(service, "_fallback_fetch", AsyncMock()) as fallback_mock:
+        result = await asyncio.wait_for(service.crawl_story(story), 1.0)
+
+    assert result.success is False
+    assert "budget" in result.error_message
+    crawl_mock.assert_not_awaited()
+    fallback_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_crawl_story_skips_tiers_that_keep_failing_on_the_domain(tmp_path):
+    """Known-bad tiers should be skipped and the tier that works tried first."""
+    stats = DomainStats(str(tmp_path / "domains.json"), failure_threshold=1)
+    stats.record("example.com", "jina", False, 1.0, "Jina Reader returned insufficient content")
+    stats.record("example.com", "fallback", True, 0.2)
+    service = CrawlerService(domain_stats=stats)
+    story = _make_story()
+
+    with patch.object(service, "_fetch_with_jina_reader", AsyncMock()) as reader_mock, \
+         patch.object(service, "_do_crawl", AsyncMock()) as crawl_mock, \
+         patch.object(service, "_fallback_fetch", AsyncMock(return_value=_make_result(is_fallback=True))) as fallback_mock:
+        result = await service.crawl_story(story)
+
+    assert result.success is True
+    reader_mock.assert_not_awaited()
+    crawl_mock.assert_not_awaited()
+    fallback_mock.assert_awaited_once_with(story.url, story.title)
+    assert stats.get("example.com", "fallback").successes == 2
+
+
+@pytest.mark.asyncio
+async def test_crawl_story_counts_only_origin_failures_in_domain_stats(tmp_path):
+    """Jina's quota errors and the story budget should not open a domain's circuit."""
+    stats = DomainStats(str(tmp_path / "domains.json"))
+    service = CrawlerService(domain_stats=stats)
+    story = _make_story()
+
+    def failed(reason: str, tier: str, status_code: int | None = None) -> CrawlResult:
+        return service._failed(story.url, story.title, CrawlFailure(CrawlFailure.TRANSIENT, reason, tier, status_code))
+
+    with patch.object(service, "_fetch_with_jina_reader", AsyncMock(return_value=failed("forbidden", "jina", 402))), \
+         patch.object(service, "_crawl_with_browser", AsyncMock(return_value=failed("budget_exhausted", "browser"))), \
+         patch.object(service, "_fallback_fetch", AsyncMock(return_value=failed("rate_limited", "fallback", 429))):
+        result = await service.crawl_story(story)
+
+    assert result.success is False
+    assert stats.get("example.com", "jina") is None
+    assert stats.get("example.com", "browser") is None
+    assert stats.get("example.com", "fallback").reasons == {"rate_limited": 1}
+
+
+def test_classify_exception_separates_permanent_from_transient():
+    """404s, DNS and TLS errors are permanent; timeouts and 5xx are transient."""
+    request = httpx.Request("GET", "https://example.com/")
+
+    def status_error(code: int) -> httpx.HTTPStatusError:
+        return httpx.HTTPStatusError("error", request=request, response=httpx.Response(code, request=request))
+
+    assert classify_exception(status_error(404)) == ("permanent", "not_found")
+    assert classify_exception(status_error(503)) == ("transient", "server_error")
+    assert classify_exception(httpx.ConnectError("[Errno -2] Name or service not known")) == ("permanent", "dns")
+    assert classify_exception(httpx.ConnectError("[SSL: CERTIFICATE_VERIFY_FAILED] certificate verify failed")) == ("permanent", "tls")
+    assert classify_exception(httpx.ReadTimeout("timed out")) == ("transient", "timeout")
+    assert classify_exception(httpx.ConnectError("Connection reset by peer")) == ("transient", "network")
+    assert classify_exception(RuntimeError("net::ERR_CONNECTION_REFUSED at https://example.com/")) == ("transient", "network")
+
+
+@pytest.mark.asyncio
+async def test_crawl_story_does_not_retry_permanent_failures():
+    """A permanent browser failure should not be retried, and a 404 should end the ladder."""
+    service = CrawlerService(max_retries=3, initial_delay=0, use_jina_reader=False)
+    story = _make_story()
+    not_found = CrawlFailure(CrawlFailure.PERMANENT, "not_found", "browser", 404)
+    failed = CrawlResult(
+        url=story.url, title=story.title, markdown_content="", success=False,
+        error_message=not_found.describe(), failures=(not_found,),
+    )
+
+    with patch.object(service, "_do_crawl", AsyncMock(return_value=failed)) as crawl_mock, \
+         patch.object(service, "_fallback_fetch", AsyncMock()) as fallback_mock:
+        result = await service.crawl_story(story)
+
+    assert result.success is False
+    assert crawl_mock.await_count == 1
+    fallback_mock.assert_not_awaited()
+    assert result.failure == not_found
+    assert result.error_message == "browser: not_found"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_failed_crawl_carries_one_structured_failure_per_tier():
+    """Each tier's failure should be recorded with its kind and reason."""
+    service = CrawlerService(max_retries=1, initial_delay=0)
+    story = _make_story()
+    respx.get(f"https://r.jina.ai/{story.url}").mock(return_value=Response(200, text="short"))
+    respx.get(story.url).mock(return_value=Response(503))
+
+    with patch.object(service, "_do_crawl", AsyncMock(side_effect=RuntimeError("browser crashed"))):
+        result = await service.crawl_story(story)
+
+    assert [(f.tier, f.kind, f.reason) for f in result.failures] == [
+        ("jina", "content", "insufficient_content"),
+        ("browser", "transient", "error"),
+        ("fallback", "transient", "server_error"),
+    ]
+    assert result.failures[2].status_code == 503
+
+
+ARTICLE = "\n\n".join(f"Paragraph {i} of a readable article with enough prose to count as content. " * 4 for i in range(8))
+
+
+def test_score_content_prefers_articles_over_walls_and_link_lists():
+    """Readable prose should score high; bot checks and link lists low."""
+    links = "\n".join(f"[Link {i}](https://example.com/{i})" for i in range(60))
+
+    assert score_content(ARTICLE) > 0.8
+    assert score_content("Just a moment... Verify you are human to continue.") < 0.2
+    assert score_content(links) < 0.5
+
+
+@pytest.mark.asyncio
+async def test_hedged_crawl_takes_fast_direct_fetch_and_cancels_jina():
+    """In hedged mode a good direct fetch should win without waiting for Jina."""
+    service = CrawlerService(hedge_delay=0.05)
+    story = _make_story()
+    jina_cancelled = asyncio.Event()
+
+    async def slow_jina(url, title):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            jina_cancelled.set()
+            raise
+
+    direct = replace(_make_result(markdown_content=ARTICLE, is_fallback=True), tier="fallback")
+    with patch.object(service, "_fetch_with_jina_reader", side_effect=slow_jina), \
+         patch.object(service, "_do_crawl", AsyncMock()) as crawl_mock, \
+         patch.object(service, "_fallback_fetch", AsyncMock(return_value=direct)):
+        started = time.monotonic()
+        result = await service.crawl_story(story)
+        elapsed = time.monotonic() - started
+
+    assert result.tier == "fallback"
+    assert elapsed < 1.0
+    assert jina_cancelled.is_set()
+    crawl_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_hedged_crawl_uses_browser_only_when_both_results_are_poor():
+    """Low-quality Jina and direct results should send the story to the browser."""
+    service = CrawlerService(hedge_delay=0.01, initial_delay=0)
+    story = _make_story()
+    wall = _make_result(markdown_content="Just a moment... Verify you are human. " * 5)
+    browser = replace(_make_result(markdown_content=ARTICLE), tier="browser")
+
+    with patch.object(service, "_fetch_with_jina_reader", AsyncMock(return_value=wall)), \
+         patch.object(service, "_do_crawl", AsyncMock(return_value=browser)) as crawl_mock, \
+         patch.object(service, "_fallback_fetch", AsyncMock(return_value=wall)) as fallback_mock:
+        result = await service.crawl_story(story)
+
+    assert result.tier == "browser"
+    fallback_mock.assert_awaited_once()
+    crawl_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_short_page_outside_the_race_is_not_quality_checked():
+    """A short Ask HN text from the browser should be kept rather than the whole item page."""
+    service = CrawlerService(hedge_delay=0.01)
+    story = _make_story("https://news.ycombinator.com/item?id=12345")
+    toptext = replace(_make_result(url=story.url, markdown_content="Ask HN: how do you keep notes across projects?"), tier="browser")
+
+    with patch.object(service, "_do_crawl", AsyncMock(return_value=toptext)), \
+         patch.object(service, "_fallback_fetch", AsyncMock()) as fallback_mock:
+        result = await service.crawl_story(story)
+
+    assert result.tier == "browser"
+    fallback_mock.assert_not_awaited()
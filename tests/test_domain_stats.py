@@ -0,0 +1,39 @@
+"""Tests for per-domain crawl stats."""
+
+import time
+
+from hn_daily.services.domain_stats import DomainStats, domain_of
+
+
+def test_domain_of_strips_www():
+    """www and bare hosts should share stats."""
+    assert domain_of("https://www.Example.com/a?b=1") == "example.com"
+
+
+def test_circuit_opens_after_consecutive_failures_and_closes_after_cooldown(tmp_path):
+    """A tier should be skipped after repeated failures until the cooldown passes."""
+    stats = DomainStats(str(tmp_path / "domains.json"), failure_threshold=2, cooldown=60)
+    stats.record("example.com", "browser", False, 3.0, "Crawl returned insufficient content")
+    assert not stats.is_open("example.com", "browser")
+    stats.record("example.com", "browser", False, 3.0, "Crawl returned insufficient content")
+
+    assert stats.is_open("example.com", "browser")
+    assert stats.tier_order("example.com", ["jina", "browser", "fallback"]) == ["jina", "fallback"]
+
+    stats.get("example.com", "browser").last_failure_at = time.time() - 61
+    assert not stats.is_open("example.com", "browser")
+
+
+def test_tier_order_prefers_recent_successes_and_persists(tmp_path):
+    """Tiers that work on a domain should move ahead of ones that fail there."""
+    path = str(tmp_path / "domains.json")
+    stats = DomainStats(path)
+    stats.record("blog.example", "jina", False, 1.0, "Jina Reader returned insufficient content")
+    stats.record("blog.example", "fallback", True, 0.5)
+    stats.save()
+
+    reloaded = DomainStats(path)
+
+    assert reloaded.tier_order("blog.example", ["jina", "browser", "fallback"]) == ["fallback", "browser", "jina"]
+    assert reloaded.tier_order("other.example", ["jina", "browser", "fallback"]) == ["jina", "browser", "fallback"]
+    assert reloaded.get("blog.example", "jina").reasons == {"Jina Reader returned insufficient content": 1}
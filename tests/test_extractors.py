@@ -0,0 +1,134 @@
+"""Tests for the site-specific extractors, against offline fixtures."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import respx
+from httpx import Response
+
+from hn_daily.models import CrawlResult, Story
+from hn_daily.services.crawler_service import CrawlerService
+from hn_daily.services.extractors import ExtractorRegistry
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "extractors"
+
+
+def _make_story(url: str) -> Story:
+    """Create a story linking to ``url``."""
+    return Story(
+        object_id="1",
+        title="",
+        url=url,
+        author="tester",
+        points=10,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        story_id=1,
+        num_comments=0,
+    )
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://github.com/octo/tool", "GitHubRepoExtractor"),
+    ("https://github.com/octo/tool.git", "GitHubRepoExtractor"),
+    ("https://github.com/octo/tool/issues/42", "GitHubIssueExtractor"),
+    ("https://github.com/octo/tool/pull/7#discussion", "GitHubIssueExtractor"),
+    ("https://github.com/octo/tool/blob/main/docs/guide.md", "GitHubFileExtractor"),
+    ("https://arxiv.org/abs/2401.01234v2", "ArxivExtractor"),
+    ("https://arxiv.org/pdf/2401.01234.pdf", "ArxivExtractor"),
+    ("https://example.com/notes/plan.txt", "PlainTextExtractor"),
+    ("https://github.com/orgs/octo", None),
+    ("https://github.com/octo/tool/tree/main/src", None),
+    ("https://example.com/article", None),
+])
+def test_registry_routes_urls_to_extractors(url, expected):
+    """Each URL should be claimed by the right extractor, or by none."""
+    found = ExtractorRegistry.default().find(url)
+    assert (type(found[0]).__name__ if found else None) == expected
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_github_repo_uses_raw_readme():
+    """A repository link should be crawled from its raw README."""
+    respx.get("https://api.github.com/repos/octo/tool/readme").mock(
+        return_value=Response(200, text=(FIXTURES / "github_readme.md").read_text())
+    )
+    service = CrawlerService(extractors=ExtractorRegistry.default())
+
+    result = await service.crawl_story(_make_story("https://github.com/octo/tool"))
+
+    assert result.success is True
+    assert result.tier == "github"
+    assert result.title == "octo/tool"
+    assert result.markdown_content.startswith("# example-tool")
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_github_issue_uses_issue_json():
+    """An issue link should be rendered from the REST API JSON."""
+    respx.get("https://api.github.com/repos/octo/tool/issues/42").mock(
+        return_value=Response(200, text=(FIXTURES / "github_issue_42.json").read_text())
+    )
+    service = CrawlerService()
+
+    result = await service.crawl_story(_make_story("https://github.com/octo/tool/issues/42"))
+
+    assert result.tier == "github"
+    assert result.title == "Crash when parsing empty config"
+    assert "Issue #42 in octo/tool by octocat (open)" in result.markdown_content
+    assert "## Steps to reproduce" in result.markdown_content
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_arxiv_pdf_link_uses_abstract_from_export_api():
+    """A PDF link should be crawled as the paper's abstract."""
+    route = respx.get("https://export.arxiv.org/api/query").mock(
+        return_value=Response(200, text=(FIXTURES / "arxiv_2401.01234.xml").read_text())
+    )
+    service = CrawlerService()
+
+    result = await service.crawl_story(_make_story("https://arxiv.org/pdf/2401.01234v2"))
+
+    assert route.calls.last.request.url.params["id_list"] == "2401.01234v2"
+    assert result.tier == "arxiv"
+    assert result.title == "Sparse Attention for Long Context Retrieval"
+    assert "*Ada Lovelace, Alan Turing*" in result.markdown_content
+    assert "submitted 2024-01-02" in result.markdown_content
+    assert "We study sparse attention patterns" in result.markdown_content
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_plain_text_file_is_used_as_is():
+    """Markdown files should be fetched directly without any rendering."""
+    respx.get("https://example.com/README.md").mock(
+        return_value=Response(200, text=(FIXTURES / "github_readme.md").read_text(), headers={"content-type": "text/markdown"})
+    )
+    service = CrawlerService()
+
+    result = await service.crawl_story(_make_story("https://example.com/README.md"))
+
+    assert result.tier == "text"
+    assert "## Usage" in result.markdown_content
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_failed_extractor_falls_through_to_generic_tiers():
+    """A repo without a README should still be crawled by the generic ladder."""
+    respx.get("https://api.github.com/repos/octo/tool/readme").mock(return_value=Response(404))
+    service = CrawlerService()
+    story = _make_story("https://github.com/octo/tool")
+    generic = CrawlResult(url=story.url, title="", markdown_content="Content " * 30, success=True, tier="jina")
+
+    with patch.object(service, "_fetch_with_jina_reader", AsyncMock(return_value=generic)) as reader_mock:
+        result = await service.crawl_story(story)
+
+    assert result.tier == "jina"
+    assert result.failures == ()
+    reader_mock.assert_awaited_once()
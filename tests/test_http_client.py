@@ -0,0 +1,127 @@
+"""Tests for the shared HttpClient."""
+
+import asyncio
+import time
+
+import pytest
+import respx
+from httpx import Response
+
+from hn_daily.services.http_client import HttpClient
+from hn_daily.services.rate_limiter import RateLimited, TokenBucket, parse_retry_after
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_get_limits_concurrent_requests_per_host():
+    """Requests to one host should not exceed max_connections_per_host."""
+    http = HttpClient(max_connections_per_host=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_response(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Response(200, text="ok")
+
+    respx.get(url__startswith="https://example.com/").mock(side_effect=slow_response)
+    respx.get("https://other.example.org/").mock(return_value=Response(200, text="other"))
+
+    responses = await asyncio.gather(
+        *(http.get(f"https://example.com/{i}") for i in range(6)),
+        http.get("https://other.example.org/"),
+    )
+    await http.close()
+
+    assert all(response.status_code == 200 for response in responses)
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_get_client_reuses_one_pooled_client():
+    """All callers should share the same underlying client until close."""
+    http = HttpClient()
+
+    first = await http.get_client()
+    second = await http.get_client()
+    await http.close()
+
+    assert first is second
+    assert first.is_closed
+    assert http._client is None
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_burst():
+    """Requests beyond the burst should be spaced at the configured rate."""
+    bucket = TokenBucket(rate=50, burst=2)
+
+    started = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_does_not_refill_during_a_block():
+    """Once a block lifts, tokens should only have built up since it lifted."""
+    bucket = TokenBucket(rate=20, burst=10)
+    await asyncio.sleep(0.1)
+
+    bucket.block(0.1)
+    await asyncio.sleep(0.16)
+    await bucket.acquire()
+    started = time.monotonic()
+    await bucket.acquire()
+
+    # About one token built up after the block; the second request waits for the next
+    assert time.monotonic() - started >= 0.02
+
+
+def test_parse_retry_after_accepts_seconds_and_dates():
+    """Retry-After may be delay seconds or an HTTP date."""
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_get_waits_out_short_retry_after():
+    """A 429 with a short Retry-After should be retried on the same request."""
+    http = HttpClient()
+    route = respx.get("https://api.example.com/x").mock(side_effect=[
+        Response(429, headers={"Retry-After": "0"}),
+        Response(200, text="ok"),
+    ])
+
+    response = await http.get("https://api.example.com/x")
+    await http.close()
+
+    assert response.status_code == 200
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_long_retry_after_blocks_host_without_retrying():
+    """A long Retry-After should be returned as is and make later requests fail fast."""
+    http = HttpClient(max_retry_after=5)
+    route = respx.get(url__startswith="https://api.example.com/").mock(
+        return_value=Response(429, headers={"Retry-After": "120"})
+    )
+    respx.get("https://other.example.org/").mock(return_value=Response(200))
+
+    first = await http.get("https://api.example.com/a")
+    with pytest.raises(RateLimited):
+        await http.get("https://api.example.com/b")
+    other = await http.get("https://other.example.org/")
+    await http.close()
+
+    assert first.status_code == 429
+    assert route.call_count == 1
+    assert other.status_code == 200
@@ -0,0 +1,56 @@
+"""Startup import budget tests."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Generous ceiling for importing the CLI; the browser stack alone exceeds it
+IMPORT_BUDGET_US = 1_000_000
+BROWSER_STACK = ("crawl4ai", "playwright", "patchright")
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Run Python with -X importtime and return cumulative microseconds per module."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def _browser_modules(times: dict[str, int]) -> list[str]:
+    return [name for name in times if name.split(".")[0] in BROWSER_STACK]
+
+
+def test_importing_cli_does_not_load_browser_stack():
+    """Importing the CLI should not pull in crawl4ai or Playwright."""
+    times = _import_times("-c", "import hn_daily.cli")
+
+    assert _browser_modules(times) == []
+    assert times["hn_daily.cli"] < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("args", [
+    ("-m", "hn_daily", "--help"),
+    ("-c", "from hn_daily.services import CrawlerService; CrawlerService()"),
+])
+def test_help_and_crawler_setup_do_not_load_browser_stack(args):
+    """--help and constructing the crawler should stay off the browser stack."""
+    times = _import_times(*args)
+
+    assert _browser_modules(times) == []
+
@@ -0,0 +1,175 @@
+"""Tests for the staged story pipeline."""
+
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from hn_daily.models import CrawlResult, Story
+from hn_daily.pipeline import StoryPipeline
+
+
+def _make_story(story_id: int) -> Story:
+    """Create a sample story."""
+    return Story(
+        object_id=str(story_id),
+        title=f"Story {story_id}",
+        url=f"https://example.com/{story_id}",
+        author="testuser",
+        points=100,
+        created_at=datetime(2025, 1, 19, 10, 0, 0, tzinfo=timezone.utc),
+        story_id=story_id,
+        num_comments=5,
+    )
+
+
+class FakeCommentService:
+    def __init__(self, delays: dict[int, float] | None = None):
+        self.delays = delays or {}
+
+    async def get_comments_for_story(self, story):
+        await asyncio.sleep(self.delays.get(story.story_id, 0))
+        return []
+
+
+class FakeCrawlerService:
+    def __init__(self, delays: dict[int, float] | None = None, failures: set[int] | None = None):
+        self.delays = delays or {}
+        self.failures = failures or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def crawl_story(self, story):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(story.story_id, 0.01))
+        finally:
+            self.in_flight -= 1
+        if story.story_id in self.failures:
+            raise RuntimeError("boom")
+        return CrawlResult(
+            url=story.url,
+            title=story.title,
+            markdown_content="Content",
+            success=True,
+        )
+
+
+class FakeStorageService:
+    def __init__(self):
+        self.saved = []
+
+    def save_content(self, story, crawl_result, comments):
+        if not crawl_result.success:
+            return None
+        self.saved.append(story.story_id)
+        return Path(f"{story.story_id}.md")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_preserves_input_order():
+    """Results should follow input order even when later stories finish first."""
+    stories = [_make_story(i) for i in range(1, 6)]
+    crawler = FakeCrawlerService(delays={1: 0.05, 2: 0.04, 3: 0.0, 4: 0.02, 5: 0.0})
+    storage = FakeStorageService()
+    pipeline = StoryPipeline(FakeCommentService(), crawler, storage, crawl_concurrency=5)
+
+    jobs = await pipeline.run(stories)
+
+    assert [job.story.story_id for job in jobs] == [1, 2, 3, 4, 5]
+    assert all(job.success for job in jobs)
+    assert storage.saved[0] != 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_bounds_crawl_concurrency():
+    """No more than crawl_concurrency stories should be crawled at once."""
+    stories = [_make_story(i) for i in range(1, 11)]
+    crawler = FakeCrawlerService()
+    pipeline = StoryPipeline(FakeCommentService(), crawler, FakeStorageService(), crawl_concurrency=3)
+
+    await pipeline.run(stories)
+
+    assert crawler.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_pipeline_records_crawl_exception_as_failure():
+    """A crawler exception should fail that story without stopping the others."""
+    stories = [_make_story(i) for i in range(1, 4)]
+    crawler = FakeCrawlerService(failures={2})
+    done = []
+    pipeline = StoryPipeline(
+        FakeCommentService(), crawler, FakeStorageService(),
+        on_job_done=lambda job: done.append(job.story.story_id),
+    )
+
+    jobs = await pipeline.run(stories)
+
+    assert [job.success for job in jobs] == [True, False, True]
+    assert "boom" in jobs[1].crawl_result.error_message
+    assert sorted(done) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_deadline_keeps_finished_stories_and_cancels_the_rest():
+    """Stories saved before the deadline should be kept; slow ones cancelled."""
+    stories = [_make_story(i) for i in range(1, 4)]
+    crawler = FakeCrawlerService(delays={1: 0.0, 2: 5.0, 3: 5.0})
+    storage = FakeStorageService()
+    done = []
+    pipeline = StoryPipeline(
+        FakeCommentService(), crawler, storage,
+        on_job_done=lambda job: done.append(job.story.story_id),
+    )
+
+    deadline = asyncio.get_running_loop().time() + 0.2
+    jobs = await pipeline.run(stories, deadline)
+
+    assert [job.success for job in jobs] == [True, False, False]
+    assert storage.saved == [1]
+    assert jobs[1].error == "Cancelled at run deadline"
+    assert sorted(done) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stops_scheduling_once_success_target_is_reached():
+    """Only as many drafts as the target should be saved, walking down the ranking."""
+    stories = [_make_story(i) for i in range(1, 21)]
+    crawler = FakeCrawlerService(failures={1, 2})
+    storage = FakeStorageService()
+    fed = []
+    started = []
+
+    async def ranked():
+        for story in stories:
+            fed.append(story.story_id)
+            yield story
+
+    pipeline = StoryPipeline(
+        FakeCommentService(), crawler, storage,
+        comment_concurrency=2, crawl_concurrency=2, queue_size=1,
+        on_job_started=lambda job: started.append(job.story.story_id),
+    )
+    jobs = await pipeline.run(ranked(), target=3)
+
+    assert len(storage.saved) == 3
+    assert sum(job.success for job in jobs) == 3
+    assert [job.story.story_id for job in jobs] == fed == started
+    assert len(fed) < len(stories)
+    assert all(job.error and job.error.startswith("Not needed") for job in jobs if not job.success and job.story.story_id > 2)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_run_resets_target_state_between_runs():
+    """A second run on the same pipeline should not inherit the first run's target."""
+    storage = FakeStorageService()
+    pipeline = StoryPipeline(FakeCommentService(), FakeCrawlerService(), storage, queue_size=1)
+
+    first = await pipeline.run([_make_story(i) for i in range(1, 6)], target=1)
+    second = await pipeline.run([_make_story(i) for i in range(6, 9)])
+
+    assert sum(job.success for job in first) == 1
+    assert [job.success for job in second] == [True, True, True]
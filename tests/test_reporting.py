@@ -0,0 +1,80 @@
+"""Tests for CLI progress reporters."""
+
+import io
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from hn_daily.models import CrawlResult, Story
+from hn_daily.pipeline import StoryJob
+from hn_daily.reporting import NdjsonReporter, PlainReporter
+
+
+def _make_job() -> StoryJob:
+    """Create a finished pipeline job."""
+    story = Story(
+        object_id="12345",
+        title="Example Story",
+        url="https://example.com/article",
+        author="testuser",
+        points=100,
+        created_at=datetime(2025, 1, 19, 10, 0, 0, tzinfo=timezone.utc),
+        story_id=12345,
+        num_comments=5,
+    )
+    return StoryJob(
+        index=0,
+        story=story,
+        crawl_result=CrawlResult(
+            url=story.url,
+            title=story.title,
+            markdown_content="Content",
+            success=True,
+            tier="jina",
+        ),
+        filepath=Path("drafts/Example_Story_20250119.md"),
+        timings={"comments": 0.1, "crawl": 1.25, "save": 0.01},
+    )
+
+
+def _events(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_ndjson_reporter_emits_one_event_per_stage():
+    """Each story should produce selection, per-stage and completion events."""
+    stream = io.StringIO()
+    reporter = NdjsonReporter(stream)
+    job = _make_job()
+
+    reporter.day_started("2025-01-19", None)
+    reporter.story_selected("2025-01-19", job)
+    reporter.stage_done("2025-01-19", job, "comments", 0.1)
+    reporter.stage_done("2025-01-19", job, "crawl", 1.25)
+    reporter.stage_done("2025-01-19", job, "save", 0.01)
+    reporter.job_done("2025-01-19", job)
+
+    events = _events(stream)
+    assert [event["event"] for event in events] == [
+        "story_selected",
+        "comments_fetched",
+        "crawl_finished",
+        "file_written",
+        "story_done",
+    ]
+    assert events[0]["rank"] == 1
+    assert events[2]["tier"] == "jina"
+    assert events[3]["path"] == str(Path("drafts/Example_Story_20250119.md"))
+    assert events[4]["success"] is True
+    assert events[4]["timings"] == {"comments": 0.1, "crawl": 1.25, "save": 0.01}
+    assert all(event["story_id"] == 12345 for event in events)
+
+
+def test_plain_reporter_writes_one_line_per_story():
+    """The headless reporter should print a single plain line per finished story."""
+    stream = io.StringIO()
+    reporter = PlainReporter(stream)
+
+    reporter.job_done("2025-01-19", _make_job())
+
+    assert stream.getvalue() == f"2025-01-19: #1 12345 saved {Path('drafts/Example_Story_20250119.md')}\n"
@@ -1,13 +1,17 @@
 """Integration tests for StoryService with mocked Hacker News archive responses."""
 
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from hn_daily.services.story_service import ApiError, StoryService
+from hn_daily.services.http_client import HttpClient
+from hn_daily.services.story_service import ApiError, HNFrontMarkdownParser, HNFrontPageParser, StoryService
 from hn_daily.timezone import APP_TIMEZONE
 
 
@@ -205,7 +209,7 @@ async def test_parse_response_missing_fields_use_defaults(story_service):
 
 def test_build_url_uses_front_archive_day(story_service):
     """URL building should target the HN front archive day."""
-    url = story_service._build_url(datetime(2025, 1, 19, 20, 0, tzinfo=timezone.utc))
+    url = story_service.archive.build_url(datetime(2025, 1, 19, 20, 0, tzinfo=timezone.utc))
 
     assert url == "https://r.jina.ai/https://news.ycombinator.com/front?day=2025-01-20"
 
@@ -221,6 +225,366 @@ def test_resolve_target_date_defaults_to_yesterday_in_utc8(story_service):
 @pytest.mark.asyncio
 async def test_close_service(story_service):
     """Test closing the service."""
-    await story_service._get_client()
+    await story_service.http.get_client()
     await story_service.close()
-    assert story_service._client is None or story_service._client.is_closed
+    assert story_service.http._client is None
+
+
+@pytest.mark.asyncio
+async def test_close_service_keeps_shared_http_client_open():
+    """A service must not close an HTTP client it was handed."""
+    http = HttpClient()
+    service = StoryService(http=http)
+
+    client = await http.get_client()
+    await service.close()
+
+    assert client.is_closed is False
+    await http.close()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_slow_jina_is_hedged_with_direct_hacker_news_request():
+    """A direct HN request should win once Jina exceeds the hedge delay."""
+    service = StoryService(timeout=10.0, hedge_delay=0.05)
+
+    async def slow_jina(request):
+        await asyncio.sleep(5)
+        return Response(200, text=jina_archive_markdown())
+
+    respx.route(
+        method="GET",
+        url="https://r.jina.ai/https://news.ycombinator.com/front?day=2025-01-19",
+    ).mock(side_effect=slow_jina)
+    direct = respx.route(
+        method="GET",
+        url="https://news.ycombinator.com/front?day=2025-01-19",
+    ).mock(return_value=Response(200, text=hn_archive_html(hn_story_row(222, "Direct story", "https://example.com"))))
+
+    started = asyncio.get_running_loop().time()
+    stories = await service.get_top_stories_from_yesterday(date=datetime(2025, 1, 19))
+
+    assert asyncio.get_running_loop().time() - started < 1
+    assert direct.call_count == 1
+    assert [story.story_id for story in stories] == [222]
+    stats = service.fetch_stats["2025-01-19"]
+    assert stats.source == "direct"
+    assert set(stats.latencies) == {"direct"}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_jina_failure_falls_back_to_direct_request_immediately():
+    """A failed Jina request should not wait for the hedge delay."""
+    service = StoryService(timeout=10.0, hedge_delay=10.0)
+    respx.route(
+        method="GET",
+        url="https://r.jina.ai/https://news.ycombinator.com/front?day=2025-01-19",
+    ).mock(return_value=Response(429, text="Too Many Requests"))
+    respx.route(
+        method="GET",
+        url="https://news.ycombinator.com/front?day=2025-01-19",
+    ).mock(return_value=Response(200, text=hn_archive_html(hn_story_row(333, "Direct story", "https://example.com"))))
+
+    stories = await asyncio.wait_for(service.get_top_stories_from_yesterday(date=datetime(2025, 1, 19)), 1)
+
+    assert [story.story_id for story in stories] == [333]
+    stats = service.fetch_stats["2025-01-19"]
+    assert stats.source == "direct"
+    assert "429" in stats.errors["jina"]
+
+
+def _markdown_parser() -> HNFrontMarkdownParser:
+    return HNFrontMarkdownParser(datetime(2026, 6, 23, tzinfo=APP_TIMEZONE))
+
+
+def synthetic_jina_markdown(count: int) -> str:
+    """Jina Reader markdown for ``count`` stories, as if many archive pages were joined."""
+    lines = []
+    for rank in range(1, count + 1):
+        story_id = 40_000_000 + rank
+        lines.append(
+            f"{rank}.[](https://news.ycombinator.com/vote?id={story_id}&how=up&goto=front)"
+            f"[Story {rank} [pdf]](https://example.com/{rank}_(page)) "
+            f"([example.com](https://news.ycombinator.com/from?site=example.com)) "
+            f"{rank % 500} points by [user{rank}](https://news.ycombinator.com/user?id=user{rank})"
+            f"[3 hours ago](https://news.ycombinator.com/item?id={story_id}) | "
+            f"[{rank % 90} comments](https://news.ycombinator.com/item?id={story_id})"
+        )
+    return "\n".join(lines)
+
+
+def test_markdown_parser_tolerates_flagged_and_partial_entries():
+    """Entries without a vote link, points or comments should parse with defaults."""
+    markdown = (
+        "1.[Flagged story](https://example.com/flagged) "
+        "([example.com](https://news.ycombinator.com/from?site=example.com)) "
+        "12 points by [bob](https://news.ycombinator.com/user?id=bob)"
+        "[2 hours ago](https://news.ycombinator.com/item?id=101) | "
+        "[1 comment](https://news.ycombinator.com/item?id=101)\n"
+        "2.[](https://news.ycombinator.com/vote?id=102&how=up)[Ask HN: Anything?](item?id=102)\n"
+        "3.[](https://news.ycombinator.com/vote?id=103&how=up)[Broken entry\n"
+        "4.[](https://news.ycombinator.com/vote?id=104&how=up)[Still parsed](https://example.com/x) "
+        "7 points by [carol](https://news.ycombinator.com/user?id=carol) | "
+        "[discuss](https://news.ycombinator.com/item?id=104)\n"
+    )
+
+    stories = _markdown_parser().parse(markdown)
+
+    assert [story.story_id for story in stories] == [101, 102, 104]
+    assert (stories[0].points, stories[0].author, stories[0].num_comments) == (12, "bob", 1)
+    assert stories[1].url == "https://news.ycombinator.com/item?id=102"
+    assert (stories[1].points, stories[1].author) == (0, "unknown")
+    assert (stories[2].title, stories[2].points, stories[2].num_comments) == ("Still parsed", 7, 0)
+
+
+def test_markdown_parser_keeps_brackets_in_titles_and_parentheses_in_urls():
+    """Nested brackets and parentheses should stay inside the title and URL."""
+    stories = _markdown_parser().parse(synthetic_jina_markdown(1))
+
+    assert stories[0].title == "Story 1 [pdf]"
+    assert stories[0].url == "https://example.com/1_(page)"
+
+
+def test_markdown_parser_scales_linearly_on_large_and_malformed_input():
+    """10k stories and pathological bracket soup should both parse quickly."""
+    started = time.perf_counter()
+    stories = _markdown_parser().parse(synthetic_jina_markdown(10_000))
+    assert len(stories) == 10_000
+    assert stories[-1].num_comments == 10_000 % 90
+
+    malformed = "1.[](https://news.ycombinator.com/vote?id=1)" + "[" * 50_000 + "](" * 50_000 + " 9" * 50_000
+    assert _markdown_parser().parse(malformed) == []
+    assert time.perf_counter() - started < 5
+
+
+def test_front_page_parser_emits_rows_as_chunks_arrive():
+    """Each story should be available once its subtext row has been fed."""
+    html = hn_archive_html(
+        hn_story_row(1, "First", "https://example.com/1")
+        + hn_story_row(2, "Second", "https://example.com/2", points=50)
+    )
+    split_at = html.index('<tr class="athing" id="2"')
+    parser = HNFrontPageParser(datetime(2025, 1, 19, tzinfo=APP_TIMEZONE))
+
+    for offset in range(0, split_at, 7):
+        parser.feed(html[offset:min(offset + 7, split_at)])
+    first = parser.take_stories()
+    parser.feed(html[split_at:])
+    parser.close()
+
+    assert [story.story_id for story in first] == [1]
+    assert [story.story_id for story in parser.take_stories()] == [2]
+    assert parser.stories[1].points == 50
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_iter_stories_streaming_yields_direct_page_in_page_order(story_service):
+    """Streaming should read the direct archive page and keep HN's row order."""
+    html = hn_archive_html(
+        hn_story_row(1, "Low points first", "https://example.com/1", points=5)
+        + hn_story_row(2, "High points second", "https://example.com/2", points=500)
+    )
+    route = respx.route(
+        method="GET",
+        url="https://news.ycombinator.com/front?day=2025-01-19",
+    ).mock(return_value=Response(200, text=html))
+
+    stories = [story async for story in story_service.iter_stories_streaming(datetime(2025, 1, 19))]
+
+    assert route.call_count == 1
+    assert [story.story_id for story in stories] == [1, 2]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_iter_stories_streaming_falls_back_to_jina_when_direct_fails(story_service):
+    """A failed direct stream should fall back to the ranked Jina fetch."""
+    respx.route(
+        method="GET",
+        url="https://news.ycombinator.com/front?day=2026-06-23",
+    ).mock(return_value=Response(503, text="Unavailable"))
+    respx.route(
+        method="GET",
+        url="https://r.jina.ai/https://news.ycombinator.com/front?day=2026-06-23",
+    ).mock(return_value=Response(200, text=jina_archive_markdown()))
+
+    stories = [story async for story in story_service.iter_stories_streaming(datetime(2026, 6, 23))]
+
+    assert [story.story_id for story in stories] == [48645173, 48639240, 48645437, 48643489]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_iter_stories_streaming_filters_and_continues_with_later_pages():
+    """Excluded rows should be dropped and later pages follow the streamed first page."""
+    service = StoryService(timeout=10.0, max_pages=2)
+    respx.route(method="GET", url="https://news.ycombinator.com/front?day=2025-01-19").mock(
+        return_value=Response(200, text=hn_archive_html(
+            "".join(hn_story_row(i, f"S{i}", f"https://e.com/{i}", points=i) for i in (1, 2, 3))
+        ))
+    )
+    _mock_archive_page(2, hn_story_row(3, "S3 again", "https://e.com/3", points=3) + hn_story_row(10, "S10", "https://e.com/10", points=50))
+
+    stories = [
+        story async for story in service.iter_stories_streaming(
+            datetime(2025, 1, 19), exclude=lambda story: story.story_id == 2
+        )
+    ]
+
+    assert [story.story_id for story in stories] == [1, 3, 10]
+    assert service.sources_used["2025-01-19"] == "archive"
+    await service.close()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_iter_stories_streaming_keeps_stories_when_stream_breaks(story_service):
+    """A stream cut off after some rows should end the day instead of raising."""
+    rows = hn_archive_html("".join(hn_story_row(i, f"S{i}", f"https://e.com/{i}", points=i) for i in (1, 2, 3)))
+
+    class BrokenStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield rows[:rows.index('id="3"')].encode()
+            raise httpx.ReadError("connection reset")
+
+    respx.route(method="GET", url="https://news.ycombinator.com/front?day=2025-01-19").mock(
+        return_value=Response(200, stream=BrokenStream())
+    )
+
+    stories = [story async for story in story_service.iter_stories_streaming(datetime(2025, 1, 19))]
+
+    assert [story.story_id for story in stories] == [1, 2]
+
+
+def _mock_archive_page(page: int, rows: str, status: int = 200):
+    suffix = "" if page == 1 else f"&p={page}"
+    return respx.route(
+        method="GET",
+        url=f"https://r.jina.ai/https://news.ycombinator.com/front?day=2025-01-19{suffix}",
+    ).mock(return_value=Response(status, text=hn_archive_html(rows)))
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_extra_pages_are_fetched_only_when_page_one_is_short():
+    """A limit page 1 can fill should not touch later pages."""
+    service = StoryService(timeout=10.0, max_pages=3)
+    page_one = _mock_archive_page(1, "".join(hn_story_row(i, f"S{i}", f"https://e.com/{i}", points=i) for i in range(1, 6)))
+    page_two = _mock_archive_page(2, hn_story_row(99, "Later", "https://e.com/99", points=999))
+
+    stories = await service.get_top_stories_from_yesterday(limit=3, date=datetime(2025, 1, 19))
+
+    assert page_one.call_count == 1
+    assert page_two.call_count == 0
+    assert [story.story_id for story in stories] == [5, 4, 3]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_excluded_stories_pull_in_more_pages_merged_and_deduped():
+    """History-filtered candidates should be replaced from later pages, ranked together."""
+    service = StoryService(timeout=10.0, max_pages=3)
+    _mock_archive_page(1, "".join(hn_story_row(i, f"S{i}", f"https://e.com/{i}", points=100 + i) for i in range(1, 5)))
+    _mock_archive_page(2, hn_story_row(4, "S4 again", "https://e.com/4", points=104) + hn_story_row(20, "S20", "https://e.com/20", points=500))
+    _mock_archive_page(3, hn_story_row(30, "S30", "https://e.com/30", points=1), status=500)
+
+    stories = await service.get_top_stories_from_yesterday(
+        limit=4,
+        date=datetime(2025, 1, 19),
+        exclude=lambda story: story.story_id in {1, 2},
+    )
+
+    assert [story.story_id for story in stories] == [20, 4, 3]
+    assert "2025-01-19&p=2" in service.fetch_stats
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_ranked_candidates_stream_one_ranked_page_ahead_of_the_consumer():
+    """Each page should be ranked on its own and no page fetched past the next one."""
+    service = StoryService(timeout=10.0, max_pages=4)
+    _mock_archive_page(1, "".join(hn_story_row(i, f"S{i}", f"https://e.com/{i}", points=i) for i in (1, 3, 2)))
+    _mock_archive_page(2, hn_story_row(3, "S3 again", "https://e.com/3", points=3) + hn_story_row(10, "S10", "https://e.com/10", points=50))
+    _mock_archive_page(3, hn_story_row(20, "S20", "https://e.com/20", points=1))
+    page_four = _mock_archive_page(4, hn_story_row(30, "S30", "https://e.com/30", points=1))
+
+    candidates = service.iter_ranked_candidates(datetime(2025, 1, 19), exclude=lambda story: story.story_id == 2)
+    taken = [(await anext(candidates)).story_id for _ in range(3)]
+    await candidates.aclose()
+
+    assert taken == [3, 1, 10]
+    assert page_four.call_count == 0
+    assert service.sources_used["2025-01-19"] == "archive"
+    await service.close()
+
+
+def algolia_hit(story_id: int, points: int, created_at_i: int = 1737302400, **fields) -> dict:
+    """Minimal Algolia search hit for a story."""
+    return {
+        "objectID": str(story_id),
+        "story_id": story_id,
+        "title": f"Story {story_id}",
+        "url": f"https://example.com/{story_id}",
+        "author": "alice",
+        "points": points,
+        "num_comments": 3,
+        "created_at_i": created_at_i,
+        **fields,
+    }
+
+
+def test_algolia_source_filters_on_the_utc8_day(story_service):
+    """The search URL should cover exactly one UTC+8 calendar day."""
+    url = story_service.sources["algolia"].build_url(datetime(2025, 1, 19, tzinfo=APP_TIMEZONE))
+
+    # 2025-01-19 00:00 UTC+8 is 2025-01-18 16:00 UTC
+    assert "numericFilters=created_at_i%3E%3D1737216000%2Ccreated_at_i%3C1737302400" in url
+    assert "tags=story" in url and "page=0" in url
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_algolia_source_returns_real_timestamps_and_ranks_by_points():
+    """Algolia hits should become Stories with exact creation times."""
+    service = StoryService(timeout=10.0, source="algolia")
+    route = respx.get(url__startswith="https://hn.algolia.com/api/v1/search").mock(
+        return_value=Response(200, json={"hits": [
+            algolia_hit(1, 10),
+            algolia_hit(2, 300, url=None, title="Ask HN: Something?"),
+            {"objectID": "not-a-number"},
+        ]})
+    )
+
+    stories = await service.get_top_stories_from_yesterday(limit=5, date=datetime(2025, 1, 19))
+
+    assert route.call_count == 1
+    assert [story.story_id for story in stories] == [2, 1]
+    assert stories[0].url == "https://news.ycombinator.com/item?id=2"
+    assert stories[0].created_at == datetime(2025, 1, 19, 16, 0, tzinfo=timezone.utc)
+    assert service.sources_used["2025-01-19"] == "algolia"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_failed_archive_falls_back_to_algolia():
+    """When the archive cannot be fetched, the next source should be used."""
+    service = StoryService(timeout=10.0, hedge_delay=None)
+    respx.get(url__startswith="https://r.jina.ai/").mock(return_value=Response(503))
+    respx.get(url__startswith="https://news.ycombinator.com/front").mock(return_value=Response(503))
+    respx.get(url__startswith="https://hn.algolia.com/api/v1/search").mock(
+        return_value=Response(200, json={"hits": [algolia_hit(7, 42)]})
+    )
+
+    stories = await service.get_top_stories_from_yesterday(date=datetime(2025, 1, 19))
+
+    assert [story.story_id for story in stories] == [7]
+    assert service.sources_used["2025-01-19"] == "algolia"
+
+
+def test_unknown_story_source_is_rejected():
+    """Selecting a source that does not exist should fail early."""
+    with pytest.raises(ValueError):
+        StoryService(source="nope")